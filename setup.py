@@ -97,6 +97,10 @@ setuptools.setup(
         "ittools",
     ],
     extras_require={
+        # used to read and write parquet files
+        'parquet': [
+            'pyarrow',
+        ],
         'dev': [
             # used for building the documentation
             'colorspacious',
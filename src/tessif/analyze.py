@@ -15,6 +15,7 @@ import logging
 import math
 import os
 import pickle
+import threading
 import time
 import tracemalloc
 
@@ -23,6 +24,7 @@ import numpy as np
 import pandas as pd
 
 import tessif.examples.data.tsf.py_hard as coded_examples
+import tessif.frused.configurations as configurations
 import tessif.frused.defaults as defaults
 import tessif.parse as parse
 import tessif.simulate as simulate
@@ -30,9 +32,10 @@ import tessif.transform.mapping2es.tsf as tsf
 import tessif.transform.nxgrph as nxt
 import tessif.visualize.compare as vis_compare
 import tessif.visualize.nxgrph as nxv
-from tessif.frused.namedtuples import MemoryTime, MemoryTimeConstraints, \
-    SimulationProcessStepResults
-from tessif.frused.paths import example_dir
+import tessif.write.log as log
+from tessif.frused.namedtuples import MemoryProfile, MemoryTime, \
+    MemoryTimeConstraints, SimulationProcessStepResults
+from tessif.frused.paths import example_dir, root_dir
 from tessif.visualize import component_loads
 
 logger = logging.getLogger(__name__)
@@ -985,7 +988,7 @@ def stop_time(path, parser, model, measurement="CPU", timeframe='primary',
     if measurement not in time_measurement_tool:
         meas = measurement
         msg1 = f"Value for 'measurement' attribute: {meas} not recognized\n"
-        msg2 = f"Use on of the following: {list(time_measurement_tool.keys())}"
+        msg2 = f"Use one of the following: {list(time_measurement_tool.keys())}"
         raise TypeError(msg1 + msg2)
 
     # Figure out model used
@@ -1066,7 +1069,8 @@ def stop_time(path, parser, model, measurement="CPU", timeframe='primary',
 
 
 def trace_memory(path, parser, model, timeframe='primary', hook=None,
-                 only_total=False, trans_ops=None):
+                 only_total=False, trans_ops=None, measurement='tracemalloc',
+                 interval=0.005):
     """
     Trace allocated memory.
 
@@ -1106,91 +1110,455 @@ def trace_memory(path, parser, model, timeframe='primary', hook=None,
                 'forced_links': ['Transformator_1', 'Transformator_2']}
             }
 
+    measurement: str, default="tracemalloc"
+        String specifying which memory measurement to use. Supported are:
+
+           - ``"tracemalloc"`` for measuring the peak of the memory blocks
+             allocated by the python interpreter utilizing :mod:`tracemalloc`.
+             Memory allocated natively by solvers or numerical libraries
+             is not accounted for.
+
+           - ``"RSS"`` for measuring the peak increase of the process'
+             resident set size, sampled in a background thread from
+             ``/proc/self/status``.
+
+           - ``"USS"`` for measuring the peak increase of the process'
+             unique set size (memory private to the process), sampled in a
+             background thread from ``/proc/self/smaps_rollup``.
+
+        The latter two require a ``/proc`` filesystem (i.e. Linux) but
+        capture native allocations without slowing down the measured steps.
+
+    interval: float, default=0.005
+        Sampling interval in seconds used by the ``"RSS"`` and ``"USS"``
+        :paramref:`~trace_memory.measurement`.
+
     Return
     ------
     results: dict
-        Dictionary containing memory results in KiB keyed by the corresponding
-        simulation steps that were investigated:
+        Dictionary containing memory results in bytes keyed by the
+        corresponding simulation steps that were investigated:
 
             - ``reading``
             - ``parsing``
             - ``transformation``
             - ``simulation``
             - ``post_processing``
-    """
 
-    used_model = None
-    for internal_name, spellings in defaults.registered_models.items():
-        if model in spellings:
-            used_model = internal_name
-            break
+    See also
+    --------
+    :func:`profile_memory` for attributing each step's allocations to the
+    tessif modules responsible.
+    """
+    measurement = _match_memory_measurement(measurement)
+    process = _SimulationProcess(
+        path=path, parser=parser, model=model, timeframe=timeframe,
+        hook=hook, trans_ops=trans_ops)
 
     memory_usage_results = dict()
+    for step in process.steps:
+        memory_usage_results[step] = _trace_process_step(
+            getattr(process, step), measurement=measurement,
+            interval=interval).peak
 
-    # 1) Read and parse in the tessif energy system data
-    tracemalloc.start()
-    esm = parser(path, timeframe=timeframe)
-    reading_memory = tracemalloc.get_traced_memory()  # memory in KiB
-    tracemalloc.stop()
-    memory_usage_results['reading'] = reading_memory[1]
+    # calculate total memory usage
+    memory_usage_results['result'] = sum(
+        memory_usage_results[step] for step in process.steps)
 
-    # 2) Create the tessif energy system
-    tracemalloc.start()
-    es = tsf.transform(esm)
-    parsing_memory = tracemalloc.get_traced_memory()  # memory in KiB
-    tracemalloc.stop()
-    memory_usage_results['parsing'] = parsing_memory[1]
+    if only_total is True:
+        memory_usage_results = memory_usage_results["result"]
 
-    # 3) Transform the energy system into the requested model
-    tracemalloc.start()
-    requested_model = importlib.import_module('.'.join([
-        'tessif.transform.es2es', used_model]))
+    # Store the resultier into a file.
+    process.resultier.dump(
+        directory=os.path.dirname(path), filename='resultier.tsf')
 
-    if hook:
-        es = hook(es)
+    return memory_usage_results
 
-    transform_ops = collections.defaultdict(dict)
-    if trans_ops:
-        for key, value in trans_ops.items():
-            transform_ops[key] = value
 
-    model_es = requested_model.transform(es, **transform_ops[used_model])
+def profile_memory(path, parser, model, timeframe='primary', hook=None,
+                   trans_ops=None, measurement='USS', top=10, nframe=25,
+                   interval=0.005):
+    """
+    Profile memory usage and allocations of each simulation process step.
 
-    transformation_memory = tracemalloc.get_traced_memory()  # memory in KiB
-    tracemalloc.stop()
-    memory_usage_results['transformation'] = transformation_memory[1]
+    Combines the peak memory measurements of :func:`trace_memory` with
+    :mod:`tracemalloc` snapshots taken at the end of each step. The
+    snapshot's allocations are attributed to the innermost tessif module
+    found on the allocation's traceback, so the transformation or result
+    parsing step responsible for a memory increase can be identified.
 
-    # 4) Execute simulation
-    tracemalloc.start()
-    simulation_utility = getattr(simulate, '_'.join([used_model, 'from_es']))
-    optimized_es = simulation_utility(model_es)
-    simulation_memory = tracemalloc.get_traced_memory()  # memory in KiB
-    tracemalloc.stop()
-    memory_usage_results['simulation'] = simulation_memory[1]
+    Parameters
+    ----------
+    path: str
+        String representing the path the energy system data resides in.
+    parser: :class:`~collections.abc.Callable`
+        Functional used to read in and parse the energy system data.
+        Usually one of the module functions found in :mod:`tessif.parse`.
+    model: str
+        String specifying one of the
+        :attr:`~tessif.frused.defaults.registered_models` representing the
+        :ref:`energy system simulation model <SupportedModels>` investigated.
+    timeframe: str, default='primary'
+        String specifying which of the (potentially multiple) timeframes passed
+        is to be used.
+    hook: dict, None, default=None
+        Dictionary keying :mod:`~tessif.frused.hooks` callables by its
+        :attr:`registered name
+        <tessif.frused.defaults.registered_models>`.
+    trans_ops: dict, None, default=None
+        Dictionary keying transformation options
+        of a model by its :attr:`registered name
+        <tessif.frused.defaults.registered_models>`. See
+        :paramref:`trace_memory.trans_ops` for an example.
+    measurement: str, default="USS"
+        String specifying which memory measurement is used for the peak
+        values. See :paramref:`trace_memory.measurement` for the supported
+        values.
+    top: int, None, default=10
+        Number of tessif modules listed per step, sorted by the size of the
+        memory they allocated. Set to ``None`` or ``0`` to skip taking
+        :mod:`tracemalloc` snapshots (and their overhead) altogether.
+    nframe: int, default=25
+        Number of frames stored per allocation traceback. Higher values
+        allow attributing allocations made deep inside third party libraries
+        at the cost of a higher tracing overhead.
+    interval: float, default=0.005
+        Sampling interval in seconds used by the ``"RSS"`` and ``"USS"``
+        :paramref:`~profile_memory.measurement`.
 
-    # 5) Create result utility
-    tracemalloc.start()
-    requested_model_result_parsing_module = importlib.import_module('.'.join([
-        'tessif.transform.es2mapping', used_model]))
-    resultier = requested_model_result_parsing_module.AllResultier(
-        optimized_es)
-    post_processing_memory = tracemalloc.get_traced_memory()  # memory in KiB
-    tracemalloc.stop()
-    memory_usage_results['post_processing'] = post_processing_memory[1]
+    Return
+    ------
+    results: dict
+        Dictionary of :attr:`~tessif.frused.namedtuples.MemoryProfile`
+        namedtuples keyed by the simulation steps investigated (``reading``,
+        ``parsing``, ``transformation``, ``simulation``,
+        ``post_processing``). The ``allocations`` are a
+        :class:`pandas.Series` of allocated bytes indexed by tessif module
+        name (or ``None`` if :paramref:`~profile_memory.top` is ``None``).
+        Allocations not traceable to a tessif module are summed up as
+        ``'other'``.
+    """
+    measurement = _match_memory_measurement(measurement)
+    process = _SimulationProcess(
+        path=path, parser=parser, model=model, timeframe=timeframe,
+        hook=hook, trans_ops=trans_ops)
 
-    # 6) calculate total memory usage
-    memory_usage_results['result'] = reading_memory[1] + parsing_memory[1] + \
-                                     transformation_memory[1] + \
-                                     simulation_memory[1] + \
-                                     post_processing_memory[1]  # memory in KiB
+    memory_profile_results = dict()
+    for step in process.steps:
+        memory_profile_results[step] = _trace_process_step(
+            getattr(process, step), measurement=measurement,
+            interval=interval, top=top, nframe=nframe)
 
-    if only_total is True:
-        memory_usage_results = memory_usage_results["result"]
+    return memory_profile_results
 
-    # Store the resultier into a file.
-    resultier.dump(directory=os.path.dirname(path), filename='resultier.tsf')
 
-    return memory_usage_results
+def profile_time(path, parser, model, directory=None, timeframe='primary',
+                 hook=None, trans_ops=None):
+    """
+    Profile each simulation process step using :mod:`cProfile`.
+
+    Other than :func:`stop_time` this reveals which functions (e.g. which
+    ``_map_*`` method of a :mod:`~tessif.transform.es2mapping` resultier)
+    are responsible for the time spent during each step.
+
+    Parameters
+    ----------
+    path: str
+        String representing the path the energy system data resides in.
+    parser: :class:`~collections.abc.Callable`
+        Functional used to read in and parse the energy system data.
+        Usually one of the module functions found in :mod:`tessif.parse`.
+    model: str
+        String specifying one of the
+        :attr:`~tessif.frused.defaults.registered_models` representing the
+        :ref:`energy system simulation model <SupportedModels>` investigated.
+    directory: str, None, default=None
+        Directory each step's profile is dumped to as pstats and collapsed
+        stack file using :func:`tessif.write.log.dump_profile`. Files are
+        labeled ``{model}.{step}``. If ``None``,
+        :attr:`tessif.frused.configurations.profiling_directory` is used.
+        Profiles are not dumped if both are ``None``.
+    timeframe: str, default='primary'
+        String specifying which of the (potentially multiple) timeframes passed
+        is to be used.
+    hook: dict, None, default=None
+        Dictionary keying :mod:`~tessif.frused.hooks` callables by its
+        :attr:`registered name
+        <tessif.frused.defaults.registered_models>`.
+    trans_ops: dict, None, default=None
+        Dictionary keying transformation options
+        of a model by its :attr:`registered name
+        <tessif.frused.defaults.registered_models>`. See
+        :paramref:`stop_time.trans_ops` for an example.
+
+    Return
+    ------
+    results: dict
+        Dictionary of :class:`pstats.Stats` keyed by the simulation steps
+        investigated (``reading``, ``parsing``, ``transformation``,
+        ``simulation``, ``post_processing``).
+
+    Examples
+    --------
+    Print the 10 functions post processing spent the most time on::
+
+        profiles = profile_time(path, parser, 'oemof')
+        profiles['post_processing'].sort_stats('tottime').print_stats(10)
+    """
+    if directory is None:
+        directory = configurations.profiling_directory
+
+    process = _SimulationProcess(
+        path=path, parser=parser, model=model, timeframe=timeframe,
+        hook=hook, trans_ops=trans_ops)
+
+    profiling_results = dict()
+    for step in process.steps:
+        _, profiling_results[step] = log.run_profiled(
+            getattr(process, step), directory=directory,
+            label='.'.join([process.model, step]))
+
+    return profiling_results
+
+
+_memory_measurement_tools = {
+    'tracemalloc': 'tracemalloc',
+    'python': 'tracemalloc',
+    'RSS': 'RSS',
+    'rss': 'RSS',
+    'USS': 'USS',
+    'uss': 'USS',
+}
+
+
+def _match_memory_measurement(measurement):
+    """Map the requested memory measurement to its internal name."""
+    if measurement not in _memory_measurement_tools:
+        meas = measurement
+        msg1 = f"Value for 'measurement' attribute: {meas} not recognized\n"
+        msg2 = "Use one of the following: {}".format(
+            list(_memory_measurement_tools.keys()))
+        raise TypeError(msg1 + msg2)
+
+    return _memory_measurement_tools[measurement]
+
+
+class _SimulationProcess:
+    """
+    Simulation process of a single model split into its steps.
+
+    Each step is a method operating on the results of the previous ones, so
+    the steps can be measured individually by calling them in the order
+    given by :attr:`steps`.
+    """
+
+    steps = (
+        'reading', 'parsing', 'transformation', 'simulation',
+        'post_processing')
+
+    def __init__(self, path, parser, model, timeframe='primary', hook=None,
+                 trans_ops=None):
+        self._path = path
+        self._parser = parser
+        self._timeframe = timeframe
+        self._hook = hook
+
+        # Figure out model used
+        self.model = None
+        for internal_name, spellings in defaults.registered_models.items():
+            if model in spellings:
+                self.model = internal_name
+                break
+
+        self._transform_ops = collections.defaultdict(dict)
+        if trans_ops:
+            for key, value in trans_ops.items():
+                self._transform_ops[key] = value
+
+    def reading(self):
+        """Read and parse in the tessif energy system data."""
+        self.esm = self._parser(self._path, timeframe=self._timeframe)
+
+    def parsing(self):
+        """Create the tessif energy system."""
+        self.es = tsf.transform(self.esm)
+
+    def transformation(self):
+        """Transform the energy system into the requested model."""
+        requested_model = importlib.import_module('.'.join([
+            'tessif.transform.es2es', self.model]))
+
+        if self._hook:
+            self.es = self._hook(self.es)
+
+        self.model_es = requested_model.transform(
+            self.es, **self._transform_ops[self.model])
+
+    def simulation(self):
+        """Execute the simulation."""
+        simulation_utility = getattr(
+            simulate, '_'.join([self.model, 'from_es']))
+        self.optimized_es = simulation_utility(self.model_es)
+
+    def post_processing(self):
+        """Create the result utility."""
+        requested_model_result_parsing_module = importlib.import_module(
+            '.'.join(['tessif.transform.es2mapping', self.model]))
+        self.resultier = requested_model_result_parsing_module.AllResultier(
+            self.optimized_es)
+
+
+def _trace_process_step(step, measurement='tracemalloc', interval=0.005,
+                        top=None, nframe=1):
+    """
+    Execute a simulation process step while tracing its memory usage.
+
+    Return a :attr:`~tessif.frused.namedtuples.MemoryProfile` of the step's
+    peak memory usage in bytes and, if requested via ``top``, its allocations
+    attributed to tessif modules.
+    """
+    sampler = None
+    if measurement in ('RSS', 'USS'):
+        sampler = _ProcessMemorySampler(
+            measurement=measurement, interval=interval)
+
+    if measurement == 'tracemalloc' or top:
+        tracemalloc.start(nframe)
+
+    if sampler is not None:
+        sampler.start()
+
+    try:
+        step()
+    finally:
+        if sampler is not None:
+            sampler.stop()
+
+        snapshot = None
+        if tracemalloc.is_tracing():
+            traced_peak = tracemalloc.get_traced_memory()[1]
+            if top:
+                snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+
+    if sampler is not None:
+        peak = sampler.peak - sampler.baseline
+    else:
+        peak = traced_peak
+
+    allocations = None
+    if snapshot is not None:
+        allocations = _attribute_allocations(snapshot, top=top)
+
+    return MemoryProfile(peak, allocations)
+
+
+def _attribute_allocations(snapshot, top=10):
+    """
+    Attribute the allocations of a :class:`tracemalloc.Snapshot` to the
+    innermost tessif module of each allocation's traceback.
+
+    Return a :class:`pandas.Series` of the ``top`` tessif modules sorted by
+    allocated bytes. Allocations not traceable to tessif are summed up as
+    ``'other'``.
+    """
+    package_dir = os.path.dirname(root_dir)
+
+    # cache the module of each file, since tracebacks share most frames
+    modules = dict()
+    allocations = collections.defaultdict(int)
+    for statistic in snapshot.statistics('traceback'):
+        module = 'other'
+        # tracebacks are sorted from the oldest frame to the most recent
+        for frame in reversed(statistic.traceback):
+            if frame.filename not in modules:
+                # skip the profiling frames and the logging wrappers
+                if (frame.filename.startswith(root_dir)
+                        and frame.filename not in (__file__, log.__file__)):
+                    modules[frame.filename] = '.'.join(os.path.splitext(
+                        os.path.relpath(frame.filename, package_dir)
+                    )[0].split(os.path.sep))
+                else:
+                    modules[frame.filename] = None
+
+            if modules[frame.filename] is not None:
+                module = modules[frame.filename]
+                break
+
+        allocations[module] += statistic.size
+
+    allocations = pd.Series(allocations, name='allocated', dtype='int64')
+    allocations = allocations.sort_values(ascending=False)
+
+    return pd.concat([
+        allocations.drop('other', errors='ignore').head(top),
+        allocations.loc[allocations.index == 'other'],
+    ])
+
+
+class _ProcessMemorySampler(threading.Thread):
+    """
+    Sample the process' memory usage in a background thread.
+
+    Reads the resident (``'RSS'``) or unique (``'USS'``) set size from the
+    ``/proc`` filesystem every ``interval`` seconds and keeps track of its
+    peak. Contrary to :mod:`tracemalloc` this accounts for memory allocated
+    outside the python interpreter (e.g. by solvers) and leaves the sampled
+    code running at full speed.
+    """
+
+    def __init__(self, measurement='RSS', interval=0.005):
+        super().__init__(daemon=True)
+
+        if not os.path.exists('/proc/self/status'):
+            raise OSError(
+                f"Sampling the '{measurement}' requires a /proc filesystem")
+
+        self._read = {
+            'RSS': _read_resident_set_size,
+            'USS': _read_unique_set_size,
+        }[measurement]
+        self._interval = interval
+        self._stopped = threading.Event()
+
+        self.baseline = self._read()
+        self.peak = self.baseline
+
+    def run(self):
+        while not self._stopped.wait(self._interval):
+            self.peak = max(self.peak, self._read())
+
+    def stop(self):
+        """Stop sampling and account for the final memory usage."""
+        self._stopped.set()
+        self.join()
+        self.peak = max(self.peak, self._read())
+
+
+def _read_resident_set_size():
+    """Read the current process' resident set size in bytes."""
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) * 1024
+
+    return 0
+
+
+def _read_unique_set_size():
+    """Read the current process' unique set size in bytes."""
+    fname = '/proc/self/smaps_rollup'
+    if not os.path.exists(fname):
+        # kernels prior to 4.14 only provide the per mapping summary
+        fname = '/proc/self/smaps'
+
+    uss = 0
+    with open(fname) as smaps:
+        for line in smaps:
+            if line.startswith(('Private_Clean:', 'Private_Dirty:')):
+                uss += int(line.split()[1]) * 1024
+
+    return uss
 
 
 class Comparatier:
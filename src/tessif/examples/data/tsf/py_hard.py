@@ -9,6 +9,7 @@ examples and full-fledged use case wrappers for common scenarios.
 """
 # 1. Import the needed packages:
 from datetime import datetime
+import functools
 import os
 import random
 
@@ -1975,6 +1976,56 @@ def create_zero_costs_es(directory=None, filename=None):
     return explicit_es
 
 
+@functools.lru_cache(maxsize=None)
+def _read_load_profiles(filename):
+    """
+    Parse one of tessif's load profile csv files once per session.
+
+    Returns a mapping of the file's column names to read-only arrays of its
+    values. Key ``None`` maps to all values flattened in row major order.
+    """
+    csv_data = pd.read_csv(os.path.join(
+        example_dir, 'data', 'tsf', 'load_profiles', filename),
+        index_col=0, sep=';')
+
+    profiles = {column: csv_data[column].values.flatten()
+                for column in csv_data.columns}
+    profiles[None] = csv_data.values.flatten()
+
+    for profile in profiles.values():
+        profile.flags.writeable = False
+
+    return profiles
+
+
+def _load_profile(filename, column=None, periods=None):
+    """
+    Return the first :paramref:`~_load_profile.periods` values of a load
+    profile column as read-only view on the memoized csv data.
+
+    Parameters
+    ----------
+    filename: str
+        Name of the csv file located in tessif's
+        ``examples/data/tsf/load_profiles`` folder.
+    column: str, None, default=None
+        Name of the column to return. If ``None`` all values are returned
+        flattened in row major order.
+    periods: int, None, default=None
+        Number of values to return. If ``None`` all values are returned.
+
+    Examples
+    --------
+    >>> from tessif.examples.data.tsf.py_hard import _load_profile
+    >>> pv = _load_profile('Renewable_Energy.csv', 'pv_load', periods=3)
+    >>> print(len(pv))
+    3
+    >>> pv.base is _load_profile('Renewable_Energy.csv', 'pv_load').base
+    True
+    """
+    return _read_load_profiles(filename)[column][0:periods]
+
+
 def _create_minimal_es_unit(n, timeframe=None, seed=None):
     """
     Create a minimal self simular energy system unit.
@@ -2233,31 +2284,29 @@ def _create_component_es_unit(n, timeframe, expansion_problem=False):
     periods = len(timeframe)
 
     # Variables for timeseries of fluctuate wind, solar and demand
-    csv_data = pd.read_csv(os.path.join(
-        example_dir, 'data', 'tsf', 'load_profiles',
-        'component_scenario_profiles.csv'), index_col=0, sep=';')
+    profiles = 'component_scenario_profiles.csv'
 
     # solar:
-    pv = csv_data['pv'].values.flatten()[0:periods]
+    pv = _load_profile(profiles, 'pv', periods)
     # scale relative values with the installed pv power
     pv = pv * 1100
 
     # wind onshore:
-    wind_onshore = csv_data['wind_on'].values.flatten()[0:periods]
+    wind_onshore = _load_profile(profiles, 'wind_on', periods)
     # scale relative values with installed onshore power
     wind_onshore = wind_onshore * 1100
 
     # wind offshore:
-    wind_offshore = csv_data['wind_off'].values.flatten()[0:periods]
+    wind_offshore = _load_profile(profiles, 'wind_off', periods)
     # scale relative values with installed offshore power
     wind_offshore = wind_offshore * 150
 
     # electricity demand:
-    el_demand = csv_data['el_demand'].values.flatten()[0:periods]
+    el_demand = _load_profile(profiles, 'el_demand', periods)
     max_el = np.max(el_demand)
 
     # heat demand:
-    th_demand = csv_data['th_demand'].values.flatten()[0:periods]
+    th_demand = _load_profile(profiles, 'th_demand', periods)
     max_th = np.max(th_demand)
 
     # Creating the individual energy system components:
@@ -2929,56 +2978,40 @@ def _create_grid_es_unit(n, timeframe, transformer_efficiency=0.93,
     periods = len(timeframe)
 
     # Parse csv files with the demand and renewables load data:
-    d = os.path.join(example_dir, 'data', 'tsf', 'load_profiles')
-
     # solar:
-    pv = pd.read_csv(os.path.join(d, 'Renewable_Energy.csv'),
-                     index_col=0, sep=';')
-    pv = pv['pv_load'].values.flatten()[0:periods]
+    pv = _load_profile('Renewable_Energy.csv', 'pv_load', periods)
     max_pv = np.max(pv)
 
     # wind onshore:
-    w_on = pd.read_csv(os.path.join(
-        d, 'Renewable_Energy.csv'), index_col=0, sep=';')
-    w_on = w_on['won_load'].values.flatten()[0:periods]
+    w_on = _load_profile('Renewable_Energy.csv', 'won_load', periods)
     max_w_on = np.max(w_on)
 
     # wind offshore:
-    w_off = pd.read_csv(os.path.join(
-        d, 'Renewable_Energy.csv'), index_col=0, sep=';')
-    w_off = w_off['woff_load'].values.flatten()[0:periods]
+    w_off = _load_profile('Renewable_Energy.csv', 'woff_load', periods)
     max_w_off = np.max(w_off)
 
     # solar thermal:
-    s_t = pd.read_csv(os.path.join(
-        d, 'Renewable_Energy.csv'), index_col=0, sep=';')
-    s_t = s_t['st_load'].values.flatten()[0:periods]
+    s_t = _load_profile('Renewable_Energy.csv', 'st_load', periods)
     max_s_t = np.max(s_t)
 
     # household demand
-    h_d = pd.read_csv(os.path.join(d, 'Loads.csv'), index_col=0, sep=';')
-    h_d = h_d['household_demand'].values.flatten()[0:periods]
+    h_d = _load_profile('Loads.csv', 'household_demand', periods)
     max_h_d = np.max(h_d)
 
     # industrial demand
-    i_d = pd.read_csv(os.path.join(d, 'Loads.csv'), index_col=0, sep=';')
-    i_d = i_d['industrial_demand'].values.flatten()[0:periods]
+    i_d = _load_profile('Loads.csv', 'industrial_demand', periods)
     max_i_d = np.max(i_d)
 
     # commercial demand
-    c_d = pd.read_csv(os.path.join(d, 'Loads.csv'), index_col=0, sep=';')
-    c_d = c_d['commercial_demand'].values.flatten()[0:periods]
+    c_d = _load_profile('Loads.csv', 'commercial_demand', periods)
     max_c_d = np.max(c_d)
 
     # district heating demand
-    dh_d = pd.read_csv(os.path.join(d, 'Loads.csv'), index_col=0, sep=';')
-    dh_d = dh_d['heat_demand'].values.flatten()[0:periods]
+    dh_d = _load_profile('Loads.csv', 'heat_demand', periods)
     max_dh_d = np.max(dh_d)
 
     # car charging demand
-    cc_d = pd.read_csv(os.path.join(d, 'Car_Charging.csv'),
-                       index_col=0, sep=';')
-    cc_d = cc_d['cc_demand'].values.flatten()[0:periods]
+    cc_d = _load_profile('Car_Charging.csv', 'cc_demand', periods)
     max_cc_d = np.max(cc_d)
 
     # 4. Create the individual energy system components:
@@ -3821,31 +3854,22 @@ def _create_hhes_unit(n, timeframe):
     periods = len(timeframe)
 
     # Parse csv files with the demand and renewables load data:
-    d = os.path.join(example_dir, 'data', 'tsf', 'load_profiles')
-
     # solar:
-    pv_HH = pd.read_csv(os.path.join(d, 'solar_HH_2019.csv'), index_col=0,
-                        sep=';')
-    pv_HH = pv_HH.values.flatten()[0:periods]
+    pv_HH = _load_profile('solar_HH_2019.csv', periods=periods)
     max_pv = np.max(pv_HH)
 
     # wind onshore:
-    wo_HH = pd.read_csv(os.path.join(d, 'wind_HH_2019.csv'), index_col=0,
-                        sep=';')
-    wo_HH = wo_HH.values.flatten()[0:periods]
+    wo_HH = _load_profile('wind_HH_2019.csv', periods=periods)
     max_wo = np.max(wo_HH)
 
     # electricity demand:
-    de_HH = pd.read_csv(os.path.join(d, 'el_demand_HH_2019.csv'), index_col=0,
-                        sep=';')
-    de_HH = de_HH['Last (MW)'].values.flatten()[0:periods]
+    de_HH = _load_profile('el_demand_HH_2019.csv', 'Last (MW)', periods)
     de_HH = np.array(de_HH)
     max_de = np.max(de_HH)
 
     # heat demand:
-    th_HH = pd.read_csv(os.path.join(d, 'th_demand_HH_2019.csv'), index_col=0,
-                        sep=';')
-    th_HH = th_HH['actual_total_load'].values.flatten()[0:periods]
+    th_HH = _load_profile(
+        'th_demand_HH_2019.csv', 'actual_total_load', periods)
     th_HH = np.array(th_HH)
     max_th = np.max(th_HH)
 
@@ -105,3 +105,18 @@ used by :meth:`spellings.get_from <tessif.frused.spellings.get_from>`.
 
 Must be one of the keys found in :attr:`~tessif.write.log.logging_levels`.
 """
+
+profiling_directory = None
+"""
+Directory the profiles of tessif's :attr:`profiled
+<tessif.write.log.profiled>` utilities are dumped to.
+
+Profiling is disabled if set to ``None`` (default). Set it to a directory
+path for profiling each :mod:`~tessif.transform.es2es` ``transform`` and
+:mod:`~tessif.transform.es2mapping` ``AllResultier`` call::
+
+    import tessif.frused.configurations as configurations
+    configurations.profiling_directory = '/tmp/tessif_profiles'
+
+See :func:`tessif.write.log.dump_profile` for details on the files dumped.
+"""
@@ -300,6 +300,42 @@ constraints: str
     String to tag constraints related result data.
 """
 
+MemoryProfile = collections.namedtuple(
+    'MemoryProfile',
+    ['peak', 'allocations'])
+"""
+Memory profile of a single simulation process step. (Mainly used by
+:func:`tessif.analyze.profile_memory`).
+
+Parameters
+----------
+peak: ~numbers.Number
+    Peak memory usage of the simulation process step in bytes.
+allocations: ~pandas.Series, None
+    Bytes allocated during the simulation process step indexed by the tessif
+    module responsible. ``None`` if no allocations were traced.
+"""
+
+SharedEnergySystem = collections.namedtuple(
+    'SharedEnergySystem',
+    ['name', 'arrays', 'skeleton'])
+"""
+Lightweight handle of an energy system placed in shared memory. (Mainly used
+by :meth:`tessif.model.energy_system.AbstractEnergySystem.to_shared_memory`).
+
+Parameters
+----------
+name: str
+    Name of the :class:`~multiprocessing.shared_memory.SharedMemory` block
+    holding the energy system's arrays.
+arrays: tuple
+    Tuple of ``(offset, dtype, shape)`` tuples describing each array's
+    location inside the shared memory block.
+skeleton: bytes
+    Pickled energy system referring to its arrays by their position in
+    :paramref:`~SharedEnergySystem.arrays`.
+"""
+
 SimulationProcessStepResults = collections.namedtuple(
     'SimulationProcessStepResults',
     ['reading', 'parsing', 'transformation', 'simulation', 'post_processing', 'result'])
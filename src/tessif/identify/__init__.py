@@ -25,6 +25,7 @@ from .auxilliary import (
     filter_mutually_inclusive_columns,
     drop_all_zero_columns,
     drop_all_zero_rows,
+    stack_flow_data,
 )
 
 from .calculate import (
@@ -34,9 +35,13 @@ from .calculate import (
     calc_avgs,
     calc_evs,
     calc_corrs,
-
+    calc_stacked_ardiffs,
+    calc_stacked_avgs,
+    calc_stacked_evs,
+    calc_stacked_corrs,
 )
 
 from .timeframes import (
     significant_differences,
+    significant_difference_ranges,
 )
@@ -2,6 +2,7 @@
 # pylint: disable=trailing-whitespace
 # pylint error disabled since the dataframe doctest results require those
 """Tessif module providing aux. resullt differences identification tools."""
+import numpy as np
 from numpy import mean as numpy_mean
 
 
@@ -305,3 +306,76 @@ def parse_reference_df(dataframe, reference=None):
         ref = dataframe[reference]
 
     return ref
+
+
+def parse_reference_array(data, reference=None):
+    """Parse stacked flow data averages.
+
+    Parameters
+    ----------
+    data: numpy.ndarray
+        (model x flow x time) array as returned by :func:`stack_flow_data`.
+
+    reference: int, None, default=None
+        Position of the model along the first axis of
+        :paramref:`~parse_reference_array.data` used as reference. For
+        ``None`` (default), the models' average is used.
+
+    Returns
+    -------
+    numpy.ndarray
+        (flow x time) array of reference results.
+    """
+    if reference is None:
+        ref = data.mean(axis=0)
+    else:
+        ref = data[reference]
+
+    return ref
+
+
+def stack_flow_data(dataframes, columns=None):
+    """Stack identically indexed dataframes into a 3-dimensional array.
+
+    Parameters
+    ----------
+    dataframes: ~collections.abc.Container
+        Container of identically indexed dataframes (one per model/software)
+        of which each column is assumed to contain one flow result.
+
+    columns: ~collections.abc.Sequence, None, default=None
+        Columns (flows) to be stacked in the order given. For ``None``
+        (default), the mutually inclusive columns as returned by
+        :func:`list_mutually_inclusive_columns` are used.
+
+    Returns
+    -------
+    numpy.ndarray
+        (model x flow x time) float64 array.
+
+    Example
+    -------
+    >>> import pandas as pd
+    >>> df1 = pd.DataFrame(
+    ...     data=[[10, 8, 2], [0, 0, 0], [20, 2, 18]],
+    ...     columns=["A", "C", "D"],
+    ... )
+    >>> df2 = pd.DataFrame(
+    ...     data=[[13, 7, 1990], [42, 0, 42], [90, 0, 0]],
+    ...     columns=["A", "D", "E"],
+    ... )
+    >>> stacked = stack_flow_data([df1, df2])
+    >>> print(stacked.shape)
+    (2, 2, 3)
+    >>> print(stacked[1])
+    [[13. 42. 90.]
+     [ 7.  0.  0.]]
+    """
+    if columns is None:
+        columns = list_mutually_inclusive_columns(
+            [dtf.columns for dtf in dataframes])
+
+    return np.stack([
+        dtf[columns].to_numpy(dtype="float64").transpose()
+        for dtf in dataframes
+    ])
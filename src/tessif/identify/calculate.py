@@ -4,6 +4,9 @@
 """Tessif module providing calc. tools for identifying result differences."""
 import numpy as np
 import pandas as pd
+from scipy.stats import rankdata
+
+from tessif.identify.auxilliary import parse_reference_array
 
 
 def calc_nmae(dataframes_dict, reference_df, method="mean"):
@@ -847,6 +850,195 @@ def calc_corrs(
     return pearson_results
 
 
+def calc_stacked_avgs(data):
+    """Calculate average results of stacked flow data.
+
+    Array level equivalent of :func:`calc_avgs`.
+
+    Parameters
+    ----------
+    data: numpy.ndarray
+        (model x flow x time) array as returned by
+        :func:`~tessif.identify.auxilliary.stack_flow_data`.
+
+    Returns
+    -------
+    numpy.ndarray
+        (flow x time) array of averaged out results.
+    """
+    return np.mean(data, axis=0)
+
+
+def calc_stacked_evs(
+        data,
+        reference=None,
+        error="NMAE",
+        normalization="mean",
+):
+    """Calculate error values of all models and flows in one pass.
+
+    Array level equivalent of :func:`calc_evs`, operating on the flow results
+    of all models stacked into a single array instead of looping over pairs
+    of dataframes.
+
+    Parameters
+    ----------
+    data: numpy.ndarray
+        (model x flow x time) array as returned by
+        :func:`~tessif.identify.auxilliary.stack_flow_data`.
+
+    reference: int, None, default=None
+        Position of the model along the first axis of
+        :paramref:`~calc_stacked_evs.data` used as reference results. In case
+        ``None`` is used (default), the models' average is used as returned
+        by :func:`calc_stacked_avgs`.
+
+    error: str
+        String abbrevating the error value calculated. Currently supported are:
+
+            - ``nmae`` for ``Normalized Mean Average Error`` (default)
+            - ``nmbe`` for ``Normalized Mean Biased Error``
+            - ``nrmse`` for ``Normalized Root Mean Square Error``
+
+    normalization: {"mean", "spread", "std"}, default = "mean"
+        Method of error value normalization. See :func:`calc_nmae`.
+
+    Returns
+    -------
+    numpy.ndarray
+        (flow x model) array holding the calculated error values. Like
+        :func:`calc_evs`, flows and models are swapped in comparison to the
+        data passed.
+
+    Examples
+    --------
+    Picking up on the :func:`calc_evs` example data:
+
+    >>> import numpy as np
+    >>> software1 = [[10, 0, 20], [8, 0, 2], [2, 0, 18]]
+    >>> software2 = [[13, 42, 90], [7, 0, 0], [1990, 42, 0]]
+    >>> data = np.array([software1, software2, software2], dtype=float)
+
+    >>> print(calc_stacked_evs(data, reference=1, error="nmae").round(6))
+    [[0.793103 0.       0.      ]
+     [0.428571 0.       0.      ]
+     [1.007874 0.       0.      ]]
+
+    >>> print(calc_stacked_evs(
+    ...     data, reference=1, error="nrmse", normalization="spread"
+    ... ).round(6))
+    [[0.612504 0.       0.      ]
+     [0.184428 0.       0.      ]
+     [0.576922 0.       0.      ]]
+    """
+    ref = parse_reference_array(data, reference)
+    deviations = data - ref
+
+    error_values = {
+        "nmae": lambda: np.mean(np.abs(deviations), axis=-1),
+        "nmbe": lambda: np.mean(deviations, axis=-1),
+        "nrmse": lambda: np.sqrt(np.mean(np.square(deviations), axis=-1)),
+    }
+    norms = {
+        "mean": lambda: np.mean(ref, axis=-1),
+        "spread": lambda: np.abs(ref.max(axis=-1) - ref.min(axis=-1)),
+        "std": lambda: np.std(ref, axis=-1),
+    }
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        evs = error_values[error.lower()]() / norms[normalization]()
+
+    return evs.transpose()
+
+
+def calc_stacked_corrs(
+        data,
+        method="pearson",
+        reference=None,
+        fillna=None,
+):
+    """Calculate correlation coefficients of all models and flows in one pass.
+
+    Array level equivalent of :func:`calc_corrs`, operating on the flow
+    results of all models stacked into a single array instead of correlating
+    pairs of dataframes.
+
+    Parameters
+    ----------
+    data: numpy.ndarray
+        (model x flow x time) array as returned by
+        :func:`~tessif.identify.auxilliary.stack_flow_data`.
+
+    method : {'pearson', 'spearman'}
+        Method of correlation:
+
+        - pearson : standard correlation coefficient
+        - spearman : Spearman rank correlation
+
+        Use :func:`calc_corrs` for other methods.
+
+    reference: int, None, default=None
+        Position of the model along the first axis of
+        :paramref:`~calc_stacked_corrs.data` used as reference results. In
+        case ``None`` is used (default), the models' average is used as
+        returned by :func:`calc_stacked_avgs`.
+
+    fillna: ~numbers.Number, None, default=None
+        Number replacing correlation results of ``NaN``. For design case
+        usage, this is usually the case when one of the correlated timeseries
+        results is constant (e.g. all zeros).
+
+    Returns
+    -------
+    numpy.ndarray
+        (flow x model) array holding the calculated coefficients.
+
+    Examples
+    --------
+    Picking up on the :func:`calc_corrs` example data:
+
+    >>> import numpy as np
+    >>> software1 = [[10, 0, 20], [8, 0, 2], [2, 0, 18]]
+    >>> software2 = [[13, 42, 90], [7, 0, 0], [1990, 42, 0]]
+    >>> data = np.array([software1, software2, software2], dtype=float)
+
+    >>> print(calc_stacked_corrs(data, reference=1).round(6))
+    [[ 0.617145  1.        1.      ]
+     [ 0.970725  1.        1.      ]
+     [-0.426423  1.        1.      ]]
+
+    >>> print(calc_stacked_corrs(data, "spearman", reference=1).round(6))
+    [[ 0.5       1.        1.      ]
+     [ 0.866025  1.        1.      ]
+     [-0.5       1.        1.      ]]
+    """
+    ref = parse_reference_array(data, reference)
+
+    if method == "spearman":
+        data = rankdata(data, axis=-1)
+        ref = rankdata(ref, axis=-1)
+    elif method != "pearson":
+        raise ValueError(
+            f"Correlation method '{method}' is not supported on stacked "
+            "data. Use 'pearson' or 'spearman' or resort to 'calc_corrs'.")
+
+    centered_data = data - np.mean(data, axis=-1, keepdims=True)
+    centered_ref = ref - np.mean(ref, axis=-1, keepdims=True)
+
+    covariances = np.sum(centered_data * centered_ref, axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ccfs = covariances / np.sqrt(
+            np.sum(np.square(centered_data), axis=-1)
+            * np.sum(np.square(centered_ref), axis=-1)
+        )
+
+    ccfs = np.clip(ccfs, -1, 1)
+    if fillna is not None:
+        ccfs = np.where(np.isnan(ccfs), fillna, ccfs)
+
+    return ccfs.transpose()
+
+
 def _normalize(reference, method):
     norms = {
         "mean": np.mean(reference, axis="index"),
@@ -875,3 +1067,24 @@ def calc_ardiffs(data, reference):
     absolute_relative_differences = relative_biased_differences.abs()
 
     return absolute_relative_differences
+
+
+def calc_stacked_ardiffs(data, reference):
+    """Calculate absolute relative difference of stacked flow data.
+
+    Parameters
+    ----------
+    data: numpy.ndarray
+        (model x flow x time) array as returned by
+        :func:`~tessif.identify.auxilliary.stack_flow_data`.
+
+    reference: numpy.ndarray
+        (flow x time) array of reference results.
+
+    Returns
+    -------
+    numpy.ndarray
+        (model x flow x time) array of absolute relative differences.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.abs((data - reference) / reference)
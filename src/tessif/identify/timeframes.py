@@ -5,8 +5,11 @@ import numpy as np
 import pandas as pd
 
 
-from tessif.identify.auxilliary import parse_reference_df
-from tessif.identify.calculate import calc_ardiffs
+from tessif.identify.auxilliary import (
+    parse_reference_array,
+    parse_reference_df,
+)
+from tessif.identify.calculate import calc_ardiffs, calc_stacked_ardiffs
 
 
 def significant_differences(
@@ -218,6 +221,131 @@ def significant_differences(
     return dataframes
 
 
+def significant_difference_ranges(
+        data,
+        method="ardiffs",
+        threshold=0.1,
+        reference=None,
+        neighs=True,
+        flows=None,
+):
+    """Identify significant differences of many flows at once.
+
+    Batched variant of :func:`significant_differences`, designed for
+    identifying differences across thousands of flows. Instead of a list of
+    DataFrame slices per flow, each continous sequence of detected
+    differences is returned as compact index range.
+
+    Parameters
+    ----------
+    data: numpy.ndarray
+        (model x flow x time) array of flow results as returned by
+        :func:`~tessif.identify.auxilliary.stack_flow_data`.
+
+    method: {"ardiffs"}, method, default="ardiffs"
+        String specifying wich precoded function to use for calculating
+        differences or function that takes ``data`` and the (flow x time)
+        reference array to return an array shaped like
+        :paramref:`~significant_difference_ranges.data`.
+
+    threshold: ~numbers.Number, default=0.1
+        Number specifying the threshold on which relative differences are seen
+        as "significant".
+
+    reference: int, None, default=None
+        Position of the model along the first axis of
+        :paramref:`~significant_difference_ranges.data` used as reference
+        results to calculate actual differences.
+
+        For ``None`` (default), the models' average is used.
+
+    neighs: bool, default=True
+        If ``True``, each range is extended by its neighbouring indices
+        (as long as they are within the timeframe) for creating telling
+        stepplots.
+
+    flows: ~collections.abc.Sequence, None, default=None
+        Flow labels used for the ``flow`` column of the returned ranges.
+        For ``None`` (default), the flows' integer position is used.
+
+    Returns
+    -------
+    pandas.DataFrame
+        DataFrame of one continous sequence of detected differences per row.
+        Columns are ``flow``, ``start`` and ``stop`` where ``start`` and
+        ``stop`` are integer positions along the time axis to be used as in
+        ``data[:, flow, start:stop]``.
+
+    Examples
+    --------
+    Picking up on the :func:`significant_differences` example data, stacked
+    as second flow next to a flow without any differences:
+
+    >>> import numpy as np
+    >>> data = np.array([
+    ...     [[10, 10, 10, 10, 10], [5, 5, 5, 5, 5]],
+    ...     [[10, 12, 10, 10, 10], [5, 5, 5, 5, 5]],
+    ...     [[10, 10, 10, 10, 12], [5, 5, 5, 5, 5]],
+    ... ])
+    >>> print(data.shape)
+    (3, 2, 5)
+
+    >>> print(significant_difference_ranges(data, neighs=False))
+       flow  start  stop
+    0     0      1     2
+    1     0      4     5
+
+    >>> print(significant_difference_ranges(
+    ...     data, flows=["A to B", "B to C"]))
+         flow  start  stop
+    0  A to B      0     3
+    1  A to B      3     5
+
+    Using the second model as reference and setting threshold to 30% results
+    in no significant differences beeing detected:
+
+    >>> print(len(significant_difference_ranges(
+    ...     data, reference=1, threshold=0.3)))
+    0
+    """
+    data = np.asarray(data, dtype="float64")
+    ref = parse_reference_array(data, reference)
+
+    # calculate relative deviations
+    if method == "ardiffs":
+        relative_deviations = calc_stacked_ardiffs(data, ref)
+    else:
+        relative_deviations = method(data, ref)
+
+    # a flow differs significantly at a timestep if any model does
+    significant = np.any(relative_deviations > threshold, axis=0)
+
+    # run length encode the significant timesteps of each flow by padding
+    # each flow with non significant timesteps and locating the flanks
+    padded = np.zeros(
+        (significant.shape[0], significant.shape[1] + 2), dtype="int8")
+    padded[:, 1:-1] = significant
+    flanks = np.diff(padded, axis=1)
+
+    # row major ordering of nonzero keeps rising and falling flanks paired
+    flow_positions, starts = np.nonzero(flanks == 1)
+    _, stops = np.nonzero(flanks == -1)
+
+    # add neighbouring indices if requested
+    if neighs:
+        starts = np.maximum(starts - 1, 0)
+        stops = np.minimum(stops + 1, significant.shape[1])
+
+    if flows is not None:
+        flow_positions = np.asarray(flows)[flow_positions]
+
+    return pd.DataFrame({
+        "flow": flow_positions,
+        "start": starts,
+        "stop": stops,
+    })
+
+
 def _continous_int_sequences(integers):
     """Identify continous sequences of integers.
 
@@ -1,6 +1,7 @@
 # src/tessif/identify/timevarying.py
 """Identify submodule holding identification tools for timevarying results."""
 import functools
+import numpy as np
 import pandas as pd
 
 from tessif.identify.core import (
@@ -12,13 +13,15 @@ from tessif.identify.auxilliary import (
     filter_mutually_inclusive_columns,
     list_mutually_inclusive_columns,
     list_not_mutually_inclusive_columns,
-    parse_reference_df,
+    parse_reference_array,
+    stack_flow_data,
 )
 
 from tessif.identify.calculate import (
-    calc_evs,
     calc_corrs,
-    calc_ardiffs,
+    calc_stacked_ardiffs,
+    calc_stacked_corrs,
+    calc_stacked_evs,
 )
 
 from tessif.identify.timeframes import (
@@ -205,22 +208,48 @@ class TimevaryingIdentificier(Identificier):
             )
         )
 
+        # stack the inspected loads into one (software x flow x time) array
+        # so error values and correlations are calculated in one pass each
+        flows = next(iter(self._inspected_loads.values())).columns
+        self._stacked_loads = stack_flow_data(
+            self._inspected_loads.values(), columns=flows)
+        self._stacked_flows = flows
+        stacked_reference = None
+        if reference is not None:
+            stacked_reference = self._softwares.index(reference)
+        self._stacked_reference = stacked_reference
+
         # calculate error values
-        self._error_values = calc_evs(
-            dataframes=self._inspected_loads.values(),
-            labels=self._inspected_loads.keys(),
-            reference=reference,
-            error=error_value,
+        self._error_values = pd.DataFrame(
+            calc_stacked_evs(
+                self._stacked_loads,
+                reference=stacked_reference,
+                error=error_value,
+            ),
+            index=flows,
+            columns=self._inspected_loads.keys(),
         )
 
         # calculate correlations
-        self._corrs = calc_corrs(
-            dataframes=self._inspected_loads.values(),
-            method=self._corr,
-            labels=self._inspected_loads.keys(),
-            reference=reference,
-            fillna=0,
-        )
+        if self._corr in ("pearson", "spearman"):
+            self._corrs = pd.DataFrame(
+                calc_stacked_corrs(
+                    self._stacked_loads,
+                    method=self._corr,
+                    reference=stacked_reference,
+                    fillna=0,
+                ),
+                index=flows,
+                columns=self._inspected_loads.keys(),
+            )
+        else:
+            self._corrs = calc_corrs(
+                dataframes=self._inspected_loads.values(),
+                method=self._corr,
+                labels=self._inspected_loads.keys(),
+                reference=reference,
+                fillna=0,
+            )
 
         # super class handles clustering and mapping interest
         super().__init__(
@@ -364,47 +393,31 @@ class TimevaryingIdentificier(Identificier):
             setattr(self, f"_{cluster}_interest_timeframes", clustered_results)
 
     def _map_interest_averaged_results(self):
+        # parse reference
+        ref = parse_reference_array(
+            self._stacked_loads, self._stacked_reference)
+
+        # calculate relative deviations of all flows at once
+        relative_deviations = calc_stacked_ardiffs(self._stacked_loads, ref)
+
+        # construct all averaged results, updated with those from the
+        # original data where significant differenes were detected
+        all_averaged = np.where(
+            relative_deviations > self._ev_thres,
+            self._stacked_loads,
+            ref,
+        )
+
+        timeindex = next(iter(self._inspected_loads.values())).index
         for cluster in ["high", "medium", "low"]:
             clustered_results = dict()
 
             for flow in tuple(getattr(self, cluster).index):
-                data = getattr(
-                    self, f"_{cluster}_interest_results")[flow].copy()
-
-                # parse reference
-                ref = parse_reference_df(data, self._ref_arg)
-
-                # calculate relative deviations
-                method = "ardiffs"
-                if method == "ardiffs":
-                    relative_deviations = calc_ardiffs(data, ref)
-                else:
-                    relative_deviations = method(data, ref)
-
-                # identify only those significant
-                relative_significant_differences = relative_deviations[
-                    relative_deviations > self._ev_thres]
-
-                # construct an all averaged dataframe
-                all_averaged = pd.DataFrame(
-                    data=[ref] * len(data.columns),
-                    columns=data.index,
-                    index=data.columns,
-                ).transpose()
-
-                # update the all averaged dataframe with those from the original
-                # data where significant differenes were detected
-                mindices = list(relative_significant_differences.stack().index)
-                for idx, col in mindices:
-                    all_averaged.at[idx, col] = data.at[idx, col]
-
-                # identified_timeframes = significant_differences(
-                #     data=data,
-                #     reference=self._ref_arg,
-                #     neighs=True,
-                #     threshold=self._ev_thres,
-                # )
-                # clustered_results[flow] = identified_timeframes
-                clustered_results[flow] = all_averaged
+                position = self._stacked_flows.get_loc(flow)
+                clustered_results[flow] = pd.DataFrame(
+                    all_averaged[:, position, :].transpose(),
+                    index=timeindex,
+                    columns=self._softwares,
+                )
 
             setattr(self, f"_{cluster}_interest_averaged_results", clustered_results)
@@ -17,12 +17,169 @@ by engineers. Hence parameters, attributes and namespaces are aggregated in a
 way an engineer would classify such components. For more on that see
 :mod:`tessif.model`.
 """
+import abc
+import hashlib
+import weakref
+from collections.abc import Mapping
+
 import numpy as np
 import tessif.frused.namedtuples as nts
 from tessif.frused.defaults import energy_system_nodes as es_defaults
 
 
-class AbstractEsComponent:
+class FrozenMapping(dict):
+    """
+    Immutable :class:`dict` holding the mapping like parameters of tessif's
+    energy system components.
+
+    Equal parameter mappings are interned, so components sharing for example
+    their default :attr:`~Source.flow_rates` share one and the same mapping
+    object.
+
+    Examples
+    --------
+    >>> from tessif.model.components import Sink
+    >>> demand_1 = Sink(name='demand 1', inputs=('electricity',))
+    >>> demand_2 = Sink(name='demand 2', inputs=('electricity',))
+    >>> print(demand_1.flow_rates)
+    {'electricity': MinMax(min=0.0, max=inf)}
+    >>> demand_1.flow_rates is demand_2.flow_rates
+    True
+
+    Hence they can not be modified:
+
+    >>> demand_1.flow_rates['electricity'] = (0, 10)
+    Traceback (most recent call last):
+    ...
+    TypeError: 'FrozenMapping' object does not support item assignment
+
+    Use :meth:`~AbstractEsComponent.duplicate` or
+    :meth:`~AbstractEsComponent.from_attributes` for creating modified
+    components instead.
+    """
+
+    __slots__ = ('__weakref__',)
+
+    def _refuse_modification(self, *args, **kwargs):
+        raise TypeError(
+            "'{}' object does not support item assignment".format(
+                type(self).__name__))
+
+    __setitem__ = __delitem__ = __ior__ = _refuse_modification
+    clear = pop = popitem = setdefault = update = _refuse_modification
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+_interned_mappings = weakref.WeakValueDictionary()
+
+
+def _interning_key(value):
+    """Hashable key distinguishing equal values of different types, as
+    in ``0``, ``0.0`` and ``False``."""
+    if isinstance(value, tuple):
+        return (type(value), tuple(_interning_key(v) for v in value))
+    return (type(value), value)
+
+
+def _intern_mapping(mapping):
+    """
+    Return a :class:`FrozenMapping` equal to the given mapping, shared with
+    all other components using an equal mapping.
+
+    Mappings holding unhashable values (as in :class:`numpy.ndarray` or
+    :class:`list`) are frozen but not interned. Anything but a
+    :class:`~collections.abc.Mapping` is returned unchanged.
+    """
+    if not isinstance(mapping, Mapping):
+        return mapping
+
+    try:
+        key = tuple((_interning_key(k), _interning_key(v))
+                    for k, v in mapping.items())
+        interned = _interned_mappings.get(key)
+    except TypeError:
+        return FrozenMapping(mapping)
+
+    if interned is None:
+        interned = FrozenMapping(mapping)
+        _interned_mappings[key] = interned
+
+    return interned
+
+
+_shared_timeseries = weakref.WeakValueDictionary()
+
+
+def _share_timeseries(values):
+    """
+    Return a read-only :class:`numpy.float64 <numpy.ndarray>` array of the
+    given timeseries values, shared with all other components using an
+    equal profile.
+
+    Arrays already being read-only float64 are returned unchanged, so
+    :meth:`~AbstractEsComponent.duplicate` does not copy them. Scalar values,
+    as in a constant lower bound of ``0``, are returned unchanged.
+
+    Examples
+    --------
+    >>> from tessif.model.components import _share_timeseries
+    >>> profile = _share_timeseries([10, 22, '22'])
+    >>> print(profile)
+    [10. 22. 22.]
+    >>> _share_timeseries((10.0, 22.0, 22.0)) is profile
+    True
+    >>> _share_timeseries(profile) is profile
+    True
+    >>> _share_timeseries(0)
+    0
+    """
+    if (isinstance(values, np.ndarray) and values.dtype == np.float64
+            and not values.flags.writeable):
+        return values
+
+    if np.ndim(values) == 0:
+        return values
+
+    array = np.array(values, dtype=np.float64)
+    array.flags.writeable = False
+
+    key = (array.shape, hashlib.blake2b(array.tobytes()).digest())
+    shared = _shared_timeseries.get(key)
+
+    # guard against digest collisions, treating NaNs as equal
+    if shared is None or not np.array_equal(shared, array, equal_nan=True):
+        _shared_timeseries[key] = shared = array
+
+    return shared
+
+
+def _share_timeseries_mapping(timeseries):
+    """
+    Return a :class:`FrozenMapping` of
+    :class:`~tessif.frused.namedtuples.MinMax` tuples holding the
+    :func:`shared <_share_timeseries>` timeseries arrays.
+
+    Tuples and mappings already holding the shared arrays are reused.
+    """
+    parsed = {}
+    for interface, tple in timeseries.items():
+        minimum, maximum = (_share_timeseries(v) for v in tple)
+        if (type(tple) is nts.MinMax and tple.min is minimum
+                and tple.max is maximum):
+            parsed[interface] = tple
+        else:
+            parsed[interface] = nts.MinMax(minimum, maximum)
+
+    if isinstance(timeseries, FrozenMapping) and all(
+            parsed[k] is v for k, v in timeseries.items()):
+        return timeseries
+
+    return FrozenMapping(parsed)
+
+
+class AbstractEsComponent(abc.ABC):
     r"""
     Entities only concerned with their unique hashable identifier.
 
@@ -84,8 +241,25 @@ class AbstractEsComponent:
     :attr:`~tessif.frused.configurations.node_uid_style`. But in total
     the overall combination of these parameters must be unique and will form
     the components hashable uid (unique identifier)
+
+    Note
+    ----
+    Components are immutable and keep their attributes in
+    :std:term:`__slots__`. Mapping like parameters are stored as interned
+    :class:`FrozenMapping` objects shared among all components using equal
+    parameter values.
     """
 
+    __slots__ = ('_uid', '_interfaces', '_timeseries')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # slot names of the whole class hierarchy in alphabetical order, which
+        # is the order the attributes are represented in
+        cls._attribute_slots = tuple(sorted(
+            slot for klass in cls.__mro__
+            for slot in klass.__dict__.get('__slots__', ())))
+
     def __init__(self, name, *args, **kwargs):
 
         # modify this dict to add additional parameters
@@ -100,10 +274,31 @@ class AbstractEsComponent:
             ('node_type', kwargs.get('node_type', es_defaults['node_type'])),
         ])
 
-        self._uid = nts.Uid(**kwargs_and_defaults)
+        object.__setattr__(self, '_uid', nts.Uid(**kwargs_and_defaults))
 
         # key parsing functionality wrapper to parameterize the component
-        self._parse_arguments(**kwargs)
+        self._parse_arguments(
+            self._create_parameters_and_defaults(), **kwargs)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            "'{}' object is immutable. Use duplicate() or from_attributes() "
+            "for creating a modified component".format(type(self).__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError(
+            "'{}' object is immutable".format(type(self).__name__))
+
+    def __getstate__(self):
+        return {slot: getattr(self, slot)
+                for slot in self._attribute_slots if hasattr(self, slot)}
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            # unpickled arrays are writeable copies, so share them again
+            if slot == '_timeseries' and value is not None:
+                value = _share_timeseries_mapping(value)
+            object.__setattr__(self, slot, value)
 
     def duplicate(self, prefix='', separator='_', suffix='copy'):
         """
@@ -150,7 +345,16 @@ class AbstractEsComponent:
         """
         return cls(**attributes)
 
-    def _parse_arguments_as_singular_values(self, **arguments):
+    @abc.abstractmethod
+    def _create_parameters_and_defaults(self):
+        """
+        Create the mapping of the component's parameter categories to its
+        parameters and their default values. Used by
+        :meth:`_parse_arguments` and overridden by each component.
+        """
+
+    def _parse_arguments_as_singular_values(
+            self, parameters_and_defaults, **arguments):
         """Utility for parsing key word arguments in to the form of::
 
             parameter = value
@@ -164,12 +368,13 @@ class AbstractEsComponent:
         Designed to internally set the energy system components
         parameters. Called by :meth:`_parse_arguments`.
         """
-        for parameter, default_value in self._parameters_and_defaults[
+        for parameter, default_value in parameters_and_defaults[
                 'singular_values'].items():
-            setattr(self, '_{}'.format(parameter),
-                    arguments.get(parameter, default_value))
+            object.__setattr__(self, '_{}'.format(parameter),
+                               arguments.get(parameter, default_value))
 
-    def _parse_arguments_as_singular_value_mappings(self, **arguments):
+    def _parse_arguments_as_singular_value_mappings(
+            self, parameters_and_defaults, **arguments):
         """Utility for parsing key word arguments in to the form of::
 
             parameter = {input/output_string: value}
@@ -183,17 +388,19 @@ class AbstractEsComponent:
         Designed to internally set the energy system components
         parameters. Called by :meth:`_parse_arguments`.
         """
-        for parameter, default_mapping in self._parameters_and_defaults[
+        for parameter, default_mapping in parameters_and_defaults[
                 'singular_value_mappings'].items():
 
             mapping = arguments.get(parameter, default_mapping)
             # reading in data sets from external data can lead to NaN values
             if mapping is np.nan:
                 mapping = default_mapping
-            setattr(self, '_{}'.format(parameter),
-                    {key: mapping[key] for key in sorted(mapping.keys())})
+            object.__setattr__(
+                self, '_{}'.format(parameter), _intern_mapping(
+                    {key: mapping[key] for key in sorted(mapping.keys())}))
 
-    def _parse_arguments_as_namedtuples(self, **arguments):
+    def _parse_arguments_as_namedtuples(
+            self, parameters_and_defaults, **arguments):
         """Utility for parsing key word arguments in to the form of::
 
             parameter = namedtuple(*values)
@@ -207,8 +414,9 @@ class AbstractEsComponent:
         Designed to internally set the energy system components
         parameters. Called by :meth:`_parse_arguments`.
         """
-        for ntple, parameters in self._parameters_and_defaults[
+        for ntple, parameters in parameters_and_defaults[
                 'namedtuples'].items():
+            ntuple = getattr(nts, ntple)
             for parameter, default_tuple in parameters.items():
                 tpl = arguments.get(parameter, default_tuple)
 
@@ -216,10 +424,12 @@ class AbstractEsComponent:
                 if tpl is np.nan:
                     tpl = default_tuple
 
-                setattr(self, '_{}'.format(parameter),
-                        getattr(nts, ntple)(*tpl))
+                object.__setattr__(
+                    self, '_{}'.format(parameter),
+                    tpl if type(tpl) is ntuple else ntuple(*tpl))
 
-    def _parse_arguments_as_mapped_namedtuples(self, **arguments):
+    def _parse_arguments_as_mapped_namedtuples(
+            self, parameters_and_defaults, **arguments):
         """Utility for parsing key word arguments in to the form of::
 
             parameter = {input/output_string: namedtuple(*values)}
@@ -236,8 +446,9 @@ class AbstractEsComponent:
         Designed to internally set the energy system components
         parameters. Called by :meth:`_parse_arguments`.
         """
-        for ntple, parameters in self._parameters_and_defaults[
+        for ntple, parameters in parameters_and_defaults[
                 'mapped_namedtuples'].items():
+            ntuple = getattr(nts, ntple)
             for parameter, default_mapping in parameters.items():
                 mapping = arguments.get(parameter, default_mapping)
 
@@ -245,11 +456,14 @@ class AbstractEsComponent:
                 if mapping is np.nan:
                     mapping = default_mapping
 
-                setattr(self, '_{}'.format(parameter),
-                        {key: getattr(nts, ntple)(*mapping[key])
-                         for key in sorted(mapping.keys())})
+                # reuse tuples already being of the requested type
+                object.__setattr__(
+                    self, '_{}'.format(parameter), _intern_mapping(
+                        {key: mapping[key] if type(mapping[key]) is ntuple
+                         else ntuple(*mapping[key])
+                         for key in sorted(mapping.keys())}))
 
-    def _parse_timeseries(self, **arguments):
+    def _parse_timeseries(self, parameters_and_defaults, **arguments):
         """Utility for parsing the key word argument timeseries::
 
             timeseries = None
@@ -257,22 +471,21 @@ class AbstractEsComponent:
         """
         timeseries = arguments.get(
             'timeseries',
-            self._parameters_and_defaults.get(
+            parameters_and_defaults.get(
                 'timeseries', es_defaults['timeseries']))
 
         # reading in data sets from external data can lead to NaN values
         if timeseries is np.nan:
-            timeseries = self._parameters_and_defaults.get(
+            timeseries = parameters_and_defaults.get(
                 'timeseries', es_defaults['timeseries'])
 
-        # enforce min max tuple:
+        # enforce min max tuples of shared read-only float64 arrays:
         if timeseries is not None:
-            for interface, tple in timeseries.copy().items():
-                timeseries[interface] = nts.MinMax(*tple)
+            timeseries = _share_timeseries_mapping(timeseries)
 
-        setattr(self, '_{}'.format('timeseries'), timeseries)
+        object.__setattr__(self, '_{}'.format('timeseries'), timeseries)
 
-    def _parse_arguments(self, **arguments):
+    def _parse_arguments(self, parameters_and_defaults, **arguments):
         """
         Key functionality wrapper for parsing component parameters.
 
@@ -281,16 +494,24 @@ class AbstractEsComponent:
 
         Parameters
         -----------
+        parameters_and_defaults: dict
+            Mapping of the component's parameter categories to its parameters
+            and their default values. As created by
+            :meth:`_create_parameters_and_defaults`.
         kwargs:
             Key word arguments representing the component's parameters. The
             arguments are provided by the user and filtered by the instance
             variables
         """
-        self._parse_arguments_as_singular_values(**arguments)
-        self._parse_arguments_as_singular_value_mappings(**arguments)
-        self._parse_arguments_as_namedtuples(**arguments)
-        self._parse_arguments_as_mapped_namedtuples(**arguments)
-        self._parse_timeseries(**arguments)
+        self._parse_arguments_as_singular_values(
+            parameters_and_defaults, **arguments)
+        self._parse_arguments_as_singular_value_mappings(
+            parameters_and_defaults, **arguments)
+        self._parse_arguments_as_namedtuples(
+            parameters_and_defaults, **arguments)
+        self._parse_arguments_as_mapped_namedtuples(
+            parameters_and_defaults, **arguments)
+        self._parse_timeseries(parameters_and_defaults, **arguments)
 
     def __repr__(self):
         """
@@ -302,9 +523,7 @@ class AbstractEsComponent:
                 tsf.Component(attribute_name=attribute, ....)
         """
         return '{!s}('.format(self.__class__) + ', '.join([
-            *['{!r}={!r}'.format(
-                k.lstrip('_'), v) for k, v in sorted(self.__dict__.items())
-              if k != '_parameters_and_defaults'],
+            *['{!r}={!r}'.format(k, v) for k, v in self.attributes.items()],
             ')',
         ])
 
@@ -321,9 +540,7 @@ class AbstractEsComponent:
                 )
         """
         return '{!s}(\n'.format(self.__class__) + ',\n'.join([
-            *['    {!r}={!r}'.format(
-                k.lstrip('_'), v) for k, v in sorted(self.__dict__.items())
-              if k != '_parameters_and_defaults'],
+            *['    {!r}={!r}'.format(k, v) for k, v in self.attributes.items()],
             ')'
         ])
 
@@ -332,8 +549,8 @@ class AbstractEsComponent:
         """:class:`~collections.abc.Mapping` of entity's energy system
         component attribute names to its respective attribute values.
         """
-        return {k.lstrip('_'): v for k, v in sorted(self.__dict__.items())
-                if k != '_parameters_and_defaults'}
+        return {slot.lstrip('_'): getattr(self, slot)
+                for slot in self._attribute_slots if hasattr(self, slot)}
 
     @property
     def interfaces(self):
@@ -456,12 +673,19 @@ class Bus(AbstractEsComponent):
     the components hashable uid (unique identifier)
     """
 
+    __slots__ = ('_inputs', '_outputs')
+
     def __init__(self, name, inputs, outputs, *args, **kwargs):
-        self._inputs = frozenset(inputs)
-        self._outputs = frozenset(outputs)
-        self._interfaces = self._inputs.union(self._outputs)
+        inputs, outputs = frozenset(inputs), frozenset(outputs)
+        object.__setattr__(self, '_inputs', inputs)
+        object.__setattr__(self, '_outputs', outputs)
+        object.__setattr__(self, '_interfaces', inputs.union(outputs))
+
+        super().__init__(name, *args, **kwargs)
 
-        self._parameters_and_defaults = {
+    def _create_parameters_and_defaults(self):
+        # modify this dict for adding additional parameters
+        return {
             'singular_values': {
             },
             'singular_value_mappings': {
@@ -472,7 +696,6 @@ class Bus(AbstractEsComponent):
             },
             'timeseries': es_defaults['timeseries'],
         }
-        super().__init__(name, *args, **kwargs)
 
     @property
     def inputs(self):
@@ -602,21 +825,28 @@ class Connector(AbstractEsComponent):
     uid = my_connector
     """
 
+    __slots__ = ('_inputs', '_outputs', '_conversions')
+
     def __init__(self, name, interfaces, *args, **kwargs):
-        self._inputs = frozenset(interfaces)
-        self._outputs = frozenset(interfaces)
-        self._interfaces = frozenset(interfaces)
+        object.__setattr__(self, '_inputs', frozenset(interfaces))
+        object.__setattr__(self, '_outputs', frozenset(interfaces))
+        object.__setattr__(self, '_interfaces', frozenset(interfaces))
         _connections = tuple(interfaces)
 
         if kwargs.get('conversions', None) is None:
-            self._conversions = {
+            conversions = {
                 _connections: es_defaults['efficiency'],
                 tuple(reversed(_connections)): es_defaults['efficiency'],
             }
         else:
-            self._conversions = kwargs.get('conversions')
+            conversions = kwargs.get('conversions')
+        object.__setattr__(self, '_conversions', _intern_mapping(conversions))
 
-        self._parameters_and_defaults = {
+        super().__init__(name, *args, **kwargs)
+
+    def _create_parameters_and_defaults(self):
+        # modify this dict for adding additional parameters
+        return {
             'singular_values': {
             },
             'singular_value_mappings': {
@@ -628,7 +858,6 @@ class Connector(AbstractEsComponent):
             },
             'timeseries': es_defaults['timeseries'],
         }
-        super().__init__(name, *args, **kwargs)
 
     @property
     def inputs(self):
@@ -985,11 +1214,23 @@ class Source(AbstractEsComponent):
     uid = my_source
     """
 
+    __slots__ = (
+        '_outputs', '_accumulated_amounts', '_costs_for_being_active',
+        '_expandable', '_expansion_costs', '_expansion_limits', '_flow_costs',
+        '_flow_emissions', '_flow_gradients', '_flow_rates',
+        '_gradient_costs', '_initial_status', '_milp',
+        '_number_of_status_changes', '_status_changing_costs',
+        '_status_inertia')
+
     def __init__(self, name, outputs, *args, **kwargs):
-        self._outputs = frozenset(o for o in outputs)
-        self._interfaces = self._outputs
+        object.__setattr__(self, '_outputs', frozenset(o for o in outputs))
+        object.__setattr__(self, '_interfaces', self._outputs)
 
-        self._parameters_and_defaults = {
+        super().__init__(name, *args, **kwargs)
+
+    def _create_parameters_and_defaults(self):
+        # modify this dict for adding additional parameters
+        return {
             'singular_values': {
                 'initial_status': es_defaults['initial_status'],
                 'costs_for_being_active': es_defaults[
@@ -1050,8 +1291,6 @@ class Source(AbstractEsComponent):
             }
         }
 
-        super().__init__(name, *args, **kwargs)
-
     @property
     def outputs(self):
         """
@@ -1568,12 +1807,23 @@ class Sink(AbstractEsComponent):
     uid = my_sink
     """
 
+    __slots__ = (
+        '_inputs', '_accumulated_amounts', '_costs_for_being_active',
+        '_expandable', '_expansion_costs', '_expansion_limits', '_flow_costs',
+        '_flow_emissions', '_flow_gradients', '_flow_rates',
+        '_gradient_costs', '_initial_status', '_milp',
+        '_number_of_status_changes', '_status_changing_costs',
+        '_status_inertia')
+
     def __init__(self, name, inputs, *args, **kwargs):
-        self._inputs = frozenset(inputs)
-        self._interfaces = self._inputs
+        object.__setattr__(self, '_inputs', frozenset(inputs))
+        object.__setattr__(self, '_interfaces', self._inputs)
 
+        super().__init__(name, *args, **kwargs)
+
+    def _create_parameters_and_defaults(self):
         # modify this dict for adding additional parameters
-        self._parameters_and_defaults = {
+        return {
             'singular_values': {
                 'initial_status': es_defaults['initial_status'],
                 'costs_for_being_active': es_defaults[
@@ -1635,8 +1885,6 @@ class Sink(AbstractEsComponent):
             'timeseries': es_defaults['timeseries'],
         }
 
-        super().__init__(name, *args, **kwargs)
-
     @property
     def inputs(self):
         """
@@ -2165,13 +2413,28 @@ class Transformer(AbstractEsComponent):
     uid = my_transformer
     """
 
+    __slots__ = (
+        '_inputs', '_outputs', '_conversions', '_costs_for_being_active',
+        '_expandable', '_expansion_costs', '_expansion_limits', '_flow_costs',
+        '_flow_emissions', '_flow_gradients', '_flow_rates',
+        '_gradient_costs', '_initial_status', '_milp',
+        '_number_of_status_changes', '_status_changing_costs',
+        '_status_inertia')
+
     def __init__(self, name, inputs, outputs, conversions, *args, **kwargs):
-        self._inputs = frozenset(i for i in inputs)
-        self._outputs = frozenset(o for o in outputs)
-        self._interfaces = self._inputs.union(self._outputs)
-        self._conversions = conversions
+        inputs = frozenset(i for i in inputs)
+        outputs = frozenset(o for o in outputs)
+        object.__setattr__(self, '_inputs', inputs)
+        object.__setattr__(self, '_outputs', outputs)
+        object.__setattr__(self, '_interfaces', inputs.union(outputs))
+        object.__setattr__(self, '_conversions', _intern_mapping(conversions))
 
-        self._parameters_and_defaults = {
+        # conversions are passed on for being reparsed by subclasses
+        super().__init__(name, *args, conversions=conversions, **kwargs)
+
+    def _create_parameters_and_defaults(self):
+        # modify this dict for adding additional parameters
+        return {
             'singular_values': {
                 'initial_status': es_defaults['initial_status'],
                 'costs_for_being_active': es_defaults[
@@ -2229,8 +2492,6 @@ class Transformer(AbstractEsComponent):
             'timeseries': es_defaults['timeseries'],
         }
 
-        super().__init__(name, *args, **kwargs)
-
     @property
     def inputs(self):
         """
@@ -2828,6 +3089,11 @@ class CHP(Transformer):
     uid = my_chp
     """
 
+    __slots__ = (
+        '_back_pressure', '_conversion_factor_full_condensation',
+        '_el_efficiency_wo_dist_heat', '_enthalpy_loss',
+        '_min_condenser_load', '_power_loss_index', '_power_wo_dist_heat')
+
     def __init__(self, name, inputs, outputs, *args, **kwargs):
         # The Transformer class requires the positional argument 'conversions'
         # the CHP class however doesn't, therefore if a CHP object is created
@@ -2836,25 +3102,28 @@ class CHP(Transformer):
         if 'conversions' not in (args or kwargs):
             kwargs.update({'conversions': es_defaults['chp_efficiency']})
         super().__init__(name, inputs, outputs, *args, **kwargs)
-        # Add the additional parameters for the chp class, then call
-        # _parse_arguments again.
-        self._parameters_and_defaults['singular_values'].update({
+
+    def _create_parameters_and_defaults(self):
+        # Add the additional parameters for the chp class to the ones of the
+        # transformer class.
+        parameters_and_defaults = super()._create_parameters_and_defaults()
+        parameters_and_defaults['singular_values'].update({
             'back_pressure': es_defaults['chp_back_pressure'],
             'min_condenser_load': es_defaults['min_condenser_load'],
             'power_loss_index': es_defaults['power_loss_index'],
         })
-        self._parameters_and_defaults['singular_value_mappings'].update({
+        parameters_and_defaults['singular_value_mappings'].update({
             'conversion_factor_full_condensation': es_defaults[
                 'chp_efficiency'],
             'conversions': es_defaults['chp_efficiency'],
         })
-        self._parameters_and_defaults['namedtuples']['MinMax'].update({
+        parameters_and_defaults['namedtuples']['MinMax'].update({
             'el_efficiency_wo_dist_heat': es_defaults[
                 'el_efficiency_wo_dist_heat'],
             'enthalpy_loss': es_defaults['enthalpy_loss'],
             'power_wo_dist_heat': es_defaults['power_wo_dist_heat'],
         })
-        self._parse_arguments(**kwargs)
+        return parameters_and_defaults
 
     @property
     def back_pressure(self):
@@ -3327,14 +3596,26 @@ class Storage(AbstractEsComponent):
     uid = my_storage
     """
 
+    __slots__ = (
+        '_input', '_output', '_capacity', '_costs_for_being_active',
+        '_expandable', '_expansion_costs', '_expansion_limits', '_final_soc',
+        '_fixed_expansion_ratios', '_flow_costs', '_flow_efficiencies',
+        '_flow_emissions', '_flow_gradients', '_flow_rates',
+        '_gradient_costs', '_idle_changes', '_initial_soc',
+        '_initial_status', '_milp', '_number_of_status_changes',
+        '_status_changing_costs', '_status_inertia')
+
     def __init__(self, name, input, output, capacity, *args, **kwargs):
-        self._input = input
-        self._output = output
-        self._interfaces = frozenset((self._input, self._output))
-        self._capacity = capacity
+        object.__setattr__(self, '_input', input)
+        object.__setattr__(self, '_output', output)
+        object.__setattr__(self, '_interfaces', frozenset((input, output)))
+        object.__setattr__(self, '_capacity', capacity)
+
+        super().__init__(name, *args, **kwargs)
 
+    def _create_parameters_and_defaults(self):
         # modify this dict for adding additional parameters
-        self._parameters_and_defaults = {
+        return {
             'singular_values': {
                 'initial_status': es_defaults['initial_status'],
                 'costs_for_being_active': es_defaults[
@@ -3411,8 +3692,6 @@ class Storage(AbstractEsComponent):
             'timeseries': None,
         }
 
-        super().__init__(name, *args, **kwargs)
-
     @property
     def input(self):
         """
@@ -32,16 +32,20 @@ Generator
 Battery
 """
 
+import base64
+import io
 import os
 import pathlib
 import pickle
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
+from xml.sax.saxutils import quoteattr
 
 import h5py
 import networkx as nx
 import numpy as np
 import pandas as pd
 
+from tessif.frused import configurations
 import tessif.frused.namedtuples as nts
 from tessif.frused.paths import write_dir, example_dir
 import tessif.model.components as tessif_components
@@ -50,6 +54,64 @@ from tessif.transform.mapping2es import tsf
 import tessif.transform.nxgrph as nxgrph
 
 
+def _literal(value):
+    """
+    Turn value into a python literal parsable by :func:`ast.literal_eval`.
+
+    Infinite floats are represented by infinity strings, which are replaced
+    when parsing.
+    """
+    if isinstance(value, Mapping):
+        return {_literal(key): _literal(val) for key, val in value.items()}
+    if isinstance(value, (tuple, list, frozenset, set,
+                          np.ndarray, pd.Series)):
+        return tuple(_literal(val) for val in value)
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isinf(value):
+        return '+inf' if value > 0 else '-inf'
+    return value
+
+
+_attached_shared_memory = dict()
+"""
+Shared memory blocks attached to by
+:meth:`AbstractEnergySystem.from_shared_memory`, keyed by their name. Kept
+alive until :meth:`AbstractEnergySystem.close_shared_memory` is called, since
+the rehydrated energy systems' arrays are views on them.
+"""
+
+
+class _SharingPickler(pickle.Pickler):
+    """Pickler collecting numpy arrays instead of pickling them."""
+
+    def __init__(self, file, arrays):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.arrays = arrays
+        self._positions = dict()
+
+    def persistent_id(self, obj):
+        if isinstance(obj, np.ndarray) and not obj.dtype.hasobject:
+            # arrays referenced multiple times are collected only once
+            position = self._positions.get(id(obj))
+            if position is None:
+                position = self._positions[id(obj)] = len(self.arrays)
+                self.arrays.append(obj)
+            return position
+        return None
+
+
+class _SharingUnpickler(pickle.Unpickler):
+    """Unpickler replacing collected numpy arrays with views."""
+
+    def __init__(self, file, views):
+        super().__init__(file)
+        self.views = views
+
+    def persistent_load(self, pid):
+        return self.views[pid]
+
+
 class AbstractEnergySystem:
     """
     Aggregate tessif's abstract components into an energy system.
@@ -822,6 +884,8 @@ class AbstractEnergySystem:
                                 # Uid -> str(Uid)
                                 attribute = f"'{attribute}'"
                             if isinstance(attribute, dict):
+                                # components' mappings are immutable
+                                attribute = dict(attribute)
                                 for key, value in attribute.items():
                                     # float("inf") -> str(float("inf")) inside tuples
                                     if isinstance(value, tuple):
@@ -855,6 +919,338 @@ class AbstractEnergySystem:
                             io_handle.write(f"'{label}' = {attribute}\n")
                         io_handle.write(f"\n")
 
+    def to_xml(self, directory=None, filename=None, timeseries='base64'):
+        """
+        Store (dump) the energy system info as a xml file.
+
+        The file is written element by element and can be read in using
+        :func:`tessif.parse.xml`. Component timeseries are stored as child
+        elements holding binary payloads instead of stringified lists.
+
+        Parameters
+        ----------
+        directory : str, default=None
+            String representing of a path the created energy system is dumped
+            to.
+
+            Will be :func:`joined <os.path.join>` with
+            :paramref:`~to_xml.filename` to create an `absolute path
+            <https://docs.python.org/3.8/library/os.path.html#os.path.abspath>`_.
+
+            If set to ``None`` (default)
+            :attr:`tessif.frused.paths.write_dir`/tsf will be the chosen
+            directory.
+        filename : str, default=None
+            Save the energy system to a xml file with this name.
+
+            If set to ``None`` (default) filename will be
+            ``energy_system.xml``.
+        timeseries : str, default='base64'
+            How component timeseries are stored. One of:
+
+                - ``'base64'``: base64 encoded little endian float64 arrays
+                  embedded into the xml file.
+                - ``'npy'``: rows of a 2 dimensional array stored next to the
+                  xml file as ``<filename>_timeseries.npy``. Referenced rows
+                  are memory mapped when parsed.
+
+        Example
+        -------
+        Using the :attr:`hardcoded fully parameterized example
+        <tessif.examples.data.tsf.py_hard.create_fpwe>`
+
+        >>> import tessif.examples.data.tsf.py_hard as tsf_examples
+        >>> es = tsf_examples.create_fpwe()
+        >>> msg = es.to_xml()
+
+        Default storage location (relative to tessif's :attr:`root directory
+        <tessif.frused.paths.root_dir>`):
+
+        >>> print("Stored Tessif Energy System to", os.path.join(
+        ...    'tessif', *msg.split('tessif')[-1].split(os.path.sep)))
+        Stored Tessif Energy System to tessif/write/tsf/energy_system.xml
+
+        Read it back in:
+
+        >>> from tessif import parse
+        >>> import tessif.frused.configurations as configurations
+        >>> configurations.spellings_logging_level = "debug"
+        >>> parsed_es = AbstractEnergySystem.from_external(
+        ...     path=os.path.join(write_dir, 'tsf', 'energy_system.xml'),
+        ...     parser=parse.xml)
+        >>> print(parsed_es.timeframe.equals(es.timeframe))
+        True
+        >>> for node in parsed_es.sources:
+        ...     print(node.uid.name, node.timeseries)
+        Gas Station None
+        Solar Panel {'electricity': MinMax(min=array([12.,  3.,  7.]), max=array([12.,  3.,  7.]))}
+        """
+        # Set default directory if necessary
+        if not directory:
+            d = os.path.join(write_dir, 'tsf')
+        else:
+            d = directory
+
+        # create output directory if necessary
+        pathlib.Path(os.path.abspath(d)).mkdir(
+            parents=True, exist_ok=True)
+
+        # Set default filename if necessary
+        if not filename:
+            f = 'energy_system.xml'
+        else:
+            f = filename
+
+        if timeseries not in ('base64', 'npy'):
+            raise ValueError(
+                "timeseries must be one of 'base64', 'npy', not {}".format(
+                    repr(timeseries)))
+
+        npy_file = os.path.splitext(f)[0] + '_timeseries.npy'
+        npy_rows = list()
+
+        def attributes(mapping):
+            """Format mapping as xml attributes of literal python values."""
+            return ''.join(
+                ' {}={}'.format(key, quoteattr(repr(_literal(value))))
+                for key, value in mapping.items())
+
+        def bound(tag, value):
+            """Format the min or max element of a timeseries element."""
+            if np.ndim(value) == 0:
+                return '<{}{}/>'.format(tag, attributes({'value': value}))
+
+            values = np.asarray(value, dtype='<f8')
+            if timeseries == 'npy':
+                npy_rows.append(values)
+                return '<{} file={} row="{}"/>'.format(
+                    tag, quoteattr(npy_file), len(npy_rows) - 1)
+
+            return '<{} encoding="base64" dtype="&lt;f8">{}</{}>'.format(
+                tag, base64.b64encode(values.tobytes()).decode('ascii'), tag)
+
+        with open(os.path.join(d, f), 'w', encoding='utf-8') as xml_file:
+            xml_file.write(
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                '<energy_system>\n')
+
+            for es_attr in self._es_attributes:
+                xml_file.write('    <{}>\n'.format(es_attr))
+
+                if es_attr == 'timeframe':
+                    timeframe = {
+                        'start': self.timeframe[0].strftime(
+                            '%m/%d/%Y, %H:%M:%S'),
+                        'periods': len(self.timeframe)}
+                    # timeframes without a set frequency fall back to the
+                    # inferred one and leave it out if there is none
+                    freq = (self.timeframe.freqstr
+                            or self.timeframe.inferred_freq)
+                    if freq is not None:
+                        timeframe['freq'] = freq
+                    xml_file.write('        <primary{}/>\n'.format(
+                        attributes(timeframe)))
+
+                elif es_attr == 'global_constraints':
+                    xml_file.write('        <primary{}/>\n'.format(
+                        attributes(self.global_constraints)))
+
+                else:
+                    for position, node in enumerate(getattr(self, es_attr)):
+                        parameters = node.uid._asdict()
+                        side_elements = dict()
+                        for label, attribute in node.attributes.items():
+                            if label == 'uid':
+                                continue
+                            # timeseries are stored as child elements
+                            if label == 'timeseries' and attribute:
+                                side_elements[label] = attribute
+                            else:
+                                parameters[label] = attribute
+
+                        tag = '{}_{}'.format(
+                            type(node).__name__.lower(), position)
+                        xml_file.write('        <{}{}'.format(
+                            tag, attributes(parameters)))
+
+                        if not side_elements:
+                            xml_file.write('/>\n')
+                            continue
+
+                        xml_file.write('>\n')
+                        for label, mapping in side_elements.items():
+                            for interface, (minimum, maximum) in (
+                                    mapping.items()):
+                                xml_file.write(
+                                    '            <{} interface={}>\n'.format(
+                                        label, quoteattr(interface)))
+                                xml_file.write(
+                                    '                {}\n'.format(
+                                        bound('min', minimum)))
+                                xml_file.write(
+                                    '                {}\n'.format(
+                                        bound('max', maximum)))
+                                xml_file.write(
+                                    '            </{}>\n'.format(label))
+                        xml_file.write('        </{}>\n'.format(tag))
+
+                xml_file.write('    </{}>\n'.format(es_attr))
+
+            xml_file.write('</energy_system>\n')
+
+        if npy_rows:
+            np.save(os.path.join(d, npy_file), np.stack(npy_rows))
+
+        msg = 'Stored Tessif Energy System in {}'.format(
+            os.path.join(d, f))
+
+        return msg
+
+    def to_parquet(self, directory=None):
+        """
+        Store (dump) the energy system info as a folder of parquet files.
+
+        Each :ref:`energy system component <Models_Tessif_Concept_ESC>` type
+        is stored as its own table (e.g. ``sinks.parquet``) holding a row for
+        each component and a column for each parameter. Parameter values are
+        stored as python literals.
+
+        Timeseries are stored as float64 columns of a single wide
+        ``timeseries.parquet`` table aligned to the :attr:`timeframe`. Columns
+        are named ``{uid}.{interface}.{min|max}`` (using the
+        :attr:`~tessif.frused.configurations.timeseries_seperator`), which is
+        what the components' timeseries parameter refers to.
+
+        Use :func:`tessif.parse.parquet` to read in only some of the
+        components, parameters and timeseries.
+
+        Parameters
+        ----------
+        directory : str, ~pathlib.Path, default=None
+            Path/String representation of a path the created parquet files are
+            stored in.
+
+            If set to ``None`` (default)
+            :attr:`tessif.frused.paths.write_dir`/tsf/parquet will be the
+            chosen directory.
+
+            Directory created if not present.
+
+        Example
+        -------
+        Using the :attr:`hardcoded fully parameterized example
+        <tessif.examples.data.tsf.py_hard.create_fpwe>`
+
+        >>> import tessif.examples.data.tsf.py_hard as tsf_examples
+        >>> es = tsf_examples.create_fpwe()
+        >>> msg = es.to_parquet()
+
+        Default storage location (relative to tessif's :attr:`root directory
+        <tessif.frused.paths.root_dir>`):
+
+        >>> print("Stored Tessif Energy System to", os.path.join(
+        ...    'tessif', *msg.split('tessif')[-1].split(os.path.sep)))
+        Stored Tessif Energy System to tessif/write/tsf/parquet
+
+        Timeseries are referenced by the components:
+
+        >>> import pyarrow.parquet as pq
+        >>> sources = pq.read_table(
+        ...     os.path.join(write_dir, 'tsf', 'parquet', 'sources.parquet'),
+        ...     columns=['name', 'timeseries'])
+        >>> for name, timeseries in zip(*sources.to_pydict().values()):
+        ...     print(name, timeseries)
+        'Gas Station' None
+        'Solar Panel' {'electricity': ('Solar Panel.electricity.min', 'Solar Panel.electricity.max')}
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as error:
+            raise ImportError(
+                "Writing parquet files requires pyarrow. Install it using "
+                "'pip install tessif-phd[parquet]'.") from error
+
+        # Set default directory if necessary
+        if not directory:
+            d = os.path.join(write_dir, 'tsf', 'parquet')
+        else:
+            d = directory
+
+        # create output directory if necessary
+        pathlib.Path(os.path.abspath(d)).mkdir(
+            parents=True, exist_ok=True)
+
+        # wide timeseries table, aligned to the timeframe
+        timeseries = {'timeframe': self.timeframe.values}
+        seperator = configurations.timeseries_seperator
+
+        for es_attr in self._es_attributes:
+            if es_attr in ('timeframe', 'global_constraints'):
+                continue
+
+            path = os.path.join(d, '{}.parquet'.format(es_attr))
+            nodes = tuple(getattr(self, es_attr))
+
+            # remove tables of previous dumps to the same directory
+            if not nodes:
+                if os.path.isfile(path):
+                    os.remove(path)
+                continue
+
+            rows = list()
+            for node in nodes:
+                row = node.uid._asdict()
+                for label, attribute in node.attributes.items():
+                    if label == 'uid':
+                        continue
+
+                    # move timeseries into the wide table and refer to them
+                    if label == 'timeseries' and attribute:
+                        references = dict()
+                        for interface, bounds in attribute.items():
+                            bound_references = list()
+                            for tag, bound in zip(('min', 'max'), bounds):
+                                if np.ndim(bound) == 0:
+                                    bound_references.append(bound)
+                                    continue
+
+                                column = seperator.join(
+                                    [str(node.uid), interface, tag])
+                                timeseries[column] = np.asarray(
+                                    bound, dtype=np.float64)
+                                bound_references.append(column)
+                            references[interface] = tuple(bound_references)
+                        attribute = references
+
+                    row[label] = attribute
+                rows.append(row)
+
+            columns = dict.fromkeys(label for row in rows for label in row)
+            pq.write_table(
+                pa.table({
+                    column: [repr(_literal(row.get(column))) for row in rows]
+                    for column in columns}),
+                path)
+
+        pq.write_table(
+            pa.table({
+                key: [repr(_literal(value))] for key, value in {
+                    'global_constraints': 'primary',
+                    **self.global_constraints}.items()}),
+            os.path.join(d, 'global_constraints.parquet'))
+
+        # timeseries are stored uncompressed for cheap memory mapped reads
+        timeseries_table = pa.table(timeseries).replace_schema_metadata(
+            {'freq': self.timeframe.freq.name if self.timeframe.freq else ''})
+        pq.write_table(
+            timeseries_table, os.path.join(d, 'timeseries.parquet'),
+            compression='none')
+
+        msg = 'Stored Tessif Energy System in {}'.format(d)
+
+        return msg
+
     def restore(self, directory=None, filename=None):
         """
         Restore a dumped energy system ``directory.filename``.
@@ -936,6 +1332,169 @@ class AbstractEnergySystem:
 
         return msg
 
+    def to_shared_memory(self):
+        """
+        Place the energy system into shared memory for handing it to worker
+        processes.
+
+        All numpy arrays of the energy system (most notably the components'
+        timeseries) are copied into a single
+        :class:`~multiprocessing.shared_memory.SharedMemory` block. The
+        returned :class:`~tessif.frused.namedtuples.SharedEnergySystem` holds
+        the pickled rest of the energy system and describes where its arrays
+        are located. It is cheap to pickle and can be send to any number of
+        worker processes, which rehydrate the energy system using
+        :meth:`from_shared_memory` without copying the arrays.
+
+        Requires python 3.8 or newer.
+
+        Return
+        ------
+        block: ~multiprocessing.shared_memory.SharedMemory
+            Shared memory block holding the arrays. Call its
+            :meth:`~multiprocessing.shared_memory.SharedMemory.close` and
+            :meth:`~multiprocessing.shared_memory.SharedMemory.unlink`
+            methods once the workers are done.
+        shared: ~tessif.frused.namedtuples.SharedEnergySystem
+            Lightweight handle to be send to the worker processes.
+
+        Example
+        -------
+        Using the :attr:`hardcoded fully parameterized example
+        <tessif.examples.data.tsf.py_hard.create_fpwe>`
+
+        >>> import tessif.examples.data.tsf.py_hard as tsf_examples
+        >>> es = tsf_examples.create_fpwe()
+        >>> block, shared = es.to_shared_memory()
+
+        Rehydrate the energy system (usually inside a worker process):
+
+        >>> shared_es = AbstractEnergySystem.from_shared_memory(shared)
+        >>> for node in shared_es.sources:
+        ...     print(node.uid.name, node.timeseries)
+        Gas Station None
+        Solar Panel {'electricity': MinMax(min=array([12.,  3.,  7.]), max=array([12.,  3.,  7.]))}
+
+        Detach from the block once the rehydrated energy system is no longer
+        needed (usually at the end of the worker process):
+
+        >>> del shared_es, node
+        >>> AbstractEnergySystem.close_shared_memory(shared)
+
+        Release the shared memory block, once all workers are done:
+
+        >>> block.close()
+        >>> block.unlink()
+        """
+        from multiprocessing import shared_memory
+
+        arrays = list()
+        skeleton = io.BytesIO()
+        _SharingPickler(skeleton, arrays).dump(self.__dict__)
+
+        # locate the arrays inside the block, aligned to 64 bytes
+        descriptors, size = list(), 0
+        for array in arrays:
+            offset = -(-size // 64) * 64
+            descriptors.append((offset, array.dtype.str, array.shape))
+            size = offset + array.nbytes
+
+        block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for array, (offset, dtype, shape) in zip(arrays, descriptors):
+            np.ndarray(shape, dtype=dtype, buffer=block.buf,
+                       offset=offset)[...] = array
+
+        shared = nts.SharedEnergySystem(
+            name=block.name,
+            arrays=tuple(descriptors),
+            skeleton=skeleton.getvalue())
+
+        return block, shared
+
+    @classmethod
+    def from_shared_memory(cls, shared):
+        """
+        Rehydrate an energy system placed in shared memory.
+
+        The energy system's arrays are read only views on the shared memory
+        block. So any number of processes rehydrating the same energy system
+        do not multiply the memory needed for its timeseries.
+
+        Parameters
+        ----------
+        shared: ~tessif.frused.namedtuples.SharedEnergySystem
+            Handle of the energy system as returned by
+            :meth:`to_shared_memory`.
+
+        Return
+        ------
+        es: AbstractEnergySystem
+            The rehydrated energy system.
+
+        Note
+        ----
+        See :meth:`to_shared_memory's <AbstractEnergySystem.to_shared_memory>`
+        Example on how the energy system got there in the first place.
+
+        The block stays attached to, until :meth:`close_shared_memory` is
+        called.
+        """
+        from multiprocessing import shared_memory
+
+        block = _attached_shared_memory.get(shared.name)
+        if block is None:
+            block = shared_memory.SharedMemory(name=shared.name)
+            _attached_shared_memory[shared.name] = block
+
+        # views are derived from an array exporting the block's buffer, so
+        # the block can't be closed as long as any of them is alive
+        buffer = np.frombuffer(block.buf, dtype=np.uint8)
+        views = list()
+        for offset, dtype, shape in shared.arrays:
+            dtype = np.dtype(dtype)
+            view = buffer[offset:offset + dtype.itemsize * int(
+                np.prod(shape))].view(dtype).reshape(shape)
+            view.flags.writeable = False
+            views.append(view)
+
+        es = cls('Shared')
+        es.__dict__ = _SharingUnpickler(
+            io.BytesIO(shared.skeleton), views).load()
+
+        return es
+
+    @staticmethod
+    def close_shared_memory(shared):
+        """
+        Detach from the shared memory block attached to by
+        :meth:`from_shared_memory`.
+
+        Does not free the block itself, which is done by the process that
+        created it using :meth:`to_shared_memory`. Does nothing if the block
+        is not attached to.
+
+        Parameters
+        ----------
+        shared: ~tessif.frused.namedtuples.SharedEnergySystem
+            Handle of the energy system as returned by
+            :meth:`to_shared_memory`.
+
+        Raises
+        ------
+        BufferError
+            If energy systems rehydrated from the block are still alive. Their
+            arrays would be left pointing to released memory otherwise.
+        """
+        block = _attached_shared_memory.pop(shared.name, None)
+        if block is None:
+            return
+
+        try:
+            block.close()
+        except BufferError:
+            _attached_shared_memory[shared.name] = block
+            raise
+
     @classmethod
     def from_pickle(cls, directory=None, filename=None):
         """
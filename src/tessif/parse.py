@@ -27,16 +27,21 @@ from tessif.frused.defaults import energy_system_nodes as esn_defs
 from tessif.write import log
 import tessif.frused.defaults as defaults
 import ast
+import base64
+import concurrent.futures
 import configparser
 import collections
+import pickle
 import xml.etree.ElementTree as ET
+import zipfile
 import h5py
 logger = logging.getLogger(__name__)
 
 
 @log.timings
 def flat_config_folder(folder, timeframe='primary',
-                       global_constraints='primary', **kwargs):
+                       global_constraints='primary', cache=True,
+                       sidecar=False, workers=None, **kwargs):
     """Parse config files inside folder into a dict of pandas.DataFrames.
 
     Read in flat :any:`mappings <dict>` in `configuration file format
@@ -71,6 +76,28 @@ def flat_config_folder(folder, timeframe='primary',
         to be tweaked arbitrarily (e.g. pass ``'global_constraints_1'`` if the
         corresponding section header is named ``'global_constraints_1'``)
 
+    cache: bool, default=True
+        If ``True``, parsed component files are cached in binary form keyed
+        by their path, modification time and size. Unchanged files are not
+        parsed again when the folder is read in repeatedly.
+
+    sidecar: bool, str, ~pathlib.Path, default=False
+        Persist the parse cache as binary sidecar file so it outlives the
+        current python session. If ``True``, the sidecar is stored as
+        ``.parse_cache.npz`` inside :paramref:`~flat_config_folder.folder`.
+        The sidecar holds the timeseries as arrays and the remaining
+        parameters as python literals, so it is read without unpickling.
+        Pass a path to store it elsewhere. Failing to write the sidecar
+        (e.g. due to a read only folder) is silently ignored.
+
+        Only used if :paramref:`~flat_config_folder.cache` is ``True``.
+
+    workers: int, default=None
+        Number of processes used for parsing the component files not found
+        in the cache. Files are parsed serially if ``None`` (default) or
+        ``1``. Only pays off for folders holding large files, like ones
+        storing long timeseries.
+
     kwargs:
         warning
         -------
@@ -90,6 +117,9 @@ def flat_config_folder(folder, timeframe='primary',
     For more on flat config data formats see :ref:`Flat Configuration Files
     <SupportedDataFormats_FlatConfigurationFiles>`
 
+    Timeseries are returned as read only :class:`numpy.ndarray` objects of
+    dtype ``float64``, which are stored in the cache as is.
+
     Example
     -------
     Read in tessif's :ref:`fully parameterized working example
@@ -113,44 +143,26 @@ def flat_config_folder(folder, timeframe='primary',
     component_names = \
         spellings.energy_system_component_identifiers.component.keys()
 
-    # create the initial mapping
-    mapping = collections.OrderedDict()
-
-    # iterate through component
+    # map each component to its configuration file, last one found wins
+    component_files = dict()
     for component in component_names:
-
-        # iterate through each configuration file
         for configuration_file in configuration_files:
-
             config_file_name = os.path.basename(configuration_file)
             # accept any spelling of component as found in frused.spellings
             if any(variation in config_file_name for variation in getattr(
                     spellings, component)):
-                # allow separate iteration by individually creating parsers:
-                config = configparser.ConfigParser()
-                config.read(configuration_file)
+                component_files[component] = configuration_file
 
-                # mapping holding individual entities for each component
-                entities = {}
-                for component_entity in config.sections():
+    # parse each component file once, respecting the cache
+    parsed_files = _read_config_files(
+        set(component_files.values()), cache=cache, sidecar=(
+            _flat_config_sidecar(folder, sidecar) if cache else None),
+        workers=workers)
 
-                    # mapping holding the entities parameters
-                    parameters = {}
-
-                    for parameter, value in config.items(component_entity):
-                        param = ast.literal_eval(parameter)
-                        val = ast.literal_eval(value)
-
-                        if param == "timeseries":
-                            if val:
-                                val = _unstringify_timeseries(val)
-
-                        parameters[param] = val
-
-                    # fill the entities mapping with the parameters dict
-                    entities[component_entity] = parameters
-                # fill the energy system mapping with the components
-                mapping[component] = entities
+    # create the initial mapping, each component gets its own entities
+    mapping = collections.OrderedDict(
+        (component, pickle.loads(parsed_files[configuration_file]))
+        for component, configuration_file in component_files.items())
 
     # optimizatin time span parsing is handled separately
     # because it's a 'one column' DF
@@ -198,6 +210,200 @@ def flat_config_folder(folder, timeframe='primary',
                           global_constraints=global_constraints)
 
 
+_flat_config_cache = collections.OrderedDict()
+"""
+Binary parse results of :func:`flat_config_folder`'s component files, keyed
+by their absolute path. Mapped to the file's modification time and size
+as well as its pickled entities. Ordered from the least to the most recently
+used file.
+"""
+
+_flat_config_cache_size = 128
+"""
+Number of component files kept in :attr:`_flat_config_cache`. The least
+recently used ones are dropped first.
+"""
+
+
+def _flat_config_sidecar(folder, sidecar):
+    """Return the path of the binary sidecar storing the parse cache."""
+    if sidecar is True:
+        return os.path.join(os.path.abspath(folder), '.parse_cache.npz')
+    if sidecar:
+        return os.path.abspath(sidecar)
+    return None
+
+
+def _cache_config_file(path, entry):
+    """Cache entry of path, dropping the least recently used files."""
+    _flat_config_cache[path] = entry
+    _flat_config_cache.move_to_end(path)
+    while len(_flat_config_cache) > _flat_config_cache_size:
+        _flat_config_cache.popitem(last=False)
+
+
+def _write_sidecar(sidecar, stamps, parsed):
+    """
+    Store the parsed entities as :func:`numpy.savez` archive.
+
+    Timeseries are stored as arrays, the remaining entities as a python
+    literal, so reading the sidecar never unpickles (i.e. executes) anything.
+    """
+    index, arrays = {}, {}
+    for path, stamp in stamps.items():
+        entities = pickle.loads(parsed[path])
+        timeseries = {}
+        for entity, parameters in entities.items():
+            for key, bounds in (parameters.get('timeseries') or {}).items():
+                if not isinstance(bounds, tuple):
+                    continue
+                bounds = list(bounds)
+                for position, bound in enumerate(bounds):
+                    if isinstance(bound, np.ndarray):
+                        name = 'timeseries_{}'.format(len(arrays))
+                        arrays[name] = bound
+                        timeseries[(entity, key, position)] = name
+                        bounds[position] = None
+                parameters['timeseries'][key] = tuple(bounds)
+        index[path] = (stamp, repr(entities), timeseries)
+
+    temporary = sidecar + '.tmp'
+    with open(temporary, 'wb') as sidecar_file:
+        np.savez(sidecar_file, index=np.array(repr(index)), **arrays)
+    os.replace(temporary, sidecar)
+
+
+def _read_sidecar(sidecar, stamps):
+    """
+    Return the still valid entries of the sidecar written by
+    :func:`_write_sidecar`, keyed by the paths in stamps.
+    """
+    entries = {}
+    with np.load(sidecar, allow_pickle=False) as archive:
+        index = ast.literal_eval(str(archive['index']))
+        for path, (stamp, entities, timeseries) in index.items():
+            if stamps.get(path) != stamp:
+                continue
+            try:
+                entities = ast.literal_eval(entities)
+            except (ValueError, SyntaxError):
+                # e.g. infinite floats, which have no literal
+                continue
+            for (entity, key, position), name in timeseries.items():
+                bounds = list(entities[entity]['timeseries'][key])
+                bounds[position] = _read_only_timeseries(archive[name])
+                entities[entity]['timeseries'][key] = tuple(bounds)
+            entries[path] = (stamp, pickle.dumps(
+                entities, protocol=pickle.HIGHEST_PROTOCOL))
+
+    return entries
+
+
+def _parse_config_file(configuration_file):
+    """
+    Parse a flat configuration file into a pickled mapping of its entities.
+
+    Keys and values are literally evaluated. Timeseries are turned into read
+    only float arrays to be stored in binary form.
+    """
+    config = configparser.ConfigParser()
+    config.read(configuration_file)
+
+    # mapping holding individual entities for each component
+    entities = {}
+    for component_entity in config.sections():
+
+        # mapping holding the entities parameters
+        parameters = {}
+
+        for parameter, value in config.items(component_entity):
+            param = ast.literal_eval(parameter)
+            val = ast.literal_eval(value)
+
+            if param == "timeseries":
+                if val:
+                    val = _unstringify_timeseries(val)
+                    val = {key: tuple(_read_only_timeseries(bound)
+                                      for bound in bounds)
+                           if isinstance(bounds, tuple) else bounds
+                           for key, bounds in val.items()}
+
+            parameters[param] = val
+
+        # fill the entities mapping with the parameters dict
+        entities[component_entity] = parameters
+
+    return pickle.dumps(entities, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _read_only_timeseries(values):
+    """Turn a sequence of numbers into a read only float64 array."""
+    if np.ndim(values) == 0:
+        return values
+
+    values = np.array(values, dtype=np.float64)
+    values.flags.writeable = False
+    return values
+
+
+def _read_config_files(configuration_files, cache=True, sidecar=None,
+                       workers=None):
+    """
+    Return a mapping of configuration files to their pickled entities.
+
+    Files that changed since they were cached, or were never cached, are
+    parsed using :func:`_parse_config_file`. Optionally distributed among
+    multiple processes.
+    """
+    stamps = {}
+    for configuration_file in configuration_files:
+        status = os.stat(configuration_file)
+        stamps[os.path.abspath(configuration_file)] = (
+            status.st_mtime_ns, status.st_size)
+
+    if cache and sidecar and os.path.isfile(sidecar):
+        try:
+            persisted = _read_sidecar(sidecar, stamps)
+        except (OSError, ValueError, SyntaxError, KeyError, TypeError,
+                zipfile.BadZipFile):
+            persisted = {}
+
+        for path, entry in persisted.items():
+            if path not in _flat_config_cache:
+                _cache_config_file(path, entry)
+
+    parsed, outdated = {}, []
+    for path, stamp in stamps.items():
+        cached = _flat_config_cache.get(path) if cache else None
+        if cached is not None and cached[0] == stamp:
+            parsed[path] = cached[1]
+            _flat_config_cache.move_to_end(path)
+        else:
+            outdated.append(path)
+
+    if workers and workers > 1 and len(outdated) > 1:
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers) as executor:
+            parsed.update(zip(
+                outdated, executor.map(_parse_config_file, outdated)))
+    else:
+        parsed.update(
+            (path, _parse_config_file(path)) for path in outdated)
+
+    if cache:
+        for path in outdated:
+            _cache_config_file(path, (stamps[path], parsed[path]))
+
+        if sidecar and outdated:
+            try:
+                _write_sidecar(sidecar, stamps, parsed)
+            except OSError:
+                pass
+
+    return {configuration_file: parsed[os.path.abspath(configuration_file)]
+            for configuration_file in configuration_files}
+
+
 def python_file(path):
     """Import a python file from path using python."""
 
@@ -590,6 +796,31 @@ def xml(path, timeframe='primary', global_constraints='primary', **kwargs):
     For more on xml see :ref:`.xml
     <SupportedDataFormats_Xml>`
 
+    The file is read using :func:`~xml.etree.ElementTree.iterparse` and each
+    entity is discarded after being parsed. Hence large files are read in
+    bounded memory.
+
+    Mapping like parameters holding timeseries may be stored as child
+    elements of an entity instead of stringified lists. Each child element
+    is named after the parameter, states the ``interface`` and holds a
+    ``min`` and ``max`` element. These hold either a base64 encoded array
+    (``dtype`` defaults to little endian float64), reference an adjacent
+    ``.npy`` file (``file`` relative to the xml file, optionally selecting a
+    ``row`` of a 2 dimensional array) or a literal ``value``. A missing
+    ``min`` or ``max`` element defaults to ``0`` or ``inf`` respectively::
+
+        <solar_panel name="'Solar Panel'" outputs="('electricity',)">
+            <timeseries interface="electricity">
+                <min encoding="base64">AAAAAAAAKEA...</min>
+                <max file="fpwe_timeseries.npy" row="0"/>
+            </timeseries>
+        </solar_panel>
+
+    As written by :meth:`AbstractEnergySystem.to_xml
+    <tessif.model.energy_system.AbstractEnergySystem.to_xml>`. Referenced
+    ``.npy`` files are memory mapped while parsing and the referenced rows
+    are copied, so no file stays mapped afterwards.
+
     Example
     -------
     Read in tessif's :ref:`fully parameterized working example
@@ -603,68 +834,98 @@ def xml(path, timeframe='primary', global_constraints='primary', **kwargs):
     >>> print(type(es_dict))
     <class 'collections.OrderedDict'>
     """
-    # Parse xml file into element tree
-    element_tree = ET.parse(path)
-    root_element = element_tree.getroot()
-
-    # Figure out the component names by looking it up in spellings
+    # Map the spelling variations to the energy system components
     component_names = spellings.energy_system_component_identifiers.component.keys()
+    variations = {
+        variation: component for component in component_names
+        for variation in getattr(spellings, component)}
+    timeframe_variations = set(getattr(spellings, 'timeframe'))
+    constraints_variations = set(getattr(spellings, 'global_constraints'))
+
+    # entities parsed for each component variation, first section wins
+    parsed_components = dict()
+    timeframe_element_attributes = dict()
+    constraints_element_attributes = dict()
+
+    # adjacent .npy files are loaded only once
+    npy_files = dict()
+    directory = os.path.dirname(os.path.abspath(path))
+
+    depth = 0
+    section, entities = None, None
+    for event, element in ET.iterparse(path, events=('start', 'end')):
+        if event == 'start':
+            depth += 1
+            if depth == 2:
+                section, entities = element.tag, dict()
+            continue
+
+        depth -= 1
+        if depth == 2:
+            # entity elements, parse their attributes and children
+            if section in variations:
+                parameters = {
+                    parameter: ast.literal_eval(value)
+                    for parameter, value in element.attrib.items()}
+
+                for child in element:
+                    parameters.setdefault(child.tag, dict())[
+                        child.get('interface')] = tuple(
+                            _parse_xml_timeseries_bound(
+                                child.find(bound), directory, npy_files,
+                                default)
+                            for bound, default in (
+                                ('min', 0.0), ('max', float('+inf'))))
+
+                entities[element.tag] = parameters
+
+            # first occurence of a timeframe or constraints set wins
+            elif section in timeframe_variations and element.tag == timeframe:
+                timeframe_element_attributes.setdefault(
+                    section, dict(element.attrib))
+            elif section in constraints_variations and (
+                    element.tag == global_constraints):
+                constraints_element_attributes.setdefault(
+                    section, dict(element.attrib))
+
+            # discard the parsed entity to keep memory bounded
+            element.clear()
+
+        elif depth == 1:
+            if entities and section not in parsed_components:
+                parsed_components[section] = entities
+            section, entities = None, None
+            element.clear()
 
     # create the initial mapping
     mapping = collections.OrderedDict()
 
-    # iterate through components
+    # map the found component sections in order of their identifiers
     for component in component_names:
-
-        # find component in element tree
         for variation in getattr(spellings, component):
-            if root_element.find(variation):
-
-                # mapping holding individual entities for each component
-                entities = {}
-
-                # iterate through the component's entities
-                for component_entity in root_element.find(variation):
-
-                    # mapping holding the entities parameters
-                    parameters = {}
-
-                    # iterate through the entities parameters and add them to
-                    # the parameters dict
-                    for parameter, value in component_entity.attrib.items():
-                        parameters[parameter] = ast.literal_eval(value)
-
-                    # fill the entities mapping with the parameters dict
-                    entities[component_entity.tag] = parameters
-
-                # fill the energy system mapping with the components
-                mapping[component] = entities
+            if variation in parsed_components:
+                mapping[component] = parsed_components[variation]
 
     # timeseries parsing is handled seperately because it's a 'one column' DF
     for variation in getattr(spellings, 'timeframe'):
-        if root_element.find(variation):
-
-            # create variable pointing to the element containing the timeframe
-            timeframe_element = root_element.find(variation).find(timeframe)
+        if variation in timeframe_element_attributes:
+            timeframe_element = timeframe_element_attributes[variation]
 
             # create the 'timeseries': DateTimeIndex mapping
+            freq = timeframe_element.get('freq')
             mapping['timeframe'] = {timeframe: pd.date_range(
                 start=ast.literal_eval(timeframe_element.get('start')),
                 periods=ast.literal_eval(timeframe_element.get('periods')),
-                freq=ast.literal_eval(timeframe_element.get('freq')))}
+                freq=ast.literal_eval(freq) if freq is not None else None)}
 
     # global constraints parsing ist also handled seperately
     for variation in getattr(spellings, 'global_constraints'):
-        if root_element.find(variation):
-
-            # create variable pointing to the element containing the
-            # global_constraints
-            constraints_element = root_element.find(
-                variation).find(global_constraints)
+        if variation in constraints_element_attributes:
 
             # create the constraints mapping
             glob_consts = dict()
-            for key, value in constraints_element.items():
+            for key, value in constraints_element_attributes[
+                    variation].items():
                 value = ast.literal_eval(value)
                 if value == '+inf':
                     value = float(value)
@@ -673,15 +934,41 @@ def xml(path, timeframe='primary', global_constraints='primary', **kwargs):
             mapping['global_constraints'] = {
                 global_constraints: glob_consts}
 
-            # mapping['global_constraints'] = {
-            #     global_constraints: {
-            #         key: ast.literal_eval(value)
-            #         for key, value in constraints_element.items()}}
-
     return python_mapping(mapping, timeframe=timeframe,
                           global_constraints=global_constraints)
 
 
+def _parse_xml_timeseries_bound(element, directory, npy_files, default):
+    """
+    Parse the ``min`` or ``max`` element of an xml timeseries parameter.
+
+    Returns the base64 decoded array, a copy of the (row of the) memory
+    mapped ``.npy`` file or the literal value stated by the element.
+    Returns ``default`` if the element is missing.
+    """
+    if element is None:
+        return default
+
+    if element.get('file') is not None:
+        file_path = os.path.join(directory, element.get('file'))
+        if file_path not in npy_files:
+            npy_files[file_path] = np.load(file_path, mmap_mode='r')
+        values = npy_files[file_path]
+
+        if element.get('row') is not None:
+            values = values[int(element.get('row'))]
+
+        # copy, so the parsed timeseries don't keep the file mapped
+        return np.array(values)
+
+    if element.get('encoding') == 'base64':
+        return np.frombuffer(
+            base64.b64decode(element.text or ''),
+            dtype=np.dtype(element.get('dtype', '<f8')))
+
+    return ast.literal_eval(element.get('value'))
+
+
 def hdf5(path, timeframe='primary', global_constraints='primary', **kwargs):
     """Parse hdf5 file into a dict of pandas.DataFrames.
 
@@ -831,6 +1118,217 @@ def hdf5(path, timeframe='primary', global_constraints='primary', **kwargs):
                           global_constraints=global_constraints)
 
 
+def parquet(folder, timeframe='primary', global_constraints='primary',
+            components=None, parameters=None, memory_map=True, **kwargs):
+    """Parse a folder of parquet files into a dict of pandas.DataFrames.
+
+    Read in energy systems stored as `parquet
+    <https://parquet.apache.org/>`_ tables and transform them into
+    :class:`pandas.DataFrame` objects keyed by their :ref:`energy system
+    components <Models_Tessif_Concept_ESC>` (i.e. 'sources', 'busses',
+    etc..). As well as a :class:`pandas.DataFrame` object keyed by
+    :attr:`~tessif.frused.spellings.timeframe`.
+
+    Parameters
+    ----------
+    folder: ~pathlib.Path, str
+        Path or string representation of a path specifying a folder containing
+        parquet files as written by :meth:`AbstractEnergySystem.to_parquet
+        <tessif.model.energy_system.AbstractEnergySystem.to_parquet>`.
+
+    timeframe: str, default='primary'
+        String the stored timeframe is mapped to. Parquet folders store a
+        single timeframe.
+
+    global_constraints: str, default='primary'
+        String specifying which of the (potentially multiple) set of
+        constraints stored is to be used. Expected to correspond with the
+        ``global_constraints`` column of the global constraints table.
+
+    components: ~collections.abc.Iterable, default=None
+        Iterable of :ref:`energy system component identifiers
+        <Models_Tessif_Concept_ESC>` (or any of their spellings, e.g.
+        ``'sinks'``) to be read in. All components are read in if ``None``
+        (default).
+
+    parameters: ~collections.abc.Iterable, default=None
+        Iterable of parameter names to be read in for each component,
+        additionally to its name. Only the stored columns are read from disk.
+        All parameters are read in if ``None`` (default).
+
+        Only the timeseries referenced by the parameters read in are read from
+        the timeseries table.
+
+    memory_map: bool, default=True
+        Memory map the parquet files instead of reading them into memory.
+
+    kwargs:
+        warning
+        -------
+        Not implemented yet.
+
+    Return
+    ------
+    mapping: :class:`~collections.abc.Mapping`
+        of :class:`DataFrames<pandas.DataFrame>` to their
+        :ref:`energy system component identifier
+        <Models_Tessif_Concept_ESC>` ('sources', 'storages' etc..)
+        As well as a singular :class:`~pandas.DataFrame` mapped to
+        :attr:`~tessif.frused.spellings.timeframe`.
+
+    Note
+    ----
+    For more on parquet see :ref:`.parquet
+    <SupportedDataFormats_Parquet>`
+
+    Example
+    -------
+    Store tessif's :ref:`fully parameterized working example
+    <Models_Tessif_Fpwe>` in parquet format:
+
+    >>> import os
+    >>> import tempfile
+    >>> import tessif.examples.data.tsf.py_hard as tsf_examples
+    >>> import tessif.parse as parse
+    >>> tempdir = tempfile.TemporaryDirectory()
+    >>> folder = tempdir.name
+    >>> msg = tsf_examples.create_fpwe().to_parquet(folder)
+
+    Read it in completely:
+
+    >>> es_dict = parse.parquet(folder)
+    >>> print(type(es_dict))
+    <class 'collections.OrderedDict'>
+
+    Or only read in the sources' timeseries:
+
+    >>> es_dict = parse.parquet(
+    ...     folder, components=['sources'], parameters=['timeseries'])
+    >>> print(list(es_dict.keys()))
+    ['source', 'timeframe', 'global_constraints']
+    >>> print(es_dict['source'].loc['Solar Panel', 'timeseries'])
+    {'electricity': (array([12.,  3.,  7.]), array([12.,  3.,  7.]))}
+
+    Remove the temporary folder again:
+
+    >>> tempdir.cleanup()
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as error:
+        raise ImportError(
+            "Reading parquet files requires pyarrow. Install it using "
+            "'pip install tessif-phd[parquet]'.") from error
+
+    # map the file stems to the parquet files found
+    tables = {
+        os.path.splitext(f)[0]: os.path.join(folder, f)
+        for f in os.listdir(os.path.abspath(folder))
+        if f.endswith('.parquet')}
+
+    # Figure out the component names by looking it up in spellings
+    component_names = \
+        spellings.energy_system_component_identifiers.component.keys()
+
+    # create the initial mapping
+    mapping = collections.OrderedDict()
+
+    # timeseries columns referenced by the parsed components
+    references = dict()
+
+    for component in component_names:
+        variations = getattr(spellings, component)
+        if components is not None and not any(
+                selected == component or selected in variations
+                for selected in components):
+            continue
+
+        for variation in variations:
+            if variation not in tables:
+                continue
+
+            # only read the requested columns of the component table
+            columns = None
+            if parameters is not None:
+                columns = [
+                    column for column in pq.read_schema(tables[variation]).names
+                    if column == 'name' or column in parameters]
+
+            records = pq.read_table(
+                tables[variation], columns=columns,
+                memory_map=memory_map).to_pydict()
+
+            # mapping holding individual entities for each component
+            entities = {}
+            for position, values in enumerate(zip(*records.values())):
+                entity = {
+                    parameter: ast.literal_eval(value)
+                    for parameter, value in zip(records.keys(), values)}
+
+                if entity.get('timeseries'):
+                    for bounds in entity['timeseries'].values():
+                        for bound in bounds:
+                            if isinstance(bound, str):
+                                references.setdefault(bound, [])
+
+                entities[entity.get('name', position)] = entity
+
+            mapping[component] = entities
+
+    # read the timeframe and the referenced timeseries only
+    timeseries_path = tables['timeseries']
+    timeseries_columns = pq.read_schema(timeseries_path).names
+    timeseries_table = pq.read_table(
+        timeseries_path,
+        columns=['timeframe', *(
+            column for column in timeseries_columns
+            if column in references)],
+        memory_map=memory_map)
+
+    # replace the timeseries references by their values
+    arrays = {
+        column: timeseries_table.column(column).to_numpy()
+        for column in timeseries_table.column_names
+        if column != 'timeframe'}
+    for entities in mapping.values():
+        for entity in entities.values():
+            if entity.get('timeseries'):
+                entity['timeseries'] = {
+                    interface: tuple(
+                        arrays.get(bound, bound) if isinstance(bound, str)
+                        else bound for bound in bounds)
+                    for interface, bounds in entity['timeseries'].items()}
+
+    freq = timeseries_table.schema.metadata.get(b'freq', b'').decode()
+    mapping['timeframe'] = {timeframe: pd.DatetimeIndex(
+        timeseries_table.column('timeframe').to_numpy(),
+        freq=freq if freq else None)}
+
+    # global constraints are stored as one row per set of constraints,
+    # identified by the global constraints column
+    for variation in getattr(spellings, 'global_constraints'):
+        if variation in tables:
+            records = pq.read_table(
+                tables[variation], memory_map=memory_map).to_pydict()
+
+            for values in zip(*records.values()):
+                constraints = {
+                    key: ast.literal_eval(value)
+                    for key, value in zip(records.keys(), values)}
+
+                if constraints.pop(
+                        'global_constraints', None) == global_constraints:
+                    for key, value in constraints.items():
+                        if value in ('+inf', '-inf'):
+                            constraints[key] = float(value)
+
+                    mapping['global_constraints'] = {
+                        global_constraints: constraints}
+
+    return python_mapping(mapping, timeframe=timeframe,
+                          global_constraints=global_constraints)
+
+
 def reorder_esm(esm, order=None):
     """
     Reorder the energy system mapping based on the given order.
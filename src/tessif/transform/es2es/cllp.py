@@ -20,6 +20,7 @@ import calliope
 import itertools
 
 from tessif.frused.paths import write_dir
+import tessif.write.log as log
 
 
 logger = logging.getLogger(__name__)
@@ -1682,6 +1683,7 @@ def generate_calliope_connector(connectors, busses):
     yield loc, links, transmissions
 
 
+@log.profiled
 def transform(tessif_es, warnings=False, aggregate=None):
     """
     Transform a tessif energy system into an calliope energy system.
@@ -16,11 +16,100 @@ import tessif.frused.namedtuples as nts
 import tessif.frused.defaults as esn_defaults
 import tessif.frused.configurations as config
 import tessif.frused.spellings as spl
+import tessif.write.log as log
 
 logger = logging.getLogger(__name__)
 
 
-def parse_esM_parameters(tessif_es):
+class TransformContext:
+    """
+    Lookup tables of a tessif energy system, precomputed once for
+    transforming it into a FINE energy system model.
+
+    Tessif's energy systems expose their components as generators. Hence
+    testing membership or searching the bus a component is connected to
+    iterates the entire energy system. All transformation utilities of this
+    module accept a ``context`` to use instead, so :func:`transform` runs in
+    linear time in the number of interfaces.
+
+    Parameters
+    ----------
+    tessif_es: AbstractEnergySystem
+        Container of itarable :class:`tessif.model.components` objects the
+        lookup tables are created for.
+
+    Attributes
+    ----------
+    busses, sources, sinks, transformers, storages, connectors, nodes: tuple
+        The energy system's components in the order they are yielded by the
+        energy system.
+    sink_set, transformer_set, storage_set: frozenset
+        Component type sets used for membership tests.
+    bus_interfaces: dict
+        Mapping of ``'component.interface'`` strings to the busses they are
+        connected to.
+    component_inputs, component_outputs, component_interfaces: dict
+        Mapping of component names to ``(bus, interface)`` tuples of the
+        bus inputs, outputs or interfaces belonging to the component.
+    output_carrier_busses: dict
+        Mapping of carriers to the busses having an output of this carrier.
+    busses_by_name: dict
+        Mapping of names to the busses carrying it.
+    conversion_factors: dict
+        Cache of the :func:`conversion_factors_identification` results.
+    esM_parameters: dict
+        The :func:`parse_esM_parameters` results.
+    """
+
+    def __init__(self, tessif_es):
+        self.busses = tuple(tessif_es.busses)
+        self.sources = tuple(tessif_es.sources)
+        self.sinks = tuple(tessif_es.sinks)
+        self.transformers = tuple(tessif_es.transformers)
+        self.storages = tuple(tessif_es.storages)
+        self.connectors = tuple(tessif_es.connectors)
+        self.nodes = tuple(tessif_es.nodes)
+
+        self.sink_set = frozenset(self.sinks)
+        self.transformer_set = frozenset(self.transformers)
+        self.storage_set = frozenset(self.storages)
+
+        self.bus_interfaces = collections.defaultdict(list)
+        self.component_inputs = collections.defaultdict(list)
+        self.component_outputs = collections.defaultdict(list)
+        self.component_interfaces = collections.defaultdict(list)
+        self.output_carrier_busses = collections.defaultdict(list)
+        self.busses_by_name = collections.defaultdict(list)
+
+        # lists preserve the order in which the busses and their interfaces
+        # used to be searched
+        for grid in self.busses:
+            self.busses_by_name[grid.uid.name].append(grid)
+
+            for interface in grid.interfaces:
+                self.bus_interfaces[interface].append(grid)
+                self.component_interfaces[
+                    interface.partition('.')[0]].append((grid, interface))
+
+            for interface in grid.inputs:
+                self.component_inputs[
+                    interface.partition('.')[0]].append((grid, interface))
+
+            carriers = set()
+            for interface in grid.outputs:
+                self.component_outputs[
+                    interface.partition('.')[0]].append((grid, interface))
+
+                carrier = interface.partition('.')[2]
+                if carrier not in carriers:
+                    carriers.add(carrier)
+                    self.output_carrier_busses[carrier].append(grid)
+
+        self.conversion_factors = dict()
+        self.esM_parameters = parse_esM_parameters(tessif_es, context=self)
+
+
+def parse_esM_parameters(tessif_es, context=None):
     """
     Create the FINE basic energy system model input and gather relevant information.
 
@@ -36,6 +125,10 @@ def parse_esM_parameters(tessif_es):
     tessif_es: AbstractEnergySystem
         Container of itarable :class:`tessif.model.components` objects with the needed informations.
 
+    context: TransformContext, default=None
+        Precomputed lookup tables of the energy system. Created if not
+        provided.
+
     Return
     ------
     region: string
@@ -48,6 +141,9 @@ def parse_esM_parameters(tessif_es):
     emission: string
         For post-processing the emission default is stored as a string within the energy system model.
     """
+    if context is None:
+        return TransformContext(tessif_es).esM_parameters
+
     fine_region = set()
     fine_commodities = set()
     fine_commodityUnitDict = dict()
@@ -55,7 +151,7 @@ def parse_esM_parameters(tessif_es):
     region = esn_defaults.energy_system_nodes['fine_region']
     fine_region.add(region)
 
-    for cmp in tessif_es.busses:
+    for cmp in context.busses:
         for com in cmp.interfaces:
             commodity = str(cmp.uid.name) + '.' + com.partition('.')[2]
             if commodity not in fine_commodities:
@@ -73,7 +169,7 @@ def parse_esM_parameters(tessif_es):
                 fine_commodityUnitDict.update({emission_default: unit})
             else:
                 emission_default = 'emissions'
-                for node in tessif_es.nodes:
+                for node in context.nodes:
                     if hasattr(node, 'flow_emissions'):
                         for interface in node.interfaces:
                             if node.flow_emissions[interface] != 0:
@@ -89,7 +185,7 @@ def parse_esM_parameters(tessif_es):
             unit = str(config.power_reference_unit) + '_' + constraint
             fine_commodityUnitDict.update({str(constraint): unit})
 
-    for node in tessif_es.sources:
+    for node in context.sources:
         for flow in node.flow_emissions:
             if node.flow_emissions[flow] != 0:
                 commodity = node.uid.name + '.unlimitted'
@@ -98,18 +194,18 @@ def parse_esM_parameters(tessif_es):
                     unit = str(config.power_reference_unit) + '_' + commodity
                     fine_commodityUnitDict.update({str(commodity): unit})
 
-    for node in tessif_es.storages:
+    for node in context.storages:
         for flow in node.flow_emissions:
             if node.flow_emissions[flow] != 0:
-                for grid in tessif_es.busses:
-                    if node.uid.name + '.' + node.output in grid.interfaces:
-                        commodity = grid.uid.name + '.' + node.output + '+' + node.uid.name
-                        if commodity not in fine_commodities:
-                            fine_commodities.add(commodity)
-                            unit = str(config.power_reference_unit) + \
-                                '_' + commodity
-                            fine_commodityUnitDict.update(
-                                {str(commodity): unit})
+                for grid in context.bus_interfaces.get(
+                        node.uid.name + '.' + node.output, ()):
+                    commodity = grid.uid.name + '.' + node.output + '+' + node.uid.name
+                    if commodity not in fine_commodities:
+                        fine_commodities.add(commodity)
+                        unit = str(config.power_reference_unit) + \
+                            '_' + commodity
+                        fine_commodityUnitDict.update(
+                            {str(commodity): unit})
 
     return ({'region': fine_region,
              'commodities': fine_commodities,
@@ -117,7 +213,7 @@ def parse_esM_parameters(tessif_es):
              'emission_default': emission_default})
 
 
-def parse_flow_parameters(tessif_es, cmp, interface):
+def parse_flow_parameters(tessif_es, cmp, interface, context=None):
     """
     Create FINE's component specific flow parameters out of tessif's components.
 
@@ -139,17 +235,24 @@ def parse_flow_parameters(tessif_es, cmp, interface):
     interface: collections.abc.Iterable
         Flow to be defined in FINE to which important parameters (e.g. costs and capacity) are assigned.
 
+    context: TransformContext, default=None
+        Precomputed lookup tables of the energy system. Created if not
+        provided.
+
     Return
     ------
     flow_params: dict
         Container of all relevant flow parameters of the specific component.
     """
-    esM_params = parse_esM_parameters(tessif_es)
+    if context is None:
+        context = TransformContext(tessif_es)
+
+    esM_params = context.esM_parameters
     region = list(esM_params['region'])[0]
     flow_params = dict()
     # Start with declaring the design variable
     flow_params['hasCapacityVariable'] = True
-    if cmp in tessif_es.sinks:
+    if cmp in context.sink_set:
         flow_params['hasCapacityVariable'] = False
     if cmp.timeseries is not None:
         if np.array_equal(cmp.timeseries[interface].max, cmp.timeseries[interface].min):
@@ -164,7 +267,7 @@ def parse_flow_parameters(tessif_es, cmp, interface):
     capacityMin = None
     capacityMax = None
     if flow_params['hasCapacityVariable'] is True:
-        if cmp not in tessif_es.transformers and cmp not in tessif_es.storages:
+        if cmp not in context.transformer_set and cmp not in context.storage_set:
             # Declaring capacities by expansion limit or flow rates
             if bool(cmp.expandable[interface]) is True:
                 if cmp.expansion_limits[interface].max != float('+inf'):
@@ -185,8 +288,9 @@ def parse_flow_parameters(tessif_es, cmp, interface):
 
         # Transformers can have multiple given flow rates or expansion limits.
         # The Min/Max Values calculated to the inflow are to be determined
-        elif cmp in tessif_es.transformers:
-            conv_factors = conversion_factors_identification(tessif_es, cmp)
+        elif cmp in context.transformer_set:
+            conv_factors = conversion_factors_identification(
+                tessif_es, cmp, context=context)
             # Checking first which frame is the limiting -> expansion outweights the flow_rates if cmp is expandable
             limit_frame = cmp.flow_rates
             for flow in cmp.expansion_limits:
@@ -225,7 +329,7 @@ def parse_flow_parameters(tessif_es, cmp, interface):
 
         # Case: Timeseries is given, the exact time values are fixed
         if cmp.timeseries is not None:
-            if cmp not in tessif_es.transformers:
+            if cmp not in context.transformer_set:
                 operationRate = pd.DataFrame()
                 if all(np.array(cmp.timeseries[interface].max).astype(float) == 0):
                     operationRate = cmp.timeseries[interface].max
@@ -308,7 +412,7 @@ def parse_flow_parameters(tessif_es, cmp, interface):
                     {region: [cmp.flow_rates[interface].max] * len(tessif_es.timeframe)})
 
     # Accumulated Amount of commodity limit. Create only if no timeseries is given
-    if cmp not in tessif_es.transformers and cmp not in tessif_es.storages:
+    if cmp not in context.transformer_set and cmp not in context.storage_set:
         if hasattr(cmp, 'accumulated_amounts'):
             if cmp.timeseries is None:
                 if cmp.accumulated_amounts[interface].max != float('+inf'):
@@ -319,7 +423,7 @@ def parse_flow_parameters(tessif_es, cmp, interface):
 
     # Component specific flow parameters
     # Transformer/Conversion -> flow_gradient values can be considered in FINE (dynamic conversion)
-    if cmp in tessif_es.transformers:
+    if cmp in context.transformer_set:
         if flow_params['hasCapacityVariable'] is True:
             for gradient in cmp.flow_gradients:
                 if gradient in cmp.inputs:
@@ -337,7 +441,7 @@ def parse_flow_parameters(tessif_es, cmp, interface):
 
     # Storage parameters
     # Get capacity Values start with getting capacity as interface if needed
-    if cmp in tessif_es.storages:
+    if cmp in context.storage_set:
         for cap in cmp.expandable:
             if cap in spl.storage_capacity:
                 interface = cap
@@ -412,10 +516,10 @@ def parse_flow_parameters(tessif_es, cmp, interface):
     # Define expansion costs
     for flow in cmp.interfaces:
         if bool(cmp.expandable[flow]) is True:
-            if cmp in tessif_es.transformers:
+            if cmp in context.transformer_set:
                 invest_cost = 0.0
                 conv_factors = conversion_factors_identification(
-                    tessif_es, cmp)
+                    tessif_es, cmp, context=context)
                 for expansion in cmp.expandable:
                     if bool(cmp.expandable[expansion]) is True:
                         for conv in conv_factors:
@@ -430,7 +534,7 @@ def parse_flow_parameters(tessif_es, cmp, interface):
     return flow_params
 
 
-def conversion_factors_identification(tessif_es, cmp):
+def conversion_factors_identification(tessif_es, cmp, context=None):
     """
     Create FINE's commodityConversionFactors out of tessif's converions.
 
@@ -449,17 +553,26 @@ def conversion_factors_identification(tessif_es, cmp):
     cmp: tessif component
         Container of the specific components information from the respective Tessif Energy System.
 
+    context: TransformContext, default=None
+        Precomputed lookup tables of the energy system. Created if not
+        provided.
+
     Return
     ------
     commodityConversionFactors: dictionary, assigns commodities (string) to a conversion factors (float)
         Same parameter as in FINE's conversion component representing the efficiency and the emissions.
     """
-    tessif_busses = list(tessif_es.busses)
+    if context is None:
+        context = TransformContext(tessif_es)
+
+    # hand out copies, since callers add their emissions to the factors
+    if cmp in context.conversion_factors:
+        return dict(context.conversion_factors[cmp])
 
     commodityConversionFactors = dict()
     for com in cmp.interfaces:
         cmp_com = str(cmp.uid) + '.' + str(com)
-        for grid in tessif_busses:
+        for grid in context.bus_interfaces.get(cmp_com, ()):
             grid_com = str(grid.uid.name) + '.' + str(com)
             if cmp_com in grid.inputs:
                 for conversion in cmp.conversions:
@@ -473,10 +586,12 @@ def conversion_factors_identification(tessif_es, cmp):
             if cmp_com in grid.outputs:
                 commodityConversionFactors.update({grid_com: float(-1)})
 
-    return commodityConversionFactors
+    context.conversion_factors[cmp] = commodityConversionFactors
+
+    return dict(commodityConversionFactors)
 
 
-def flow_costs_identification(tessif_es):
+def flow_costs_identification(tessif_es, context=None):
     """
     Create Tessif costs for later use in es2mapping out of Tessif's objects.
 
@@ -491,13 +606,20 @@ def flow_costs_identification(tessif_es):
     tessif_es: ~AbstractEnergySystem
         Container of itarable :class:`tessif.model.components` objects that have related flow_emissions.
 
+    context: TransformContext, default=None
+        Precomputed lookup tables of the energy system. Created if not
+        provided.
+
     Return
     ------
     flow_costs: dict
         to use them later in the es2mapping for correct post processing.
     """
+    if context is None:
+        context = TransformContext(tessif_es)
+
     flow_costs = dict()
-    for node in tessif_es.nodes:
+    for node in context.nodes:
         if hasattr(node, 'flow_costs'):
             if len(node.flow_costs) == 1:
                 for flow in node.flow_costs:
@@ -506,18 +628,16 @@ def flow_costs_identification(tessif_es):
                 value = dict()
                 for flow in node.flow_costs:
                     # Identify the grid in which the source is feeding
-                    for grid in tessif_es.busses:
-                        for interface in grid.outputs:
-                            if flow == interface.partition('.')[2]:
-                                value.update(
-                                    {grid.uid.name: float(node.flow_costs[flow])})
+                    for grid in context.output_carrier_busses.get(flow, ()):
+                        value.update(
+                            {grid.uid.name: float(node.flow_costs[flow])})
 
             flow_costs.update({node.uid.name: value})
         else:
             flow_costs.update({node.uid.name: 0.0})
 
     # Since Connectors are not in tessif nodes this fragment is needed to remind them in flow costs
-    for connector in tessif_es.connectors:
+    for connector in context.connectors:
         if connector.uid.name not in flow_costs:
             flow_costs.update({connector.uid.name: 0.0})
 
@@ -532,7 +652,7 @@ def flow_costs_identification(tessif_es):
     return flow_costs
 
 
-def flow_emissions_identification(tessif_es):
+def flow_emissions_identification(tessif_es, context=None):
     """
     Create Tessif emission for later use in es2mapping out of Tessif's emitting objects.
 
@@ -546,13 +666,20 @@ def flow_emissions_identification(tessif_es):
     tessif_es: AbstractEnergySystem
         Container of itarable :class:`tessif.model.components` objects that have related flow_emissions.
 
+    context: TransformContext, default=None
+        Precomputed lookup tables of the energy system. Created if not
+        provided.
+
     Return
     ------
     flow_emissions: dict
         to use them later in the es2mapping for correct post processing.
     """
+    if context is None:
+        context = TransformContext(tessif_es)
+
     flow_emissions = dict()
-    for node in tessif_es.nodes:
+    for node in context.nodes:
         if hasattr(node, 'flow_emissions'):
             if len(node.flow_emissions) == 1:
                 for emissions in node.flow_emissions:
@@ -561,11 +688,10 @@ def flow_emissions_identification(tessif_es):
                 value = dict()
                 # Identify the grid in which the source is feeding
                 for emissions in node.flow_emissions:
-                    for grid in tessif_es.busses:
-                        for interface in grid.outputs:
-                            if emissions == interface.partition('.')[2]:
-                                value.update({grid.uid.name: float(
-                                    node.flow_emissions[emissions])})
+                    for grid in context.output_carrier_busses.get(
+                            emissions, ()):
+                        value.update({grid.uid.name: float(
+                            node.flow_emissions[emissions])})
 
             flow_emissions.update({node.uid.name: value})
         else:
@@ -583,7 +709,7 @@ def flow_emissions_identification(tessif_es):
     return flow_emissions
 
 
-def expansion_costs_identification(tessif_es):
+def expansion_costs_identification(tessif_es, context=None):
     """
     Create Tessif expansion costs for later use in es2mapping out of Tessif's objects.
 
@@ -598,13 +724,20 @@ def expansion_costs_identification(tessif_es):
     tessif_es: ~AbstractEnergySystem
         Container of itarable :class:`tessif.model.components` objects that have related invest per capacity.
 
+    context: TransformContext, default=None
+        Precomputed lookup tables of the energy system. Created if not
+        provided.
+
     Return
     ------
     expansion_costs: dict
         to use them later in the es2mapping for correct post processing.
     """
+    if context is None:
+        context = TransformContext(tessif_es)
+
     expansion_costs = dict()
-    for node in tessif_es.nodes:
+    for node in context.nodes:
         if hasattr(node, 'expansion_costs'):
             if len(node.expansion_costs) == 1:
                 for flow in node.expansion_costs:
@@ -616,20 +749,20 @@ def expansion_costs_identification(tessif_es):
                         if expansion in spl.storage_capacity:
                             value.update(
                                 {expansion: float(node.expansion_costs[expansion])})
-                    if node not in tessif_es.storages:
+                    if node not in context.storage_set:
                         # Identify the grid in which the cmp is feeding
-                        for grid in tessif_es.busses:
-                            for interface in grid.outputs:
-                                if expansion == interface.partition('.')[2] and interface.partition('.')[2] in node.outputs:
-                                    value.update({grid.uid.name: float(
-                                        node.expansion_costs[expansion])})
+                        for grid in context.output_carrier_busses.get(
+                                expansion, ()):
+                            if expansion in node.outputs:
+                                value.update({grid.uid.name: float(
+                                    node.expansion_costs[expansion])})
                 value = pd.Series(value)
             expansion_costs.update({node.uid.name: value})
         else:
             expansion_costs.update({node.uid.name: 0.0})
 
     # Since Connectors are not in tessif nodes this fragment is needed to remind them in flow costs
-    for connector in tessif_es.connectors:
+    for connector in context.connectors:
         if connector.uid.name not in expansion_costs:
             expansion_costs.update({connector.uid.name: 0.0})
 
@@ -646,7 +779,7 @@ def expansion_costs_identification(tessif_es):
     return expansion_costs
 
 
-def create_FINE_busses(tessif_es):
+def create_FINE_busses(tessif_es, context=None):
     """
     Create FINE Transmissions out of Tessif's Busses.
 
@@ -656,17 +789,21 @@ def create_FINE_busses(tessif_es):
         Container of itarable :class:`tessif.model.components.Bus` objects that are to
         be transformed into FINE's transmission objects.
 
+    context: TransformContext, default=None
+        Precomputed lookup tables of the energy system. Created if not
+        provided.
+
     Return
     ------
     fine_bus_dict: collections.abc.Iterable
         Dictionary object containing the transformed :class:`bus objects`
     """
-    tessif_busses = list(tessif_es.busses)
-    esM_params = parse_esM_parameters(tessif_es)
-    fine_commodities = esM_params['commodities']
+    if context is None:
+        context = TransformContext(tessif_es)
+
     fine_bus_dicts = list()
 
-    for bus in tessif_busses:
+    for bus in context.busses:
         cmp = bus
         commodity = str()
 
@@ -682,7 +819,7 @@ def create_FINE_busses(tessif_es):
     return fine_bus_dicts
 
 
-def create_FINE_sources(tessif_es):
+def create_FINE_sources(tessif_es, context=None):
     """
     Create FINE Sources out of Tessif's Sources.
 
@@ -692,21 +829,25 @@ def create_FINE_sources(tessif_es):
         Container of itarable :class:`tessif.model.components.Source` objects that are to
         be transformed into FINE's Source objects.
 
+    context: TransformContext, default=None
+        Precomputed lookup tables of the energy system. Created if not
+        provided.
+
     Return
     ------
     fine_sources_dict: collections.abc.Iterable
         Dictionary object containing the transformed :class:`Source objects`
     """
-    tessif_sources = list(tessif_es.sources)
+    if context is None:
+        context = TransformContext(tessif_es)
 
     fine_sources_dicts = list()
-    for source in tessif_sources:
+    for source in context.sources:
         cmp = source
-        for grid in tessif_es.busses:
-            for interface in grid.inputs:
-                if cmp.uid.name == interface.partition('.')[0]:
-                    output = interface.partition('.')[2]
-                    commodity = grid.uid.name + '.' + output
+        for grid, interface in context.component_inputs.get(
+                cmp.uid.name, ()):
+            output = interface.partition('.')[2]
+            commodity = grid.uid.name + '.' + output
 
         # Check if source has emissions -> if so treat it as transformer (emitting source later)
 
@@ -717,14 +858,15 @@ def create_FINE_sources(tessif_es):
                 'opexPerOperation': float(cmp.flow_costs[output]),
             }
 
-            fine_source.update(parse_flow_parameters(tessif_es, cmp, output))
+            fine_source.update(parse_flow_parameters(
+                tessif_es, cmp, output, context=context))
 
             fine_sources_dicts.append(fine_source)
 
     return fine_sources_dicts
 
 
-def create_FINE_sinks(tessif_es):
+def create_FINE_sinks(tessif_es, context=None):
     """
     Create FINE Sinks out of Tessif's Sinks.
 
@@ -734,65 +876,69 @@ def create_FINE_sinks(tessif_es):
         Container of itarable :class:`tessif.model.components.Sink` objects that are to
         be transformed into FINE's Sink objects.
 
+    context: TransformContext, default=None
+        Precomputed lookup tables of the energy system. Created if not
+        provided.
+
     Return
     ------
     fine_sources_dict: collections.abc.Iterable
         Dictionary object containing the transformed :class:`Sink objects`
     """
-    tessif_sinks = list(tessif_es.sinks)
+    if context is None:
+        context = TransformContext(tessif_es)
 
     fine_sinks_dicts = list()
-    for sink in tessif_sinks:
+    for sink in context.sinks:
         cmp = sink
         # Component commodity needs to fit the grid commodity uid
-        for grid in tessif_es.busses:
-            for interface in grid.interfaces:
-                if cmp.uid.name == interface.partition('.')[0]:
-                    commodity = grid.uid.name + '.' + \
-                        interface.partition('.')[2]
+        for grid, interface in context.component_interfaces.get(
+                cmp.uid.name, ()):
+            commodity = grid.uid.name + '.' + \
+                interface.partition('.')[2]
+
+            for input in cmp.inputs:
+                fine_sink = {
+                    'name': str(sink.uid),
+                    'commodity': commodity,
+                    'opexPerOperation': float(cmp.flow_costs[input]),
+                    # 'commodityRevenue': cmp.flow_costs[input]
+                }
 
-                    for input in cmp.inputs:
-                        fine_sink = {
-                            'name': str(sink.uid),
-                            'commodity': commodity,
-                            'opexPerOperation': float(cmp.flow_costs[input]),
-                            # 'commodityRevenue': cmp.flow_costs[input]
-                        }
-
-                        fine_sink.update(
-                            parse_flow_parameters(tessif_es, cmp, input))
-
-                        fine_sinks_dicts.append(fine_sink)
-
-                        expandable = cmp.expandable[input]
-                        expansion_costs = cmp.expansion_costs[input]
-                        inst_cap = cmp.flow_rates[input].max
-                        min_exp = cmp.expansion_limits[input].min
-                        max_exp = cmp.expansion_limits[input].max
-
-                        # expansion limits are specifics of installed capacity
-                        if inst_cap != float("inf"):
-                            min_expansion = min_exp / inst_cap
-                            # cap lower end of min exp at 1
-                            min_expansion = max(min_expansion, 1)
-                            if max_exp == float("inf"):
-                                max_expansion = max_exp
-                            else:
-                                max_expansion = 1
-                        else:
-                            min_expansion = 1
-                            max_expansion = 1
+                fine_sink.update(parse_flow_parameters(
+                    tessif_es, cmp, input, context=context))
+
+                fine_sinks_dicts.append(fine_sink)
+
+                expandable = cmp.expandable[input]
+                expansion_costs = cmp.expansion_costs[input]
+                inst_cap = cmp.flow_rates[input].max
+                min_exp = cmp.expansion_limits[input].min
+                max_exp = cmp.expansion_limits[input].max
 
-                        if expandable:
-                            fine_sink["hasCapacityVariable"] = expandable
-                            fine_sink["investPerCapacity"] = expansion_costs
-                            fine_sink["capacityMin"] = min_expansion
-                            fine_sink["capacityMax"] = max_expansion
+                # expansion limits are specifics of installed capacity
+                if inst_cap != float("inf"):
+                    min_expansion = min_exp / inst_cap
+                    # cap lower end of min exp at 1
+                    min_expansion = max(min_expansion, 1)
+                    if max_exp == float("inf"):
+                        max_expansion = max_exp
+                    else:
+                        max_expansion = 1
+                else:
+                    min_expansion = 1
+                    max_expansion = 1
+
+                if expandable:
+                    fine_sink["hasCapacityVariable"] = expandable
+                    fine_sink["investPerCapacity"] = expansion_costs
+                    fine_sink["capacityMin"] = min_expansion
+                    fine_sink["capacityMax"] = max_expansion
 
     return fine_sinks_dicts
 
 
-def create_FINE_conversions(tessif_es):
+def create_FINE_conversions(tessif_es, context=None):
     """
     Create FINE Conversion (dynamic) out of Tessif's Transformer.
 
@@ -807,36 +953,43 @@ def create_FINE_conversions(tessif_es):
         Container of itarable :class:`tessif.model.components.Transformer` objects that are to
         be transformed into FINE's conversion objects.
 
+    context: TransformContext, default=None
+        Precomputed lookup tables of the energy system. Created if not
+        provided.
+
     Return
     ------
     fine_transformer_dict: collections.abc.Iterable
         Dictionary object containing the transformed :class:`Conversion objects`
     """
-    tessif_transformers = list(tessif_es.transformers)
-    esM_params = parse_esM_parameters(tessif_es)
+    if context is None:
+        context = TransformContext(tessif_es)
+
+    esM_params = context.esM_parameters
     fine_units = esM_params['units']
     emission_default = esM_params['emission_default']
     fine_conversions_dict = list()
 
-    for transformer in tessif_transformers:
+    for transformer in context.transformers:
         cmp = transformer
 
         # Component commodity needs to fit the grid commodity uid which flows into the transformer (ergo is grid output)
-        for grid in tessif_es.busses:
-            for interface in grid.outputs:
-                if cmp.uid.name == interface.partition('.')[0]:
-                    grid_unit = interface.partition('.')[2]
-                    commodity = grid.uid.name + '.' + grid_unit
-                    physicalUnit = fine_units[commodity]
+        for grid, interface in context.component_outputs.get(
+                cmp.uid.name, ()):
+            grid_unit = interface.partition('.')[2]
+            commodity = grid.uid.name + '.' + grid_unit
+            physicalUnit = fine_units[commodity]
 
         input = grid_unit
-        conversion_factors = conversion_factors_identification(tessif_es, cmp)
+        conversion_factors = conversion_factors_identification(
+            tessif_es, cmp, context=context)
         fine_conversion = (
             {'name': str(transformer.uid),
              'commodityConversionFactors': conversion_factors,
              'physicalUnit': physicalUnit, })
 
-        fine_conversion.update(parse_flow_parameters(tessif_es, cmp, input))
+        fine_conversion.update(parse_flow_parameters(
+            tessif_es, cmp, input, context=context))
 
         # Recalculating the tessif outflow specific paramters to fine's inflow specific parameters
         opex = 0.0
@@ -875,7 +1028,7 @@ def create_FINE_conversions(tessif_es):
     return fine_conversions_dict
 
 
-def create_FINE_storages(tessif_es):
+def create_FINE_storages(tessif_es, context=None):
     """
     Create FINE Storage out of Tessif's Storage.
 
@@ -891,6 +1044,10 @@ def create_FINE_storages(tessif_es):
         Container of itarable :class:`tessif.model.components.Storage` objects that are to
         be transformed into FINE's Storage objects.
 
+    context: TransformContext, default=None
+        Precomputed lookup tables of the energy system. Created if not
+        provided.
+
     Return
     ------
     fine_storage_dict: collections.abc.Iterable
@@ -904,20 +1061,18 @@ def create_FINE_storages(tessif_es):
         as no initial capacity is specified, but a self-discharge rate.
 
     """
-    tessif_storages = list(tessif_es.storages)
-    esM_params = parse_esM_parameters(tessif_es)
+    if context is None:
+        context = TransformContext(tessif_es)
 
     fine_storages_dicts = list()
-    for storage in tessif_storages:
+    for storage in context.storages:
         cmp = storage
         commodity = str()
 
         # Component commodity needs to fit the grid commodity uid
-        for grid in tessif_es.busses:
-            for interface in grid.outputs:
-                if cmp.uid.name == interface.partition('.')[0]:
-                    commodity = grid.uid.name + '.' + \
-                        interface.partition('.')[2]
+        for grid, interface in context.component_outputs.get(
+                cmp.uid.name, ()):
+            commodity = grid.uid.name + '.' + interface.partition('.')[2]
 
         # Declare if interface for storage are capacity or flow related
         interface = storage.output
@@ -938,7 +1093,7 @@ def create_FINE_storages(tessif_es):
             )
 
             fine_storage.update(parse_flow_parameters(
-                tessif_es, cmp, interface))
+                tessif_es, cmp, interface, context=context))
 
             # self discharge (idle change) is normalized in FINE but not in tessif
             # use already identified capacity from storage
@@ -968,7 +1123,7 @@ def create_FINE_storages(tessif_es):
     return fine_storages_dicts
 
 
-def create_FINE_connectors(tessif_es):
+def create_FINE_connectors(tessif_es, context=None):
     """
     Create FINE Connector as double conversion out of Tessif's Connector.
 
@@ -984,17 +1139,22 @@ def create_FINE_connectors(tessif_es):
         Container of itarable :class:`tessif.model.components.Connector` objects that are to
         be transformed into FINE's conversion (twice) objects.
 
+    context: TransformContext, default=None
+        Precomputed lookup tables of the energy system. Created if not
+        provided.
+
     Return
     ------
     fine_connector_dict: collections.abc.Iterable
         Dictionary object containing the transformed :class:`Connector objects`
     """
-    tessif_connectors = list(tessif_es.connectors)
-    esM_params = parse_esM_parameters(tessif_es)
-    fine_units = esM_params['units']
+    if context is None:
+        context = TransformContext(tessif_es)
+
+    fine_units = context.esM_parameters['units']
 
     fine_connector_dicts = list()
-    for connector in tessif_connectors:
+    for connector in context.connectors:
         cmp = connector
         reverse_flow_count = 0
         for conversion in cmp.conversions:
@@ -1012,11 +1172,10 @@ def create_FINE_connectors(tessif_es):
             # physicalUnit representing the connector output
             physicalUnit = str()
             grid_com = str()
-            for grid in tessif_es.busses:
-                if grid.uid.name == outflow:
-                    for output in grid.outputs:
-                        grid_com = output.partition('.')[2]
-                    physicalUnit = fine_units[outflow + '.' + grid_com]
+            for grid in context.busses_by_name.get(outflow, ()):
+                for output in grid.outputs:
+                    grid_com = output.partition('.')[2]
+                physicalUnit = fine_units[outflow + '.' + grid_com]
 
             fine_connector['physicalUnit'] = physicalUnit
 
@@ -1033,7 +1192,7 @@ def create_FINE_connectors(tessif_es):
     return fine_connector_dicts
 
 
-def create_FINE_constraints(tessif_es):
+def create_FINE_constraints(tessif_es, context=None):
     """
     Create FINE Emission Constraints as sink out of Tessif's global constraints.
 
@@ -1042,13 +1201,20 @@ def create_FINE_constraints(tessif_es):
     tessif_es: AbstractEnergySystem
         Container the global constraint limiting the optimization process.
 
+    context: TransformContext, default=None
+        Precomputed lookup tables of the energy system. Created if not
+        provided.
+
     Return
     ------
     fine_constraints_dict: collections.abc.Iterable
         Dictionary object containing the transformed :class:`Constraints objects`
     """
+    if context is None:
+        context = TransformContext(tessif_es)
+
     fine_constraints_dict = list()
-    esM_params = parse_esM_parameters(tessif_es)
+    esM_params = context.esM_parameters
     commodities = esM_params['commodities']
     emission_default = esM_params['emission_default']
 
@@ -1091,7 +1257,7 @@ def create_FINE_constraints(tessif_es):
     return fine_constraints_dict
 
 
-def conversion_as_emitting_sources(tessif_es):
+def conversion_as_emitting_sources(tessif_es, context=None):
     """
     Create FINE conversion out of Tessif's emitting sources.
 
@@ -1107,27 +1273,33 @@ def conversion_as_emitting_sources(tessif_es):
     tessif_es: AbstractEnergySystem
         Container of itarable :class:`tessif.model.components.Source` objects that have related flow_emissions.
 
+    context: TransformContext, default=None
+        Precomputed lookup tables of the energy system. Created if not
+        provided.
+
     Return
     ------
     fine_emitting_source_dict: collections.abc.Iterable
         Dictionary object containing the transformed :class:`Conversion objects`
     """
-    esM_params = parse_esM_parameters(tessif_es)
+    if context is None:
+        context = TransformContext(tessif_es)
+
+    esM_params = context.esM_parameters
     fine_emission_sources_dict = list()
     fine_emission_grids_dict = list()
     fine_conversion_emissions_dict = list()
     emission_default = esM_params['emission_default']
 
-    for cmp in tessif_es.sources:
+    for cmp in context.sources:
         for flow in cmp.flow_emissions:
             # Check if source has emissions
             if cmp.flow_emissions[flow] != 0:
                 # Identify the grid in which the source is feeding
-                for grid in tessif_es.busses:
-                    for interface in grid.interfaces:
-                        if cmp.uid.name == interface.partition('.')[0]:
-                            commodity = grid.uid.name + '.' + \
-                                interface.partition('.')[2]
+                for grid, interface in context.component_interfaces.get(
+                        cmp.uid.name, ()):
+                    commodity = grid.uid.name + '.' + \
+                        interface.partition('.')[2]
                 # Adding unlimitted source to the esM
                 fine_emission_source = {
                     'name': cmp.uid.name + '.unlimitted',
@@ -1146,8 +1318,8 @@ def conversion_as_emitting_sources(tessif_es):
                     'opexPerOperation': float(cmp.flow_costs[flow])
                 }
 
-                fine_emission_conversion.update(
-                    parse_flow_parameters(tessif_es, cmp, flow))
+                fine_emission_conversion.update(parse_flow_parameters(
+                    tessif_es, cmp, flow, context=context))
 
                 fine_conversion_emissions_dict.append(fine_emission_conversion)
 
@@ -1155,7 +1327,7 @@ def conversion_as_emitting_sources(tessif_es):
             'Source_Conversions': fine_conversion_emissions_dict}
 
 
-def conversion_as_emitting_storage(tessif_es):
+def conversion_as_emitting_storage(tessif_es, context=None):
     """
     Create FINE conversions out of Tessif's emitting storages and the storage itself.
 
@@ -1175,6 +1347,10 @@ def conversion_as_emitting_storage(tessif_es):
     tessif_es: AbstractEnergySystem
         Container of itarable :class:`tessif.model.components.Storage` objects that have related flow_emissions.
 
+    context: TransformContext, default=None
+        Precomputed lookup tables of the energy system. Created if not
+        provided.
+
     Return
     ------
     fine_emission_storages_dict: collections.abc.Iterable
@@ -1190,22 +1366,24 @@ def conversion_as_emitting_storage(tessif_es):
         as no initial capacity is specified, but a self-discharge rate.
 
     """
-    esM_params = parse_esM_parameters(tessif_es)
+    if context is None:
+        context = TransformContext(tessif_es)
+
+    esM_params = context.esM_parameters
     emission_default = esM_params['emission_default']
 
     fine_emission_storages_dict = list()
     storage_conversions_dict = list()
 
-    for cmp in tessif_es.storages:
+    for cmp in context.storages:
         for flow in cmp.flow_emissions:
             # Check if source has emissions
             if cmp.flow_emissions[flow] != 0:
                 # Identify the grid in which the source is feeding
-                for grid in tessif_es.busses:
-                    for interface in grid.interfaces:
-                        if cmp.uid.name == interface.partition('.')[0]:
-                            commodity = grid.uid.name + '.' + \
-                                interface.partition('.')[2]
+                for grid, interface in context.component_interfaces.get(
+                        cmp.uid.name, ()):
+                    commodity = grid.uid.name + '.' + \
+                        interface.partition('.')[2]
 
                 conversion_factors = {commodity: -1,
                                       commodity + '+' + cmp.uid.name: 1, }
@@ -1239,7 +1417,7 @@ def conversion_as_emitting_storage(tessif_es):
                 )
 
                 fine_storage.update(parse_flow_parameters(
-                    tessif_es, cmp, interface))
+                    tessif_es, cmp, interface, context=context))
 
                 # self discharge (idle change) is normalized in FINE but not in tessif
                 # use already identified capacity from storage
@@ -1277,6 +1455,7 @@ def conversion_as_emitting_storage(tessif_es):
             'Storage_Conversions': storage_conversions_dict, }
 
 
+@log.profiled
 def transform(tessif_es, **kwargs):
     """
     Transform a tessif energy system into a fine energy system.
@@ -1326,7 +1505,10 @@ def transform(tessif_es, **kwargs):
         1990-07-13 03:00:00       -0.0    -10.0    10.0      0.0
         1990-07-13 04:00:00       -0.0    -10.0    10.0      0.0
     """
-    esM_params = parse_esM_parameters(tessif_es)
+    # Precompute the lookup tables used by all of the following utilities
+    context = TransformContext(tessif_es)
+
+    esM_params = context.esM_parameters
     esM = fn.energySystemModel.EnergySystemModel(
         locations=esM_params['region'],
         commodities=esM_params['commodities'],
@@ -1341,7 +1523,7 @@ def transform(tessif_es, **kwargs):
 
     # Adding UID's from tessif's energy system to FINE's
     uids = dict()
-    for node in tessif_es.nodes:
+    for node in context.nodes:
         uids.update({str(node.uid): node.uid})
     setattr(esM, 'uid_dict', uids)
 
@@ -1350,42 +1532,46 @@ def transform(tessif_es, **kwargs):
     setattr(esM, 'emission_default', emission_default)
 
     # Adding the flow costs for single and multiple flow cmp's to the esM
-    flow_costs = flow_costs_identification(tessif_es)
+    flow_costs = flow_costs_identification(tessif_es, context=context)
     setattr(esM, 'flow_costs', flow_costs)
 
     # Adding the flow costs for single and multiple flow cmp's to the esM
-    expansion_costs = expansion_costs_identification(tessif_es)
+    expansion_costs = expansion_costs_identification(tessif_es, context=context)
     setattr(esM, 'expansion_costs', expansion_costs)
 
     # Adding the flow costs for single and multiple flow cmp's to the esM
-    flow_emissions = flow_emissions_identification(tessif_es)
+    flow_emissions = flow_emissions_identification(tessif_es, context=context)
     setattr(esM, 'flow_emissions', flow_emissions)
 
     # Lead developer hack, cause he doesnt know what hes doin
-    sink_str_reprs = [str(sink.uid) for sink in tessif_es.sinks]
+    sink_str_reprs = [str(sink.uid) for sink in context.sinks]
     setattr(esM, "sinks", sink_str_reprs)
 
     # Adding busses to the respective energy system model
-    fine_busses = list(create_FINE_busses(tessif_es))
+    fine_busses = list(create_FINE_busses(
+        tessif_es, context=context))
     energy_system_components = list()
     energy_system_components.extend(fine_busses)
     for bus_dict in fine_busses:
         esM.add(fn.Transmission(esM=esM, **bus_dict))
 
     # Adding sources to the respective energy system model
-    fine_sources = list(create_FINE_sources(tessif_es))
+    fine_sources = list(create_FINE_sources(
+        tessif_es, context=context))
     energy_system_components.extend(fine_sources)
     for source_dict in fine_sources:
         esM.add(fn.Source(esM=esM, **source_dict))
 
     # Adding sinks to the respective energy system model
-    fine_sinks = list(create_FINE_sinks(tessif_es))
+    fine_sinks = list(create_FINE_sinks(
+        tessif_es, context=context))
     energy_system_components.extend(fine_sinks)
     for sink_dict in fine_sinks:
         esM.add(fn.Sink(esM=esM, **sink_dict))
 
     # Adding transformer to the respective energy system model
-    fine_conversions = list(create_FINE_conversions(tessif_es))
+    fine_conversions = list(create_FINE_conversions(
+        tessif_es, context=context))
     energy_system_components.extend(fine_conversions)
     for conversion_dict in fine_conversions:
         if 'rampUpMax' in conversion_dict.keys() or 'rampDownMax' in conversion_dict.keys():
@@ -1394,43 +1580,48 @@ def transform(tessif_es, **kwargs):
             esM.add(fn.Conversion(esM=esM, **conversion_dict))
 
     # Adding storages to the respective energy system model
-    fine_storages = list(create_FINE_storages(tessif_es))
+    fine_storages = list(create_FINE_storages(
+        tessif_es, context=context))
     energy_system_components.extend(fine_storages)
     for storages_dict in fine_storages:
         esM.add(fn.Storage(esM=esM, **storages_dict))
 
     # Adding Connector as Transformer to the respective energy system model
-    fine_connectors = list(create_FINE_connectors(tessif_es))
+    fine_connectors = list(create_FINE_connectors(
+        tessif_es, context=context))
     energy_system_components.extend(fine_connectors)
     for connectors_dict in fine_connectors:
         esM.add(fn.Conversion(esM=esM, **connectors_dict))
 
     # Adding Sink as Emission Constraint to the respective energy system model
-    fine_constraints_dict = list(create_FINE_constraints(tessif_es))
+    fine_constraints_dict = list(create_FINE_constraints(
+        tessif_es, context=context))
     energy_system_components.extend(fine_constraints_dict)
     for fine_constraint_dict in fine_constraints_dict:
         esM.add(fn.Sink(esM=esM, **fine_constraint_dict))
 
     # Adding Source Emissions to the respective energy system model
-    fine_source_emissions_dict = list(
-        conversion_as_emitting_sources(tessif_es)['Sources'])
+    emitting_sources = conversion_as_emitting_sources(
+        tessif_es, context=context)
+    fine_source_emissions_dict = list(emitting_sources['Sources'])
     energy_system_components.extend(fine_source_emissions_dict)
     for source_emission_dict in fine_source_emissions_dict:
         esM.add(fn.Source(esM=esM, **source_emission_dict))
     fine_conversion_emissions_dict = list(
-        conversion_as_emitting_sources(tessif_es)['Source_Conversions'])
+        emitting_sources['Source_Conversions'])
     energy_system_components.extend(fine_conversion_emissions_dict)
     for conversion_emission_dict in fine_conversion_emissions_dict:
         esM.add(fn.Conversion(esM=esM, **conversion_emission_dict))
 
     # Adding Storage Emissions to the respective energy system model
+    emitting_storages = conversion_as_emitting_storage(
+        tessif_es, context=context)
     fine_storage_conversion_emissions_dict = list(
-        conversion_as_emitting_storage(tessif_es)['Storage_Conversions'])
+        emitting_storages['Storage_Conversions'])
     energy_system_components.extend(fine_storage_conversion_emissions_dict)
     for conversion_storage_emission_dict in fine_storage_conversion_emissions_dict:
         esM.add(fn.Conversion(esM=esM, **conversion_storage_emission_dict))
-    fine_storage_emissions_dict = list(
-        conversion_as_emitting_storage(tessif_es)['Storage'])
+    fine_storage_emissions_dict = list(emitting_storages['Storage'])
     energy_system_components.extend(fine_storage_emissions_dict)
     for storage_emission_dict in fine_storage_emissions_dict:
         esM.add(fn.Storage(esM=esM, **storage_emission_dict))
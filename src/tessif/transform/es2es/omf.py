@@ -15,6 +15,7 @@ import numpy as np
 import tessif.frused.namedtuples as nts
 from tessif.frused import spellings
 from tessif.model import components
+import tessif.write.log as log
 
 logger = logging.getLogger(__name__)
 
@@ -1216,6 +1217,7 @@ def generate_oemof_transformers(transformers, tessif_busses, oemof_busses):
             conversion_factors=conversion_factors)
 
 
+@log.profiled
 def transform(tessif_es, **kwargs):
     """
     Transform a tessif energy system into an oemof energy system.
@@ -25,6 +25,7 @@ from tessif.frused.spellings import (
     flow_emissions as spellings_flow_emissions,
 )
 import tessif.frused.hooks.ppsa as pypsa_hooks
+import tessif.write.log as log
 
 logger = logging.getLogger(__name__)
 
@@ -206,12 +207,42 @@ def compute_unneeded_supply_chains(tessif_es, pypsa_generator_uids):
         Bus: ['Pipeline']
         Generator: ['Gas Station']
     """
+    pypsa_generator_uids = tuple(pypsa_generator_uids)
+    generator_uids = set(pypsa_generator_uids)
+    generators_to_remove = {uid.name for uid in pypsa_generator_uids}
+
+    busses = tuple(tessif_es.busses)
+    nodes = tuple(tessif_es.nodes)
+
+    # Map each bus outbound to the busses it leaves from
+    busses_by_outbound = collections.defaultdict(list)
+    for bus in busses:
+        for outbound in bus.outputs:
+            busses_by_outbound[outbound].append(bus)
+
+    # Map 'uid.interface' strings to the components they belong to. Supply
+    # chains are keyed by the uid's string representation, the removed
+    # components by its name.
+    components_by_uid_interface = collections.defaultdict(list)
+    components_by_name_interface = collections.defaultdict(list)
+    for comp in nodes:
+        for key in {f'{str(comp.uid)}.{interface}'
+                    for interface in comp.interfaces}:
+            components_by_uid_interface[key].append(comp)
+        for key in {f'{comp.uid.name}.{interface}'
+                    for interface in comp.interfaces}:
+            components_by_name_interface[key].append(comp)
+
+    # Whether a bus only feeds transformers that are to be generators
+    feeds_only_generators = dict()
+
     busses_to_remove, components_to_remove = list(), list()
+    removed_busses = set()
     supply_chains = collections.defaultdict(list)
 
     # Create a list of busses, that are to be removed
     for transformer in tessif_es.transformers:
-        if transformer.uid in pypsa_generator_uids:
+        if transformer.uid in generator_uids:
 
             # iterate through all transformer inputs to get all connecting
             # busses
@@ -219,68 +250,39 @@ def compute_unneeded_supply_chains(tessif_es, pypsa_generator_uids):
                 # Busses To Remove = btrs
                 btrs = list()
 
-                # iterate through all tessif busses
-                for bus in tessif_es.busses:
-
-                    # to find the generator to be removed input:
-                    if any([outbound == f'{transformer.uid.name}.{inbound}'
-                            for outbound in bus.outputs]):
-
-                        # and then check whether the bus from which this input
-                        # comes only feeds transformer that are to be
-                        # generators
-                        incoming_bus_outbounds = [
-                            outbound.split('.')[0]
-                            for outbound in bus.outputs]
-
-                        generators_to_remove = [
-                            uid.name for uid in pypsa_generator_uids]
-
-                        # print(79*'-')
-                        # print(bus.uid.name)
-                        # print([outbound.split('.')[0]
-                        #        for outbound in bus.outputs])
-                        # print([uid.name for uid in pypsa_generator_uids])
-                        # print(79*'-')
-
-                        # if (
-                        #         len(bus.outputs) == 1 and
-                        #         len(bus.inputs) == 1
-                        # ):
+                # find the busses the generator to be removed is fed by
+                for bus in busses_by_outbound.get(
+                        f'{transformer.uid.name}.{inbound}', ()):
 
-                        if all([bus_outbound in generators_to_remove
-                                for bus_outbound in incoming_bus_outbounds]):
+                    # and then check whether the bus from which this input
+                    # comes only feeds transformer that are to be
+                    # generators
+                    if bus not in feeds_only_generators:
+                        feeds_only_generators[bus] = all(
+                            outbound.split('.')[0] in generators_to_remove
+                            for outbound in bus.outputs)
 
-                            if bus not in busses_to_remove:
-                                btrs.append(bus)
+                    if feeds_only_generators[bus]:
+                        if bus not in removed_busses:
+                            btrs.append(bus)
 
                 busses_to_remove.extend(btrs)
+                removed_busses.update(btrs)
                 supply_chains[transformer.uid].extend(btrs)
 
                 # iterate through all supplying busses to remove subsequent
                 # sources
                 for bus in btrs:
                     for inbound in bus.inputs:
-
-                        ctrs = [
-                            comp for comp in tessif_es.nodes
-                            if any([inbound == f'{str(comp.uid)}.{interface}'
-                                    for interface in comp.interfaces])
-                        ]
-
-                        supply_chains[transformer.uid].extend(ctrs)
+                        supply_chains[transformer.uid].extend(
+                            components_by_uid_interface.get(inbound, ()))
 
     # Add all of the busses inputs to the components that are to be removed:
     for bus in busses_to_remove:
         # Components To Remove = ctrs
         for inbound in bus.inputs:
-
-            ctrs = [
-                comp for comp in tessif_es.nodes
-                if any([inbound == f'{comp.uid.name}.{interface}'
-                        for interface in comp.interfaces])
-            ]
-            components_to_remove.extend(ctrs)
+            components_to_remove.extend(
+                components_by_name_interface.get(inbound, ()))
 
     components_to_remove = {
         'Bus': [str(bus.uid) for bus in busses_to_remove],
@@ -1920,6 +1922,113 @@ def create_pypsa_storages(storages, tessif_busses):
     return [*pypsa_storage_dicts, *pypsa_carrier_dicts]
 
 
+def add_components_in_bulk(pypsa_es, component_dicts):
+    """
+    Add pypsa component dicts to a pypsa energy system in bulk.
+
+    Groups the :paramref:`~add_components_in_bulk.component_dicts` by their
+    ``class_name`` and adds each group using a single :meth:`pypsa.Network.madd`
+    call. Time varying attribute values of a group are stacked into one
+    :class:`~pandas.DataFrame` per attribute and imported using
+    :meth:`pypsa.Network.import_series_from_dataframe`. This avoids pypsa's
+    considerable per call overhead of :meth:`pypsa.Network.add`.
+
+    Parameters
+    ----------
+    pypsa_es: :class:`pypsa.Network`
+        The pypsa energy system the components are added to. Its snapshots
+        need to be set already.
+
+    component_dicts: ~collections.abc.Iterable
+        Iterable of dictionaries as returned by the ``create_pypsa_*``
+        utilities of this module. Each dictionary holds a component's
+        ``class_name``, its ``name`` and its attribute values as in
+        ``pypsa_es.add(**component_dict)``.
+
+    Note
+    ----
+    Attribute values are interpreted as in :meth:`pypsa.Network.add`. Meaning
+    sequences (:class:`~numpy.ndarray`, :class:`list`,
+    :class:`~pandas.Series`) of time varying attributes are added as time
+    series, while numbers are added as static values. Attributes not specified
+    for a component are set to their pypsa default.
+    """
+    grouped_dicts = collections.defaultdict(list)
+    for component_dict in component_dicts:
+        grouped_dicts[component_dict['class_name']].append(component_dict)
+
+    snapshots = pypsa_es.snapshots
+    for class_name, dicts in grouped_dicts.items():
+        attrs = pypsa_es.components[class_name]['attrs']
+        names = pd.Index([str(dct['name']) for dct in dicts])
+
+        duplicates = names[names.duplicated()].union(
+            names.intersection(pypsa_es.df(class_name).index))
+        if len(duplicates) > 0:
+            raise ValueError(
+                f"Failed to add {class_name} components {list(duplicates)} "
+                "because there are already objects with these names.")
+
+        # attribute names in order of appearance
+        attributes = list(dict.fromkeys(
+            key for dct in dicts for key in dct
+            if key not in ('class_name', 'name')))
+
+        static, series = dict(), dict()
+        for attribute in attributes:
+            if attribute not in attrs.index:
+                logger.warning(
+                    f"{class_name} has no attribute {attribute}, "
+                    "ignoring this passed value.")
+                continue
+
+            default = attrs.at[attribute, 'default']
+            values = [dct.get(attribute, default) for dct in dicts]
+
+            if not attrs.at[attribute, 'varying']:
+                static[attribute] = pd.Series(values, index=names)
+                continue
+
+            # time varying values (or any value of series only attributes)
+            # are stacked into one dataframe, static ones default there
+            is_series = [
+                attribute in dct and (
+                    isinstance(value, (pd.Series, np.ndarray, list))
+                    or not attrs.at[attribute, 'static'])
+                for dct, value in zip(dicts, values)
+            ]
+
+            if any(is_series):
+                series[attribute] = pd.DataFrame(
+                    np.column_stack([
+                        np.broadcast_to(
+                            value.reindex(snapshots).to_numpy()
+                            if isinstance(value, pd.Series) else
+                            np.asarray(value, dtype=attrs.at[
+                                attribute, 'typ']),
+                            len(snapshots))
+                        for value, flag in zip(values, is_series) if flag
+                    ]),
+                    index=snapshots,
+                    columns=names[is_series],
+                )
+
+            if attrs.at[attribute, 'static']:
+                static[attribute] = pd.Series(
+                    [default if flag else value
+                     for value, flag in zip(values, is_series)],
+                    index=names,
+                )
+
+        # static and time varying values of the same attribute can't be
+        # passed to madd at once, hence the series are imported seperately
+        pypsa_es.madd(class_name, names, **static)
+        for attribute, dataframe in series.items():
+            pypsa_es.import_series_from_dataframe(
+                dataframe, class_name, attribute)
+
+
+@log.profiled
 def transform(tessif_es, transformer_style='infer', forced_links=None, excess_sinks=None):
     """
     Transform a tessif energy system into a pypsa energy system.
@@ -2074,50 +2183,61 @@ def transform(tessif_es, transformer_style='infer', forced_links=None, excess_si
     ]
 
     # transform busses first
-    for bus_dict in create_pypsa_busses(tessif_es.busses):
-        es.add(**bus_dict)
+    add_components_in_bulk(es, create_pypsa_busses(tessif_es.busses))
 
     # transform the basic components:
     for component in basic_transformations:
-        for comp_dict in globals()[f'create_pypsa_{component}'](
-                getattr(tessif_es, component), tessif_es.busses):
-            es.add(**comp_dict)
+        add_components_in_bulk(
+            es,
+            globals()[f'create_pypsa_{component}'](
+                getattr(tessif_es, component), tessif_es.busses),
+        )
 
     # sinks -> loads
     if not excess_sinks:
         excess_sinks = {}  # change None to empty dict to make it iterable
 
-    for sink_dict in create_pypsa_sinks(
+    add_components_in_bulk(
+        es,
+        create_pypsa_sinks(
             sinks=[sink for sink in tessif_es.sinks
                    if str(sink.uid) not in excess_sinks],
-            tessif_busses=tessif_es.busses):
-
-        es.add(**sink_dict)
+            tessif_busses=tessif_es.busses),
+    )
 
     setattr(es, "excess_sinks", excess_sinks)
-    for storage_dict in create_pypsa_excess_sinks(
+    add_components_in_bulk(
+        es,
+        create_pypsa_excess_sinks(
             sinks=[sink for sink in tessif_es.sinks
                    if str(sink.uid) in excess_sinks],
-            tessif_busses=tessif_es.busses):
-        es.add(**storage_dict)
+            tessif_busses=tessif_es.busses),
+    )
 
     # sources -> generators
-    for gen_dict in create_pypsa_generators_from_sources(
+    add_components_in_bulk(
+        es,
+        create_pypsa_generators_from_sources(
             sources=tessif_es.sources,
-            tessif_busses=tessif_es.busses):
-        es.add(**gen_dict)
+            tessif_busses=tessif_es.busses),
+    )
 
     # For now, chps from tessif's CHP class are treated like transformers.
-    for chp_dict in create_pypsa_links_from_transformers(
+    add_components_in_bulk(
+        es,
+        create_pypsa_links_from_transformers(
             transformers=tessif_es.chps,
-            tessif_busses=tessif_es.busses):
-        es.add(**chp_dict)
+            tessif_busses=tessif_es.busses),
+    )
 
     # handle the quite delicate task of transforming the transformers
     if transformer_style == 'links':
-        for link_dict in create_pypsa_links_from_transformers(
-                tessif_es.transformers):
-            es.add(**link_dict)
+        add_components_in_bulk(
+            es,
+            create_pypsa_links_from_transformers(
+                transformers=tessif_es.transformers,
+                tessif_busses=tessif_es.busses),
+        )
     else:
         # transform transformer according to the inferred type:
         transformer_types = infer_pypsa_transformer_types(
@@ -2125,13 +2245,15 @@ def transform(tessif_es, transformer_style='infer', forced_links=None, excess_si
             forced_links=forced_links)
 
         # transform transformers into generators:
-        for gen_dict in create_pypsa_generators_from_transformers(
-            transformers=[
-                transformer for transformer in tessif_es.transformers
-                if transformer.uid in transformer_types['generators']],
-            tessif_busses=tessif_es.busses
-        ):
-            es.add(**gen_dict)
+        add_components_in_bulk(
+            es,
+            create_pypsa_generators_from_transformers(
+                transformers=[
+                    transformer for transformer in tessif_es.transformers
+                    if transformer.uid in transformer_types['generators']],
+                tessif_busses=tessif_es.busses
+            ),
+        )
 
         # remove the subsequent supply chains:
         for comp_type, components_to_remove in compute_unneeded_supply_chains(
@@ -2176,13 +2298,15 @@ def transform(tessif_es, transformer_style='infer', forced_links=None, excess_si
                             )
 
         # transform transformers into links:
-        for gen_dict in create_pypsa_links_from_transformers(
-            transformers=[
-                transformer for transformer in tessif_es.transformers
-                if transformer.uid in transformer_types['links']],
-            tessif_busses=tessif_es.busses
-        ):
-            es.add(**gen_dict)
+        add_components_in_bulk(
+            es,
+            create_pypsa_links_from_transformers(
+                transformers=[
+                    transformer for transformer in tessif_es.transformers
+                    if transformer.uid in transformer_types['links']],
+                tessif_busses=tessif_es.busses
+            ),
+        )
 
     es.uid = tessif_es.uid
 
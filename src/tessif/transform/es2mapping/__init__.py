@@ -40,12 +40,16 @@ The beforementioned approach results in following benefits:
 Also refer to :mod:`tessif.examples` to see examples for the mentioned
 "benefits".
 """
-import pandas as pd
-
 import importlib
+import os
+import pathlib
+
+import numpy as np
+import pandas as pd
 
 
-def compile_result_data_representation(optimized_es, software, node):
+def compile_result_data_representation(
+        optimized_es, software, node, resultier=None):
     """
     Convenience wrapper to compile result data representation.
 
@@ -65,13 +69,123 @@ def compile_result_data_representation(optimized_es, software, node):
        String representing the node's
        :class:`uids <tessif.frused.namedtuples.Uid>` of which the result data
        representation is to be compiled.
+    resultier: AllResultier, default=None
+        Already existing ``AllResultier`` of
+        :paramref:`~compile_result_data_representation.optimized_es` the
+        representation is compiled from.
+
+        If ``None`` (default), the
+        :paramref:`~compile_result_data_representation.software` specific
+        ``AllResultier`` is created.
+
+    See also
+    --------
+    :func:`compile_result_data_representations` for compiling the
+    representations of many nodes and optimized energy systems at once.
+    """
+    if resultier is None:
+        resultier = _all_resultier(optimized_es, software)
+
+    # create a Pandas DataFrame to increase readability and math thesis layout:
+    result_df = pd.DataFrame(
+        _compile_result_data(resultier, node, resultier.outbounds[node]),
+        columns=['Label', 'Symbol', 'Value'])
+    result_df = result_df.set_index('Label')
+
+    return result_df
+
+
+def compile_result_data_representations(
+        optimized_energy_systems, nodes=None, directory=None, filename=None):
     """
+    Compile the result data representations of many nodes and optimized
+    energy systems at once.
+
+    Each energy system's results are mapped by a single ``AllResultier``,
+    from which the representations of all requested nodes are compiled.
+    See :func:`compile_result_data_representation` for the compiled results.
+
+    Parameters
+    ----------
+    optimized_energy_systems: ~collections.abc.Mapping
+        Optimized energy systems containing their results as in
+        tessif.simulate, keyed by the string naming the
+        :attr:`~tessif.frused.defaults.registered_models` they were
+        optimized with.
+    nodes: ~collections.abc.Iterable, default=None
+        Strings representing the nodes'
+        :class:`uids <tessif.frused.namedtuples.Uid>` of which the result
+        data representations are to be compiled. Nodes not present in one of
+        the energy systems are skipped.
+
+        If ``None`` (default), the representations of all nodes are compiled.
+    directory: str, ~pathlib.Path, default=None
+        If not ``None``, the representations are additionally stored as
+        parquet file in this directory. Values are stored as python literals
+        parsable by :func:`ast.literal_eval`.
+
+        Directory created if not present.
+    filename: str, default=None
+        Name of the stored parquet file. If set to ``None`` (default),
+        filename will be ``result_data_representations.parquet``.
+
+    Return
+    ------
+    representations: pandas.DataFrame
+        Long format table holding a row for each software, node and result
+        data, with the columns ``'Software'``, ``'Node'``, ``'Label'``,
+        ``'Symbol'`` and ``'Value'``.
+
+    Example
+    -------
+    Storing the representations of all nodes of a :ref:`supported model
+    <SupportedModels>`'s optimized energy system (here named
+    ``optimized_es``) and reading in only the loads::
+
+        representations = compile_result_data_representations(
+            {'omf': optimized_es}, directory='results')
+
+        import pyarrow.parquet as pq
+        loads = pq.read_table(
+            'results/result_data_representations.parquet',
+            filters=[('Label', '=', 'load')])
+    """
+    if nodes is not None:
+        nodes = list(dict.fromkeys(str(node) for node in nodes))
+
+    rows = list()
+    for software, optimized_es in optimized_energy_systems.items():
+        resultier = _all_resultier(optimized_es, software)
+
+        # outbounds are a property compiled on each access
+        outbounds = resultier.outbounds
+
+        es_nodes = resultier.nodes if nodes is None else [
+            node for node in nodes if node in resultier.uid_nodes]
+        for node in es_nodes:
+            rows.extend(
+                (software, node, *result_data) for result_data in
+                _compile_result_data(resultier, node, outbounds[node]))
+
+    representations = pd.DataFrame(
+        rows, columns=['Software', 'Node', 'Label', 'Symbol', 'Value'])
+
+    if directory is not None:
+        _write_result_data_representations(
+            representations, directory, filename)
+
+    return representations
+
+
+def _all_resultier(optimized_es, software):
     requested_model_result_parsing_module = importlib.import_module(
         '.'.join(['tessif.transform.es2mapping', software]))
 
-    resultier = requested_model_result_parsing_module.AllResultier(
-        optimized_es)
+    return requested_model_result_parsing_module.AllResultier(optimized_es)
 
+
+def _compile_result_data(resultier, node, node_outflows):
+    """Compile the result data of node as (label, symbol, value) tuples."""
     # compile first three straight forward result datas:
     result_data = [
         ('installed capacity', '$P_{cap}$',
@@ -89,21 +203,20 @@ def compile_result_data_representation(optimized_es, software, node):
         )
 
     # continue compiling the rest of the node data:
+    uid = resultier.uid_nodes[node]
     result_data.extend(
         [
-            ('energy carrier', '-', resultier.uid_nodes[node].carrier),
-            ('energy sector', '-', resultier.uid_nodes[node].sector),
-            ('region', '-', resultier.uid_nodes[node].region),
-            ('component', '-', resultier.uid_nodes[node].component),
-            ('node_type', '-', resultier.uid_nodes[node].node_type),
-            ('latitude', '-', resultier.uid_nodes[node].latitude),
-            ('longitude', '-', resultier.uid_nodes[node].longitude),
+            ('energy carrier', '-', uid.carrier),
+            ('energy sector', '-', uid.sector),
+            ('region', '-', uid.region),
+            ('component', '-', uid.component),
+            ('node_type', '-', uid.node_type),
+            ('latitude', '-', uid.latitude),
+            ('longitude', '-', uid.longitude),
         ],
     )
 
     # compile edge data
-    node_outflows = resultier.outbounds[node]
-
     net_energy_flows = dict()
     specific_costs = dict()
     specific_emissions = dict()
@@ -126,14 +239,7 @@ def compile_result_data_representation(optimized_es, software, node):
         ],
     )
 
-    # print(result_data)
-
-    # create a Pandas DataFrame to increase readability and math thesis layout:
-
-    result_df = pd.DataFrame(result_data, columns=['Label', 'Symbol', 'Value'])
-    result_df = result_df.set_index('Label')
-
-    return result_df
+    return result_data
 
 
 def _compile_node_from_res(resultier, attribute, node):
@@ -141,7 +247,9 @@ def _compile_node_from_res(resultier, attribute, node):
 
     if attribute == "node_load":
         new_result = dict()
-        for col in result.columns:
+        # duplicate labels (e.g. storage in- and outflows) are selected as
+        # data frames, keeping all of their columns
+        for col in dict.fromkeys(result.columns):
             new_result[col] = result[col].values.tolist()
         return new_result
 
@@ -149,3 +257,51 @@ def _compile_node_from_res(resultier, attribute, node):
         return dict(result)
     else:
         return result
+
+
+def _write_result_data_representations(
+        representations, directory, filename=None):
+    """Store the representations as parquet file of python literals."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as error:
+        raise ImportError(
+            "Writing parquet files requires pyarrow. Install it using "
+            "'pip install tessif-phd[parquet]'.") from error
+
+    # create output directory if necessary
+    pathlib.Path(os.path.abspath(directory)).mkdir(
+        parents=True, exist_ok=True)
+
+    if not filename:
+        filename = 'result_data_representations.parquet'
+
+    table = pa.table({
+        column: representations[column].astype(str).tolist()
+        for column in ['Software', 'Node', 'Label', 'Symbol']})
+    table = table.append_column('Value', pa.array(
+        [repr(_python_literal(value)) for value in representations['Value']],
+        type=pa.string()))
+
+    path = os.path.join(directory, filename)
+    pq.write_table(table, path)
+
+    return path
+
+
+def _python_literal(value):
+    """Turn value into a literal parsable by :func:`ast.literal_eval`.
+
+    Non finite floats are represented by their string representation.
+    """
+    if isinstance(value, dict):
+        return {_python_literal(key): _python_literal(val)
+                for key, val in value.items()}
+    if isinstance(value, (tuple, list, np.ndarray, pd.Series)):
+        return tuple(_python_literal(val) for val in value)
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return str(value)
+    return value
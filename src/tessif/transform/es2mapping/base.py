@@ -31,12 +31,14 @@ family then divides into a triangular like structure:
        in conjunction with :attr:`tessif.analyze.Comparatier.ICR_graphs`.
 """
 import abc
+import copy
 import inspect
 import logging
 import os
 import pathlib
 import pickle
 import collections
+import weakref
 from collections import defaultdict
 from itertools import cycle
 from math import copysign
@@ -60,6 +62,138 @@ import tessif.write.log as log
 esci = spellings.energy_system_component_identifiers
 logger = logging.getLogger(__name__)
 
+# Result contexts keyed by optimized energy system id. Each entry holds a weak
+# reference to the energy system, dropping the context once it is collected.
+_result_contexts = dict()
+
+
+def result_context(optimized_es):
+    """
+    Results already mapped out of an optimized energy system.
+
+    All :class:`resultiers <Resultier>` transforming the same optimized energy
+    system draw their expensive mappings (nodes, edges, loads, capacities,
+    flows, states of charge, ...) from this context, so each of them is
+    computed only once per solve, no matter how many resultiers are created.
+    Thats what allows e.g. an :class:`IntegratedGlobalResultier` to
+    instantiate flow and capacity resultiers without redoing their work.
+
+    The context lives as long as the optimized energy system does. Energy
+    systems that can not be weakly referenced get a fresh, unshared context.
+
+    Parameters
+    ----------
+    optimized_es:
+        :ref:`Model <SupportedModels>` specific, optimized energy system
+        containing its results.
+
+    Return
+    ------
+    context : dict
+        Mapping results keyed by the mapping implementation that
+        created them. Results are shared among resultiers and must not be
+        modified.
+
+    Examples
+    --------
+    >>> from tessif.transform.es2mapping import base
+    >>> class OptimizedEnergySystem:
+    ...     pass
+    >>> optimized_es = OptimizedEnergySystem()
+    >>> base.result_context(optimized_es) is base.result_context(optimized_es)
+    True
+    >>> base.result_context(optimized_es)['loads'] = 42
+    >>> base.drop_result_context(optimized_es)
+    >>> base.result_context(optimized_es)
+    {}
+    """
+    key = id(optimized_es)
+    entry = _result_contexts.get(key)
+    if entry is not None and entry[0]() is optimized_es:
+        return entry[1]
+
+    try:
+        reference = weakref.ref(
+            optimized_es,
+            lambda _, key=key: _result_contexts.pop(key, None))
+    except TypeError:
+        return dict()
+
+    context = dict()
+    _result_contexts[key] = (reference, context)
+
+    return context
+
+
+def drop_result_context(optimized_es):
+    """
+    Forget the results mapped out of an optimized energy system.
+
+    Needed only when an energy system object is optimized again in place,
+    so subsequently created resultiers map its new results.
+
+    Parameters
+    ----------
+    optimized_es:
+        :ref:`Model <SupportedModels>` specific, optimized energy system
+        containing its results.
+    """
+    entry = _result_contexts.get(id(optimized_es))
+    if entry is not None and entry[0]() is optimized_es:
+        del _result_contexts[id(optimized_es)]
+
+
+def _drop_window(optimized_es, timeslice):
+    """Forget the results mapped for the time window ``timeslice``."""
+    context = result_context(optimized_es)
+    for key in [key for key in context
+                if isinstance(key, tuple) and key[2] == timeslice]:
+        del context[key]
+
+
+def _column_keys(columns):
+    """Unique keys of the (possibly duplicate) column labels ``columns``,
+    numbering the occurrences of each label."""
+    occurrences = defaultdict(int)
+    keys = list()
+    for label in columns:
+        keys.append((label, occurrences[label]))
+        occurrences[label] += 1
+
+    return keys
+
+
+def _similar(result, previous, rtol, atol):
+    """Tell if timeseries ``result`` equals ``previous`` within the
+    tolerances, including the signs of its zeros."""
+    if not (result.index.equals(previous.index) and
+            list(result.columns) == list(previous.columns)):
+        return False
+
+    values = result.to_numpy(dtype='float64')
+    previous_values = previous.to_numpy(dtype='float64')
+
+    return (np.allclose(values, previous_values, rtol=rtol, atol=atol) and
+            np.array_equal(np.signbit(values), np.signbit(previous_values)))
+
+
+def _attribute_names(cls, including, excluding):
+    """Sorted names of the non routine attributes of ``cls`` containing
+    ``including`` but none of ``excluding``."""
+    names, seen = list(), set()
+    for klass in cls.__mro__:
+        for name, value in vars(klass).items():
+            if name in seen:
+                continue
+            seen.add(name)
+
+            if (including in name and
+                    not any(exclude in name for exclude in excluding) and
+                    not inspect.isroutine(value)):
+                names.append(name)
+
+    return tuple(sorted(names))
+
 
 class ESTransformer(abc.ABC):
     """
@@ -86,13 +220,63 @@ class ESTransformer(abc.ABC):
     #: defaults instead of None.
     defaults = {}
 
+    # Names of the node and edge attributes, registered per class by
+    # __init_subclass__ and used by node_data and edge_data.
+    _node_attribute_names = ()
+    _edge_attribute_names = ()
+
+    # Node and time window selection of the mapped results, see Resultier.
+    _node_selection = None
+    _timeslice = None
+
+    # Data type and sparseness the load results are stored with, see
+    # LoadResultier.
+    _load_storage = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._node_attribute_names = _attribute_names(
+            cls, including='node_', excluding=('_node',))
+        cls._edge_attribute_names = _attribute_names(
+            cls, including='edge_', excluding=('_edge', 'edge_data'))
+
     @log.timings
     def __init__(self, optimized_es, **kwargs):
         """
         """
-        self._nodes = self._map_nodes(optimized_es)
-        self._node_uids = self._map_node_uids(optimized_es)
-        self._edges = self._map_edges(optimized_es)
+        self._nodes = self._shared_mapping(
+            optimized_es, self._map_nodes, optimized_es, selective=False)
+        self._node_uids = self._shared_mapping(
+            optimized_es, self._map_node_uids, optimized_es, selective=False)
+        self._edges = self._shared_mapping(
+            optimized_es, self._map_edges, optimized_es, selective=False)
+
+    def _shared_mapping(self, optimized_es, mapping, *args, selective=True):
+        """Call ``mapping(*args)`` once per optimized energy system.
+
+        Results are stored in the :func:`result_context` of
+        :paramref:`~_shared_mapping.optimized_es` keyed by the mapping's
+        implementation, so resultiers sharing that implementation reuse them.
+        Results of ``selective`` mappings are additionally keyed by the
+        node and time window selection and the load storage they were
+        mapped for.
+        """
+        context = result_context(optimized_es)
+        key = self._mapping_key(mapping, selective=selective)
+        if key not in context:
+            context[key] = mapping(*args)
+
+        return context[key]
+
+    def _mapping_key(self, mapping, selective=True):
+        """Key the results of ``mapping`` are shared by, see
+        :meth:`_shared_mapping`."""
+        key = getattr(mapping, '__func__', mapping)
+        if selective:
+            key = (key, self._node_selection, self._timeslice,
+                   self._load_storage)
+
+        return key
 
     @abc.abstractmethod
     def _map_nodes(self, optimized_es):
@@ -262,11 +446,19 @@ class ESTransformer(abc.ABC):
 
         return _outbound
 
-    def node_data(self):
+    def node_data(self, attributes=None):
         r"""
         Function to get a ready to use dictionary of node attribute names and
         parameters as expected by other utilities throughout this framework.
 
+        Parameters
+        ----------
+        attributes: ~collections.abc.Iterable, default=None
+            Names of the node attributes to be returned. Only these are
+            computed. Names not registered as node attributes are ignored.
+
+            If set to ``None`` (default), all node attributes are returned.
+
         Return
         ------
         attributes: dict
@@ -285,22 +477,25 @@ class ESTransformer(abc.ABC):
         contain **_node** in their name. In fact being properties is not
         really necessary but a good practice anyways though.
 
+        Node attribute names are registered once per class on its
+        definition. Their values are computed on first request and reused
+        afterwards.
         """
-        # get all attributes of this instance as a list of (name, value):
-        attributes = inspect.getmembers(
-            self, lambda a: not(inspect.isroutine(a)))
-        # get all attributes starting with node_ but not _node
-        node_attribute_names = list(
-            a[0]for a in attributes if 'node_' in a[0] and '_node' not in a[0])
-        # return dict of node attrs ready to be used by i.e nxgraph.Graph
-        return {attr_name: getattr(self, attr_name)
-                for attr_name in node_attribute_names}
+        return self._attribute_data(self._node_attribute_names, attributes)
 
-    def edge_data(self):
+    def edge_data(self, attributes=None):
         r"""
         Function to get a ready to use dictionary of edge attribute names and
         parameters as expected by other utilities throughout tessif.
 
+        Parameters
+        ----------
+        attributes: ~collections.abc.Iterable, default=None
+            Names of the edge attributes to be returned. Only these are
+            computed. Names not registered as edge attributes are ignored.
+
+            If set to ``None`` (default), all edge attributes are returned.
+
         Return
         ------
         attributes: dict
@@ -319,33 +514,28 @@ class ESTransformer(abc.ABC):
         contain **_edge** in their name. In fact being properties is not
         really necessary but a good practice anyways though.
 
+        Edge attribute names are registered once per class on its
+        definition. Their values are computed on first request and reused
+        afterwards.
         """
-        # edge data should not consist of attributes having following tags
-        excluding = ['_edge', 'edge_data']
-        # edge data should consist of attributes having following tags
-        including = ['edge_']
+        return self._attribute_data(self._edge_attribute_names, attributes)
 
-        # aggregate edge attribute names
-        _edge_data = list()
-        for attr in dir(self):
-            if (any(include in attr for include in including) and
-                    not any(exclude in attr for exclude in excluding)):
+    def _attribute_data(self, registered, attributes=None):
+        """Map the requested, registered attribute names to their values.
 
-                _edge_data.append(attr)
-
-        return {attr_name: getattr(self, attr_name)
-                for attr_name in _edge_data}
-
-        # get all attributes of this instance as a list of (name, value):
-        attributes = inspect.getmembers(
-            self, lambda a: not(inspect.isroutine(a)))
+        Values are cached on the instance, so each attribute is computed only
+        once.
+        """
+        if attributes is not None:
+            attributes = set(attributes)
+            registered = [name for name in registered if name in attributes]
 
-        # get all attributes starting with edge_ but not _edge
-        edge_attribute_names = list(
-            a[0]for a in attributes if 'edge_' in a[0] and '_edge' not in a[0])
+        cache = self.__dict__.setdefault('_attribute_cache', dict())
+        for name in registered:
+            if name not in cache:
+                cache[name] = getattr(self, name)
 
-        return {attr_name: getattr(self, attr_name)
-                for attr_name in edge_attribute_names}
+        return {name: cache[name] for name in registered}
 
     def dump(self, directory=None, filename=None):
         """
@@ -517,12 +707,250 @@ class Resultier(ESTransformer):
     optimized_es:
         :ref:`Model <SupportedModels>` specific, optimized energy system
         containing its results.
+
+    nodes: ~collections.abc.Iterable, default=None
+        :ref:`Node uid representations <Labeling_Concept>` of the nodes
+        whose results are to be mapped. Results of all other nodes are left
+        out and, as far as the model allows, never extracted. Edge results
+        are mapped for the edges entering or leaving a selected node.
+
+        If set to ``None`` (default), results of all nodes are mapped.
+
+        Node and edge containers like :attr:`~ESTransformer.nodes` and
+        :attr:`~ESTransformer.edges` still describe the whole energy system.
+        Formatiers and hybridiers need the results of all nodes, so don't
+        provide a selection to them.
+
+    timeslice: slice, tuple, default=None
+        Start and stop (both inclusive) of the time window the timeseries
+        results are mapped for, given as :class:`slice` or tuple of labels
+        interpretable by :class:`pandas.Timestamp`. Results integrated over
+        time, like net energy flows or characteristic values, are integrated
+        over this window.
+
+        If set to ``None`` (default), the whole timeframe is mapped.
     """
 
-    def __init__(self, optimized_es, **kwargs):
+    def __init__(self, optimized_es, nodes=None, timeslice=None, **kwargs):
+
+        if nodes is not None:
+            self._node_selection = frozenset(str(node) for node in nodes)
+
+        if timeslice is not None:
+            if isinstance(timeslice, slice):
+                timeslice = (timeslice.start, timeslice.stop)
+            self._timeslice = tuple(
+                None if label is None else pd.Timestamp(label)
+                for label in timeslice)
 
         super().__init__(optimized_es=optimized_es, **kwargs)
 
+    def _selects(self, node):
+        """Return ``True`` if the results of ``node`` are to be mapped."""
+        return (self._node_selection is None or
+                str(node) in self._node_selection)
+
+    def _selected(self, mapping):
+        """Return ``mapping`` reduced to the selected nodes."""
+        if self._node_selection is None:
+            return mapping
+
+        return {node: value for node, value in mapping.items()
+                if self._selects(node)}
+
+    def _sliced(self, results):
+        """Return timeseries ``results`` reduced to the selected time window.
+        """
+        if (self._timeslice is None or
+                not isinstance(results.index, pd.DatetimeIndex)):
+            return results
+
+        return results.loc[slice(*self._timeslice)]
+
+    @classmethod
+    def from_resultier(cls, resultier, **kwargs):
+        """Create a formatier attached to an already existing resultier.
+
+        Instead of mapping the results of the optimized energy system again,
+        the created formatier shares the results already mapped by
+        :paramref:`~from_resultier.resultier` and only formats them.
+
+        Formatted results are memoized by their formatting options and
+        shared among all formatiers attached to the same resultier. So
+        re-styling, like coloring nodes by a different group, reuses
+        everything formatted before. Each formatier gets its own (shallow)
+        copy of the memoized mappings, so changing them in place, like
+        scaling a formatier's edge widths, does not affect the others.
+
+        Parameters
+        ----------
+        resultier: Resultier
+            Resultier providing all the results this class needs.
+            Usually an ``AllResultier``, ``AllFormatier`` or another
+            formatier of the same :ref:`model <SupportedModels>`.
+
+        kwargs:
+            Formatting options, like ``cgrp`` or ``drawutil``, passed to
+            the formatiers this class consists of.
+
+        Return
+        ------
+        formatier: Resultier
+            Instance of this class attached to
+            :paramref:`~from_resultier.resultier`.
+
+        Raises
+        ------
+        TypeError
+            If :paramref:`~from_resultier.resultier` does not provide the
+            results this class needs, or if any of the
+            :paramref:`~from_resultier.kwargs` is not a formatting option of
+            this class.
+        """
+        missing = dict.fromkeys(
+            klass.__name__ for klass in cls.__mro__
+            if issubclass(klass, ESTransformer)
+            and not hasattr(klass, '_format_results')
+            and not isinstance(resultier, klass))
+        if missing:
+            raise TypeError(
+                "Can't attach {} to a {}, which lacks the results of: {}"
+                .format(cls.__name__, type(resultier).__name__,
+                        ', '.join(missing)))
+
+        format_steps = [
+            vars(klass)['_format_results'] for klass in reversed(cls.__mro__)
+            if '_format_results' in vars(klass)]
+        known = {name for format_results in format_steps
+                 for name in inspect.signature(format_results).parameters}
+        unexpected = [name for name in kwargs if name not in known]
+        if unexpected:
+            raise TypeError(
+                "{}.from_resultier() got unexpected formatting options: {}"
+                .format(cls.__name__, ', '.join(unexpected)))
+
+        # share the formatting cache by sharing the instance attributes
+        resultier.__dict__.setdefault('_formatting_cache', dict())
+        formatier = cls.__new__(cls)
+        formatier.__dict__.update(
+            (key, value) for key, value in vars(resultier).items()
+            if key != '_attribute_cache')
+
+        # formatting options default to the ones of this class's __init__
+        options = {
+            name: parameter.default for name, parameter in
+            inspect.signature(cls.__init__).parameters.items()
+            if parameter.default is not parameter.empty}
+        options.update(kwargs)
+
+        # format like __init__ would, from the most basic formatier on
+        for format_results in format_steps:
+            parameters = inspect.signature(format_results).parameters
+            format_results(formatier, **{
+                name: value for name, value in options.items()
+                if name in parameters})
+
+        return formatier
+
+    def update(self, optimized_es, rtol=1e-05, atol=1e-08, **kwargs):
+        """Update this resultier to the results of a re-optimized energy
+        system.
+
+        Meant for energy systems optimized again after changing only a few
+        of their components, e.g. using
+        :func:`tessif.frused.hooks.tsf.reparameterize_components`.
+        Load results of nodes whose flows did not change beyond the
+        tolerances are reused instead of being remapped, as are their in-
+        and outflows and summed loads.
+
+        Note that updating does not scale with the number of changed nodes:
+
+            - To tell which flows changed, the loads of all nodes are still
+              mapped out of :paramref:`~update.optimized_es`. Only deriving
+              the in- and outflows and summed loads is skipped for the
+              unchanged nodes.
+            - All other results, like capacities, characteristic values,
+              costs and emissions, are mapped again for all nodes.
+
+        Parameters
+        ----------
+        optimized_es:
+            :ref:`Model <SupportedModels>` specific, optimized energy system
+            containing its results. Needs to consist of the same nodes and
+            edges this resultier was created for.
+        rtol: float, default=1e-05
+            Relative tolerance flows are compared with. See
+            :func:`numpy.allclose`.
+        atol: float, default=1e-08
+            Absolute tolerance flows are compared with. See
+            :func:`numpy.allclose`.
+        kwargs:
+            Key word arguments passed to the resultier's ``__init__`` along
+            with its node and time window selection and its load storage.
+            Like the reference values, those are not kept by resultiers
+            and need to be passed again.
+
+        Return
+        ------
+        changed: set
+            :ref:`Node uid representations <Labeling_Concept>` whose load
+            results were remapped. All of them for resultiers not mapping
+            loads.
+
+        Raises
+        ------
+        ValueError
+            If :paramref:`~update.optimized_es` consists of different nodes
+            or edges.
+        """
+        for mapping, mapped in (
+                (self._map_nodes, self._nodes),
+                (self._map_node_uids, self._node_uids),
+                (self._map_edges, self._edges)):
+            if self._shared_mapping(optimized_es, mapping, optimized_es,
+                                    selective=False) != mapped:
+                raise ValueError(
+                    "Can't update a resultier to an energy system of "
+                    "different nodes or edges. Create a new one instead.")
+
+        changed = self._reuse_results(optimized_es, rtol=rtol, atol=atol)
+
+        options = dict(nodes=self._node_selection, timeslice=self._timeslice)
+        if self._load_storage is not None:
+            options['dtype'], options['sparse'] = self._load_storage
+        options.update(kwargs)
+
+        # results derived on demand belong to the previous energy system
+        for cache in ('_attribute_cache', '_formatting_cache'):
+            self.__dict__.pop(cache, None)
+
+        type(self).__init__(self, optimized_es, **options)
+
+        return changed
+
+    def _reuse_results(self, optimized_es, rtol, atol):
+        """Provide the results of this resultier, that are still valid for
+        :paramref:`~_reuse_results.optimized_es`, to the resultiers of it.
+
+        Return the nodes whose results are mapped again. See
+        :meth:`update`.
+        """
+        return set(self.nodes)
+
+    def _formatted(self, mapping, *options):
+        """Call ``mapping()`` once per formatting ``options``.
+
+        Formatted results are shared among this formatier and all the
+        formatiers attached to it using :meth:`from_resultier`. Each of them
+        gets a shallow copy, so changing it in place affects no other one.
+        """
+        cache = self.__dict__.setdefault('_formatting_cache', dict())
+        key = (getattr(mapping, '__func__', mapping), options)
+        if key not in cache:
+            cache[key] = mapping()
+
+        return copy.copy(cache[key])
+
     @abc.abstractmethod
     def _map_nodes(self, optimized_es):
         pass
@@ -651,6 +1079,22 @@ class LoadResultier(Resultier):
         :ref:`Model <SupportedModels>` specific, optimized energy system
         containing its results.
 
+    dtype: str, numpy.dtype, default=None
+        Floating point data type the load results are stored with, like
+        ``'float32'`` to halve their memory footprint. Signed zeros are
+        preserved, so inflows stay distinguishable from outflows.
+
+        If set to ``None`` (default), the data type of the model's results is
+        kept.
+
+    sparse: bool, default=False
+        If ``True``, load result columns consisting of at least
+        :attr:`sparse_zero_share` zeros are stored as
+        :class:`pandas.arrays.SparseArray`. Their fill value is the signed
+        zero the column uses, so :func:`math.copysign` based in- and outflow
+        detection keeps working. Columns mixing ``0.0`` and ``-0.0`` stay
+        dense.
+
     See also
     --------
     For examples check one of the :ref:`model <SupportedModels>` specific
@@ -658,13 +1102,220 @@ class LoadResultier(Resultier):
     <tessif.transform.es2mapping.omf.LoadResultier>`.
     """
 
-    def __init__(self, optimized_es, **kwargs):
+    #: Minimum share of zeros a load result column needs to be stored sparse.
+    sparse_zero_share = 0.5
+
+    def __init__(self, optimized_es, dtype=None, sparse=False, **kwargs):
+
+        if dtype is not None or sparse:
+            self._load_storage = (
+                None if dtype is None else np.dtype(dtype).str, bool(sparse))
+
         super().__init__(optimized_es=optimized_es, **kwargs)
-        self._node_loads = self._map_loads(optimized_es)
+
+        (self._node_loads, self._inflows, self._outflows,
+         self._loads_old) = self._shared_mapping(
+             optimized_es, self._map_load_results, optimized_es)
+
+    @classmethod
+    def chunked(cls, optimized_es, timeframe, periods, **kwargs):
+        """Map the results in consecutive time windows, one after another.
+
+        Meant for post-processing results of very long horizons. In- and
+        outflows, summed loads and the results based on them are derived one
+        window at a time. The loads themselves are mapped out of the
+        optimized energy system only once, for the whole timeframe, when the
+        first window is mapped. Each window's loads are cut out of them, so
+        mapping a window does not get more expensive the longer the timeframe
+        is. Memory is needed for the whole timeframe's loads, as without
+        chunking, plus the results of a single window.
+
+        Each window's results are dropped from the :func:`result_context`
+        once the next window is mapped. Use a :class:`LoadAggregator` to
+        aggregate the results over all windows.
+
+        Parameters
+        ----------
+        optimized_es:
+            :ref:`Model <SupportedModels>` specific, optimized energy system
+            containing its results.
+        timeframe: pandas.DatetimeIndex
+            Timesteps :paramref:`~chunked.optimized_es` was optimized for.
+        periods: int
+            Number of timesteps per window.
+        kwargs:
+            Key word arguments passed to each window's resultier, like
+            ``dtype`` or ``nodes``.
+
+        Yields
+        ------
+        resultier: LoadResultier
+            Resultier of this class mapping the results of one window.
+
+        Example
+        -------
+        Aggregating the loads of a :ref:`supported model
+        <SupportedModels>`'s optimized energy system (here named
+        ``optimized_es``) day by day, for a timeframe of 15 minute
+        resolution::
+
+            aggregator = LoadAggregator()
+            for resultier in omf.LoadResultier.chunked(
+                    optimized_es, timeframe, periods=96):
+                aggregator.add(resultier)
+
+            aggregator.means['Power Line']
+        """
+        # loads of the whole timeframe, mapped along with the first window
+        horizon = dict()
+        for start in range(0, len(timeframe), periods):
+            window = timeframe[start:start + periods]
+            resultier = cls.__new__(cls)
+            resultier._horizon_loads = horizon
+            cls.__init__(resultier, optimized_es,
+                         timeslice=(window[0], window[-1]), **kwargs)
+            del resultier._horizon_loads
+
+            try:
+                yield resultier
+            finally:
+                _drop_window(optimized_es, resultier._timeslice)
+
+    def _map_load_results(self, optimized_es):
+        """Map loads, in- and outflows and summed loads and store them as
+        requested by :paramref:`~LoadResultier.dtype` and
+        :paramref:`~LoadResultier.sparse`."""
+        self._node_loads = self._map_window_loads(optimized_es)
         self._inflows = self._map_inflows()
         self._outflows = self._map_outflows()
         self._loads_old = self._map_summed_loads()
 
+        results = (self._node_loads, self._inflows, self._outflows,
+                   self._loads_old)
+
+        if self._load_storage is None:
+            return results
+
+        return tuple(
+            {node: self._stored(result) for node, result in mapping.items()}
+            for mapping in results)
+
+    def _map_window_loads(self, optimized_es):
+        """Map the loads of the selected time window.
+
+        When mapping window by window (see :meth:`chunked`), the loads of the
+        whole timeframe are mapped only once and each window is cut out of
+        them.
+        """
+        horizon = self.__dict__.get('_horizon_loads')
+        if horizon is None or self._timeslice is None:
+            return self._map_loads(optimized_es)
+
+        if 'loads' not in horizon:
+            timeslice, self._timeslice = self._timeslice, None
+            try:
+                horizon['loads'] = self._map_loads(optimized_es)
+            finally:
+                self._timeslice = timeslice
+
+        return {node: self._sliced(load)
+                for node, load in horizon['loads'].items()}
+
+    def _reuse_results(self, optimized_es, rtol, atol):
+        """Provide the load results of nodes whose flows did not change to the
+        resultiers of :paramref:`~_reuse_results.optimized_es`.
+
+        Return the nodes whose flows changed. See :meth:`Resultier.update`.
+        """
+        context = result_context(optimized_es)
+        key = self._mapping_key(self._map_load_results)
+
+        if key in context:
+            loads = context[key][0]
+        else:
+            loads = self._map_loads(optimized_es)
+
+        changed = {
+            node for node, load in loads.items()
+            if node not in self._node_loads or
+            not _similar(load, self._node_loads[node], rtol, atol)}
+
+        if key in context:
+            return changed
+
+        # derive the results of the changed nodes only, using a copy of this
+        # resultier knowing nothing but their loads
+        partial = type(self).__new__(type(self))
+        partial.__dict__.update(self.__dict__)
+        partial._node_loads = {node: loads[node] for node in changed}
+        partial._inflows = partial._map_inflows()
+        partial._outflows = partial._map_outflows()
+        partial._node_selection = frozenset(changed)
+        summed_loads = partial._map_summed_loads()
+
+        def merged(previous, mapped, order):
+            results = dict()
+            for node in order:
+                if node not in changed:
+                    results[node] = previous[node]
+                elif self._load_storage is None:
+                    results[node] = mapped[node]
+                else:
+                    results[node] = self._stored(mapped[node])
+
+            return results
+
+        context[key] = (
+            merged(self._node_loads, loads, loads),
+            merged(self._inflows, partial._inflows, loads),
+            merged(self._outflows, partial._outflows, loads),
+            merged(self._loads_old, summed_loads, self._loads_old))
+
+        return changed
+
+    def _stored(self, result):
+        """Return the load ``result`` (:class:`pandas.DataFrame` or
+        :class:`pandas.Series`) using the requested storage."""
+        dtype, sparse = self._load_storage
+
+        if dtype is not None:
+            result = result.astype(dtype)
+
+        if not sparse:
+            return result
+
+        if isinstance(result, pd.Series):
+            return self._sparse(result)
+
+        if result.columns.empty:
+            return result
+
+        stored = pd.concat(
+            [self._sparse(column) for _, column in result.items()],
+            axis='columns')
+        stored.columns = result.columns
+
+        return stored
+
+    def _sparse(self, series):
+        """Store mostly zero ``series`` sparse, filled with its signed zero.
+        """
+        values = series.to_numpy()
+        zeros = values == 0
+
+        if not len(values) or zeros.mean() < self.sparse_zero_share:
+            return series
+
+        negative = np.signbit(values[zeros])
+        if negative.all():
+            fill_value = -0.0
+        elif not negative.any():
+            fill_value = 0.0
+        else:
+            return series
+
+        return series.astype(pd.SparseDtype(series.dtype, fill_value))
+
     @property
     def node_load(self):
         """ Timeseries flow results mapped to their
@@ -868,6 +1519,9 @@ class LoadResultier(Resultier):
         """
         _summed_loads = defaultdict(lambda: pd.DataFrame())
         for representation, uid in self.uid_nodes.items():
+            if not self._selects(representation):
+                continue
+
             if uid.component in spellings.sink:
                 series = self.node_inflows[representation].sum(axis='columns')
             else:
@@ -878,6 +1532,180 @@ class LoadResultier(Resultier):
         return dict(_summed_loads)
 
 
+class LoadAggregator:
+    """
+    Running aggregates of load results mapped window by window.
+
+    Aggregates are kept per node and load column, so they take up
+    constant memory no matter how many timesteps are added. Columns are
+    matched by label and, for duplicate labels (like the in- and outflows
+    of storages), by their order. See :meth:`LoadResultier.chunked`.
+
+    Example
+    -------
+    >>> import pandas as pd
+    >>> from tessif.transform.es2mapping.base import LoadAggregator
+    >>> from types import SimpleNamespace
+    >>> aggregator = LoadAggregator()
+    >>> for flows in ([-1.0, -2.0], [-3.0, -6.0]):
+    ...     aggregator.add(SimpleNamespace(
+    ...         node_load={'Sink': pd.DataFrame({'Power Line': flows})},
+    ...         node_summed_loads={'Sink': -pd.Series(flows)}))
+    >>> print(aggregator.means['Sink'])
+    Power Line   -3.0
+    dtype: float64
+    >>> print(aggregator.summed_maxima['Sink'])
+    6.0
+    >>> print(aggregator.characteristic_values({'Sink': 10})['Sink'])
+    0.3
+    """
+
+    def __init__(self):
+        self._counts = defaultdict(int)
+        self._columns = dict()
+        self._sums = dict()
+        self._maxima = dict()
+        self._minima = dict()
+        self._summed_counts = defaultdict(int)
+        self._summed_sums = defaultdict(float)
+        self._summed_maxima = dict()
+
+    def add(self, resultier):
+        """Add the :attr:`~LoadResultier.node_load` and
+        :attr:`~LoadResultier.node_summed_loads` results of a resultier
+        mapping the next window."""
+        for node, load in resultier.node_load.items():
+            values = load.to_numpy(dtype='float64')
+            if not len(values):
+                continue
+
+            positions = self._positions(node, load.columns)
+            self._counts[node] += len(values)
+            self._sums[node][positions] += values.sum(axis=0)
+            self._maxima[node][positions] = np.fmax(
+                self._maxima[node][positions], values.max(axis=0))
+            self._minima[node][positions] = np.fmin(
+                self._minima[node][positions], values.min(axis=0))
+
+        for node, summed_load in resultier.node_summed_loads.items():
+            values = summed_load.to_numpy(dtype='float64')
+            if not len(values):
+                continue
+
+            self._summed_counts[node] += len(values)
+            self._summed_sums[node] += values.sum()
+            self._summed_maxima[node] = max(
+                self._summed_maxima.get(node, -np.inf), values.max())
+
+    def _positions(self, node, columns):
+        """Positions of the load ``columns`` in the aggregates of ``node``.
+        Aggregates are extended by the columns not seen before."""
+        keys = _column_keys(columns)
+        known = self._columns.setdefault(node, list())
+        if keys == known and node in self._sums:
+            return slice(None)
+
+        indices = {key: position for position, key in enumerate(known)}
+        added = [key for key in keys if key not in indices]
+        if added or node not in self._sums:
+            known.extend(added)
+            for aggregates, initial in ((self._sums, 0.0),
+                                        (self._maxima, -np.inf),
+                                        (self._minima, np.inf)):
+                aggregates[node] = np.concatenate([
+                    aggregates.get(node, np.empty(0)),
+                    np.full(len(added), initial)])
+            indices.update((key, len(known) - len(added) + position)
+                           for position, key in enumerate(added))
+
+        return np.array([indices[key] for key in keys], dtype=int)
+
+    def _labelled(self, aggregates):
+        """Return the node wise ``aggregates`` as :class:`pandas.Series`
+        keyed by column."""
+        return {node: pd.Series(values, index=pd.Index(
+                    [label for label, _ in self._columns[node]]))
+                for node, values in aggregates.items()}
+
+    @property
+    def sums(self):
+        """Load sums mapped to their :ref:`node uid representation
+        <Labeling_Concept>`, as :class:`pandas.Series` keyed by column."""
+        return self._labelled(self._sums)
+
+    @property
+    def means(self):
+        """Mean loads mapped to their :ref:`node uid representation
+        <Labeling_Concept>`, as :class:`pandas.Series` keyed by column."""
+        return self._labelled({node: sums / self._counts[node]
+                               for node, sums in self._sums.items()})
+
+    @property
+    def maxima(self):
+        """Maximum loads mapped to their :ref:`node uid representation
+        <Labeling_Concept>`, as :class:`pandas.Series` keyed by column."""
+        return self._labelled(self._maxima)
+
+    @property
+    def minima(self):
+        """Minimum loads mapped to their :ref:`node uid representation
+        <Labeling_Concept>`, as :class:`pandas.Series` keyed by column."""
+        return self._labelled(self._minima)
+
+    @property
+    def summed_sums(self):
+        """Sums of the :attr:`~LoadResultier.node_summed_loads` mapped to
+        their :ref:`node uid representation <Labeling_Concept>`."""
+        return dict(self._summed_sums)
+
+    @property
+    def summed_means(self):
+        """Means of the :attr:`~LoadResultier.node_summed_loads` mapped to
+        their :ref:`node uid representation <Labeling_Concept>`."""
+        return {node: summed_sum / self._summed_counts[node]
+                for node, summed_sum in self._summed_sums.items()}
+
+    @property
+    def summed_maxima(self):
+        """Maxima of the :attr:`~LoadResultier.node_summed_loads` mapped to
+        their :ref:`node uid representation <Labeling_Concept>`."""
+        return dict(self._summed_maxima)
+
+    def characteristic_values(self, installed_capacities):
+        """Characteristic values of the aggregated nodes.
+
+        Calculated as :attr:`summed_means` divided by the installed
+        capacity, as :attr:`CapacityResultier.node_characteristic_value`
+        defines them for sources, sinks and transformers.
+
+        Parameters
+        ----------
+        installed_capacities: ~collections.abc.Mapping
+            Installed capacities mapped to their :ref:`node uid
+            representation <Labeling_Concept>`. Like the
+            :attr:`CapacityResultier.node_installed_capacity` of the first
+            window.
+
+        Return
+        ------
+        characteristic_values: dict
+            Characteristic values mapped to their :ref:`node uid
+            representation <Labeling_Concept>`. ``None`` for nodes of
+            variable or multiple installed capacities.
+        """
+        characteristic_values = dict()
+        for node, summed_mean in self.summed_means.items():
+            capacity = installed_capacities.get(node)
+            if (capacity is None or
+                    isinstance(capacity, collections.abc.Iterable) or
+                    not capacity):
+                characteristic_values[node] = None
+            else:
+                characteristic_values[node] = summed_mean / capacity
+
+        return characteristic_values
+
+
 class CapacityResultier(Resultier):
     r"""Transforming installed capacity results dictionaries keyed by node.
 
@@ -914,15 +1742,16 @@ class CapacityResultier(Resultier):
         super().__init__(optimized_es=optimized_es, **kwargs)
 
         # do the mapping
-        self._installed_capacities = self._map_installed_capacities(
-            optimized_es)
-        self._original_capacities = self._map_original_capacities(
-            optimized_es)
+        self._installed_capacities = self._shared_mapping(
+            optimized_es, self._map_installed_capacities, optimized_es)
+        self._original_capacities = self._shared_mapping(
+            optimized_es, self._map_original_capacities, optimized_es)
 
-        self._expansion_costs = self._map_expansion_costs(optimized_es)
+        self._expansion_costs = self._shared_mapping(
+            optimized_es, self._map_expansion_costs, optimized_es)
 
-        self._characteristic_values = self._map_characteristic_values(
-            optimized_es)
+        self._characteristic_values = self._shared_mapping(
+            optimized_es, self._map_characteristic_values, optimized_es)
         self._reference_capacity = self._map_reference_capacity(
             reference=reference_capacity)
 
@@ -1093,7 +1922,8 @@ class StorageResultier(Resultier):
 
     def __init__(self, optimized_es, **kwargs):
         super().__init__(optimized_es=optimized_es, **kwargs)
-        self._states_of_charge = self._map_states_of_charge(optimized_es)
+        self._states_of_charge = self._shared_mapping(
+            optimized_es, self._map_states_of_charge, optimized_es)
 
     @property
     def node_soc(self):
@@ -1353,10 +2183,12 @@ class FlowResultier(Resultier):
         super().__init__(optimized_es=optimized_es, **kwargs)
 
         # do the mapping
-        self._net_energy_flows = self._map_net_energy_flows(optimized_es)
-        self._specific_flow_costs = self._map_specific_flow_costs(optimized_es)
-        self._specific_emissions = self._map_specific_emissions(
-            optimized_es)
+        self._net_energy_flows = self._shared_mapping(
+            optimized_es, self._map_net_energy_flows, optimized_es)
+        self._specific_flow_costs = self._shared_mapping(
+            optimized_es, self._map_specific_flow_costs, optimized_es)
+        self._specific_emissions = self._shared_mapping(
+            optimized_es, self._map_specific_emissions, optimized_es)
         self._edge_weights = self._map_edge_weights()
         self._edge_len = self._map_edge_lens()
 
@@ -1387,6 +2219,9 @@ class FlowResultier(Resultier):
         """
         incurred_costs = {}
         for edge in self.edges:
+            if not self._selects_edge(edge):
+                continue
+
             ics = self._specific_flow_costs[edge] * \
                 self.edge_net_energy_flow[edge]
             incurred_costs[edge] = ics
@@ -1404,6 +2239,9 @@ class FlowResultier(Resultier):
         """
         emissions_caused = {}
         for edge in self.edges:
+            if not self._selects_edge(edge):
+                continue
+
             ics = self.edge_specific_emissions[edge] * \
                 self.edge_net_energy_flow[edge]
             emissions_caused[edge] = ics
@@ -1482,13 +2320,27 @@ class FlowResultier(Resultier):
         """
         _net_energy_flows = defaultdict(float)
         for node in self.nodes:
+            if not self._selects(node):
+                continue
+
             for inflow in self.node_inflows[node].columns:
                 _net_energy_flows[
                     nts.Edge(inflow, node)] = round(self.node_inflows[
                         node][inflow].sum(axis='index'), 2)
 
+            # flows into unselected nodes are only known as outflows
+            for outflow in self.node_outflows[node].columns:
+                if not self._selects(outflow):
+                    _net_energy_flows[
+                        nts.Edge(node, outflow)] = round(self.node_outflows[
+                            node][outflow].sum(axis='index'), 2)
+
         return dict(_net_energy_flows)
 
+    def _selects_edge(self, edge):
+        """Return ``True`` if the results of ``edge`` are to be mapped."""
+        return self._selects(edge.source) or self._selects(edge.target)
+
     @abc.abstractmethod
     def _map_specific_flow_costs(self, optimized_es):
         """Interface for mapping the specific flow cost results to their
@@ -1529,7 +2381,7 @@ class FlowResultier(Resultier):
         """
         # Use default dict as edge weights container:
         _edge_weights = defaultdict(float)
-        max_costs = max(self._specific_flow_costs.values())
+        max_costs = max(self._specific_flow_costs.values(), default=0)
 
         # Map the respective edge weights:
         if max_costs > 0:
@@ -1562,7 +2414,8 @@ class FlowResultier(Resultier):
 
     def _map_reference_emissions(self, reference):
         if reference is None:
-            reference_emissions = max(self.edge_specific_emissions.values())
+            reference_emissions = max(
+                self.edge_specific_emissions.values(), default=0)
             if reference_emissions == 0:
                 reference_emissions = 1
         else:
@@ -1572,7 +2425,8 @@ class FlowResultier(Resultier):
 
     def _map_reference_net_energy_flow(self, reference):
         if reference is None:
-            reference_net_energy_flow = max(self.edge_net_energy_flow.values())
+            reference_net_energy_flow = max(
+                self.edge_net_energy_flow.values(), default=0)
         else:
             reference_net_energy_flow = reference
 
@@ -1592,10 +2446,12 @@ class LabelFormatier(Resultier):
 
     def __init__(self, optimized_es, **kwargs):
         super().__init__(optimized_es=optimized_es, **kwargs)
+        LabelFormatier._format_results(self)
 
-        # mappings
-        self._node_summaries = self._map_node_labels()
-        self._edge_summaries = self._map_edge_labels()
+    def _format_results(self):
+        """Format the labels, see :meth:`Resultier.from_resultier`."""
+        self._node_summaries = self._formatted(self._map_node_labels)
+        self._edge_summaries = self._formatted(self._map_edge_labels)
 
     @property
     def node_summaries(self):
@@ -1809,15 +2665,30 @@ class MplLegendFormatier(Resultier):
         :attr:`NodeFormatier.node_shape`.
     """
 
+    #: Model specific :class:`NodeFormatier` the legend markers and colors
+    #: are inferred from.
+    node_formatier_class = None
+
     def __init__(self, optimized_es, cgrp='all',
                  markers='formatier', **kwargs):
         super().__init__(optimized_es=optimized_es, **kwargs)
+        MplLegendFormatier._format_results(self, cgrp=cgrp, markers=markers)
 
+    def _format_results(self, cgrp='all', markers='formatier'):
+        """Format the legends, see :meth:`Resultier.from_resultier`."""
         self._cgrp = cgrp
         self._markers = markers
-        self._node_legend = self._create_node_legend()
-        self._node_style_legend = self._create_node_style_legend()
-        self._edge_style_legend = self._create_edge_style_legend()
+
+        # legends need all node color groups and networkx node styles,
+        # formatted by a node formatier attached to this one
+        self._nformats = self.node_formatier_class.from_resultier(
+            self, drawutil='nx', cgrp='all')
+
+        self._node_legend = self._formatted(self._create_node_legend, markers)
+        self._node_style_legend = self._formatted(
+            self._create_node_style_legend)
+        self._edge_style_legend = self._formatted(
+            self._create_edge_style_legend)
 
     @property
     def node_legend(self):
@@ -2173,7 +3044,10 @@ class NodeFormatier(Resultier):
 
     def __init__(self, optimized_es, cgrp='name', drawutil='nx', **kwargs):
         super().__init__(optimized_es=optimized_es, **kwargs)
+        NodeFormatier._format_results(self, cgrp=cgrp, drawutil=drawutil)
 
+    def _format_results(self, cgrp='name', drawutil='nx'):
+        """Format the nodes, see :meth:`Resultier.from_resultier`."""
         self._cgrp = cgrp
 
         if drawutil not in ['dc', 'nx']:
@@ -2191,18 +3065,19 @@ class NodeFormatier(Resultier):
         if self._drawutil == 'nx':
             # mappings for networkx
             self._default_node_shapes = defaults.nxgrph_node_shapes
-            self._node_shape = self._map_nx_node_shapes()
-            self._node_size = self._map_nx_node_sizes()
+            self._node_shape = self._formatted(self._map_nx_node_shapes)
+            self._node_size = self._formatted(self._map_nx_node_sizes)
 
         # mappings for dash cytoscape
         if self._drawutil == 'dc':
             self._default_node_shapes = defaults.dcgrph_node_shapes
-            self._node_shape = self._map_dc_node_shapes()
-            self._node_size = self._map_dc_node_sizes()
+            self._node_shape = self._formatted(self._map_dc_node_shapes)
+            self._node_size = self._formatted(self._map_dc_node_sizes)
 
-        self._node_fill_size = self._map_node_fill_size()
-        self._node_color = self._map_node_colors()
-        self._node_color_maps = self._map_node_color_maps()
+        self._node_fill_size = self._formatted(
+            self._map_node_fill_size, self._drawutil)
+        self._node_color = self._formatted(self._map_node_colors)
+        self._node_color_maps = self._formatted(self._map_node_color_maps)
 
     @property
     def node_shape(self):
@@ -2815,7 +3690,10 @@ class EdgeFormatier(Resultier):
     def __init__(self, optimized_es, drawutil='nx', cls=None, **kwargs):
 
         super().__init__(optimized_es=optimized_es, **kwargs)
+        EdgeFormatier._format_results(self, drawutil=drawutil, cls=cls)
 
+    def _format_results(self, drawutil='nx', cls=None):
+        """Format the edges, see :meth:`Resultier.from_resultier`."""
         # parse drawutil arg
         if drawutil not in ['dc', 'nx']:
             logger.warning(
@@ -2831,22 +3709,23 @@ class EdgeFormatier(Resultier):
 
         # broaden edges based on drawutil:
         if self._drawutil == 'nx':
-            self._edge_width = self._map_nx_edge_width()
-            self._edge_color = self._map_nx_edge_colors()
+            self._edge_width = self._formatted(self._map_nx_edge_width)
+            self._edge_color = self._formatted(self._map_nx_edge_colors)
 
             _cls = ([0, .33, .66], [':', '--', '-'])
             # style translates to ['dotted', 'dashed', 'solid']
 
         # mappings for dash cytoscape
         if self._drawutil == 'dc':
-            self._edge_width = self._map_dc_edge_width()
-            self._edge_color = self._map_dc_edge_colors()
+            self._edge_width = self._formatted(self._map_dc_edge_width)
+            self._edge_color = self._formatted(self._map_dc_edge_colors)
             _cls = ([0, .33, .66], ['dotted', 'dashed', 'solid'])
 
         if not cls:
             self._cls = nts.CLS(*_cls)
 
-        self._edge_linestyle = self._map_edge_linestyles()
+        self._edge_linestyle = self._formatted(
+            self._map_edge_linestyles, tuple(map(tuple, self._cls)))
 
     @property
     def edge_width(self):
@@ -7,6 +7,7 @@ postprocessing results and providing a tessif uniform interface.
 from collections import defaultdict, abc
 import logging
 
+import numpy as np
 import pandas as pd
 
 from tessif.frused import namedtuples as nts
@@ -606,91 +607,88 @@ class LoadResultier(CalliopeResultier, base.LoadResultier):
         # technology - node rename utility to be able to search for calliope tech name
         rename = self._rename_nodes(optimized_es=optimized_es)
 
+        timesteps = pd.to_datetime(optimized_es.results.timesteps.data)
+
+        # pull the production results out of calliope's DataArray once,
+        # rows are loc_tech_carriers_prod, columns are timesteps
+        carrier_prod = optimized_es.results.carrier_prod
+        production = np.asarray(carrier_prod.data)
+        transmissions = self._map_transmission_rows(
+            carrier_prod.loc_tech_carriers_prod.data)
+
+        # group the edges by their calliope source and target names
+        out_edges, in_edges = defaultdict(list), defaultdict(list)
+        for tsf_source, tsf_target in self.edges:
+            source, target = rename[tsf_source], rename[tsf_target]
+            rows = transmissions.get((source, target), [])
+
+            out_edges[source].extend((str(tsf_target), row) for row in rows)
+            if target != source:
+                in_edges[target].extend((str(tsf_source), row) for row in rows)
+
         for node, uid in self.uid_nodes.items():
+            if not self._selects(node):
+                continue
 
             # uid rename utility to be able to search for calliope tech name
             node = rename[node]
 
-            timesteps = optimized_es.results.timesteps.data
-            timesteps = pd.to_datetime(timesteps)
-
             outflows = pd.DataFrame(index=timesteps)
             inflows = pd.DataFrame(index=timesteps)
 
-            for edge in self.edges:
-                source, target = edge
+            if out_edges[node]:
+                names, rows = zip(*out_edges[node])
+                block = production[list(rows)]
+                # make "-0" to "0"
+                outflows = pd.concat([outflows, pd.DataFrame(
+                    np.where(block == 0, 0.0, block).T,
+                    index=timesteps, columns=list(names))], axis='columns')
+
+            if in_edges[node]:
+                names, rows = zip(*in_edges[node])
+                block = production[list(rows)]
+                # make values negative and "0" to "-0"
+                inflows = pd.concat([inflows, pd.DataFrame(
+                    np.where(block == 0, -0.0, -block).T,
+                    index=timesteps, columns=list(names))], axis='columns')
 
-                tsf_source = source
-                tsf_target = target
-                # uid rename utility to be able to search for calliope tech name
-                source = rename[source]
-                target = rename[target]
+            time_series_results = pd.concat(
+                [inflows, outflows], axis='columns')
+            time_series_results.columns.name = uid.name
 
-                if source == node:
-                    for count, connection in enumerate(
-                            optimized_es.results.carrier_prod.loc_tech_carriers_prod.data):
+            _loads[uid.name] = self._sliced(time_series_results)
 
-                        if 'transmission' in str(connection):
-                            # connection string will now be like 'consumer::transmission:producer::carrier'
-                            con = str(connection).split(':')[0]
-                            prod = str(connection).split(':')[3]
+        return dict(_loads)
 
-                            if f'{source} location' == prod or source == prod or f'{source} reverse' == prod:
-                                if f'{target} location' == con or target == con or f'{target} reverse' == con:
-                                    # busses don't have the location added. Connector has reverse added
+    @staticmethod
+    def _map_transmission_rows(loc_tech_carriers):
+        """Map (producer, consumer) calliope names to the rows of their
+        transmission results.
 
-                                    # if source in prod doesn't work cause some components
-                                    # might be same as another ones substring. e.g. 'x supply' and 'x supply line'
-                                    production = optimized_es.results.carrier_prod.data[count].transpose(
-                                    )
-                                    production = pd.DataFrame(
-                                        data=production, index=timesteps,
-                                        columns={f"{tsf_target}"})
-                                    # make "-0" to "0"
-                                    production = production.replace(
-                                        {-float(0): float(0)})
-                                    outflows = pd.concat(
-                                        [outflows, production], axis='columns')
-
-                elif target == node:
-                    for count, connection in enumerate(
-                            optimized_es.results.carrier_prod.loc_tech_carriers_prod.data):
-                        # working with carrier_con instead of carrier_prod doesnt work due to
-                        # connectors which then being shown wrong when looking at busses.
-                        # This happens due to the fact that conversion doesnt happen in connector
-                        # itself but at the transmission between connector and bus.
-
-                        if 'transmission' in str(connection):
-                            # connection string will now be like 'consumer::transmission:producer::carrier'
-                            con = str(connection).split(':')[0]
-                            prod = str(connection).split(':')[3]
-
-                            if f'{source} location' == prod or source == prod or f'{source} reverse' == prod:
-                                if f'{target} location' == con or target == con or f'{target} reverse' == con:
-                                    # busses don't have the location added. Connector has reverse added
-
-                                    # if source in prod doesn't work cause some components
-                                    # might be same as another ones substring. e.g. 'x supply' and 'x supply line'
-                                    consumption = optimized_es.results.carrier_prod.data[count].transpose(
-                                    )
-                                    consumption = pd.DataFrame(
-                                        data=consumption, index=timesteps,
-                                        columns={f"{tsf_source}"})
-                                    # make values negative
-                                    consumption = consumption.multiply(-1)
-                                    # make "0" to "-0"
-                                    consumption = consumption.replace(
-                                        {0: -float(0), float(0): -float(0)})
-                                    inflows = pd.concat(
-                                        [inflows, consumption], axis='columns')
+        Transmission results are labeled like
+        ``'consumer::transmission:producer::carrier'``. Busses don't have
+        the location added, connectors have reverse added, so producer and
+        consumer are mapped by their plain names as well as by their names
+        without a ``' location'`` or ``' reverse'`` suffix.
+        """
+        def names(location):
+            yield location
+            for suffix in (' location', ' reverse'):
+                if location.endswith(suffix):
+                    yield location[:-len(suffix)]
 
-            time_series_results = pd.concat(
-                [inflows, outflows], axis='columns')
-            time_series_results.columns.name = uid.name
+        rows = defaultdict(list)
+        for row, connection in enumerate(loc_tech_carriers):
+            connection = str(connection)
+            if 'transmission' in connection:
+                parts = connection.split(':')
+                consumer, producer = parts[0], parts[3]
 
-            _loads[uid.name] = time_series_results
+                for source in set(names(producer)):
+                    for target in set(names(consumer)):
+                        rows[(source, target)].append(row)
 
-        return dict(_loads)
+        return dict(rows)
 
 
 class CapacityResultier(base.CapacityResultier, LoadResultier):
@@ -810,6 +808,8 @@ class CapacityResultier(base.CapacityResultier, LoadResultier):
         inst_cap = 0
 
         for node, uid in self.uid_nodes.items():
+            if not self._selects(node):
+                continue
 
             # uid rename utility to be able to search for calliope tech name
             node = rename[node]
@@ -910,6 +910,8 @@ class CapacityResultier(base.CapacityResultier, LoadResultier):
         inst_cap = 0
 
         for node, uid in self.uid_nodes.items():
+            if not self._selects(node):
+                continue
 
             # uid rename utility to be able to search for calliope tech name
             node = rename[node]
@@ -1021,6 +1023,8 @@ class CapacityResultier(base.CapacityResultier, LoadResultier):
 
         # Map the respective expansion costs:
         for node, uid in self.uid_nodes.items():
+            if not self._selects(node):
+                continue
 
             exp_cost = 0
 
@@ -1207,6 +1211,8 @@ class CapacityResultier(base.CapacityResultier, LoadResultier):
 
         # Map the respective capacity factors:
         for node, uid in self.uid_nodes.items():
+            if not self._selects(node):
+                continue
 
             characteristic_mean = pd.Series()
 
@@ -1221,8 +1227,9 @@ class CapacityResultier(base.CapacityResultier, LoadResultier):
                     # storages
                     if uid.component.lower() == 'storage':
                         characteristic_mean = StorageResultier(
-                            optimized_es).node_soc[str(uid.name)].mean(
-                            axis='index')
+                            optimized_es, nodes=self._node_selection,
+                            timeslice=self._timeslice,
+                        ).node_soc[str(uid.name)].mean(axis='index')
 
                     # all other
                     else:
@@ -1313,19 +1320,35 @@ class StorageResultier(CalliopeResultier, base.StorageResultier):
         # technology - node rename utility to be able to search for calliope tech name
         rename = self._rename_nodes(optimized_es=optimized_es)
 
+        # storage results are pulled out of calliope's DataArray once, on
+        # the first storage, as (rows, values, timesteps)
+        storage = None
+
         for node, uid in self.uid_nodes.items():
+            if not self._selects(node):
+                continue
 
             # uid rename utility to be able to search for calliope tech name
             node = rename[node]
 
             if uid.component.lower() == 'storage':
-                timesteps = optimized_es.results.timesteps.data
-                timesteps = pd.DatetimeIndex(timesteps, freq='infer')
-                soc = optimized_es.results.storage.loc[{'loc_techs_store': f'{node} location::{node}'}].data
-                soc = pd.Series(soc)
+                if storage is None:
+                    results = optimized_es.results.storage
+                    storage = (
+                        {str(loc_tech): row for row, loc_tech in enumerate(
+                            results.loc_techs_store.data)},
+                        np.asarray(results.transpose(
+                            'loc_techs_store', ...).data),
+                        pd.DatetimeIndex(
+                            optimized_es.results.timesteps.data,
+                            freq='infer'),
+                    )
+                rows, values, timesteps = storage
+
+                soc = pd.Series(values[rows[f'{node} location::{node}']])
                 soc.index = timesteps
                 soc.name = uid.name
-                _socs[uid.name] = soc
+                _socs[uid.name] = self._sliced(soc)
 
         return dict(_socs)
 
@@ -1863,6 +1886,7 @@ class AllResultier(CapacityResultier, FlowResultier, StorageResultier,
     **Not** meant to be used with **large energy systems**.
     """
 
+    @log.profiled
     def __init__(self, optimized_es, **kwargs):
         super().__init__(optimized_es=optimized_es, **kwargs)
 
@@ -2123,22 +2147,10 @@ class MplLegendFormatier(base.MplLegendFormatier, CapacityResultier):
          'legend_title': <class 'str'>}
     """
 
+    node_formatier_class = NodeFormatier
+
     def __init__(self, optimized_es, cgrp='all',
                  markers='formatier', **kwargs):
-
-        # needed transformers
-
-        # mpl legend formatier is the only class needing an extra formatier
-        # instead of just inheriting it. This allows bundling as done in the
-        # AllFormatier with its specific color group (cgrp) and still be able
-        # to map the legends for all colors
-
-        # a different plausible approach would be to only map the bundled
-        # color, and implement some if clauses to only map the legend
-        # requested. This also implies chaining the behaviour of
-        # MplLegendFormatier.node_legend
-        self._nformats = NodeFormatier(optimized_es, cgrp='all')
-
         super().__init__(optimized_es=optimized_es, cgrp='all',
                          markers=markers, **kwargs)
 
@@ -5,7 +5,7 @@
 providing a tessif uniform interface.
 """
 import logging
-from collections import defaultdict, abc
+from collections import Counter, defaultdict, abc
 import pandas as pd
 import numpy as np
 
@@ -338,11 +338,20 @@ class FINEResultier(base.Resultier):
         """
         Time series results is a gatherer for all relevant results within the fine energy system. It is iterating
         through the result series of the ES, bringing them all in one and start reforming the values to tessifs shape.
+
+        Gathered once per optimized energy system and shared among all resultiers and their mappings, so each FINE
+        model class's optimum DataFrame is read only once. Don't modify the returned DataFrame.
         """
+        return self._shared_mapping(
+            optimized_es, self._gather_ts_results, optimized_es, selective=False)
+
+    def _gather_ts_results(self, optimized_es):
+        """Gather the time series results as described in :meth:`_ts_results`."""
         es = self._re_indexing(optimized_es)
         cmp_input = self._cmp_input(optimized_es)
 
-        time_series_results = pd.DataFrame()
+        # Results are collected per model class and concatenated once
+        model_results = list()
         for mtype in es.componentModelingDict:
             index_list = list()
             model_series_results = pd.DataFrame()
@@ -359,8 +368,7 @@ class FINEResultier(base.Resultier):
                         else:
                             index_list.append(str(index_double))
                     model_series_results.index = index_list
-                    time_series_results = time_series_results.append(
-                        model_series_results)
+                    model_results.append(model_series_results)
             if hasattr(es.componentModelingDict[mtype], 'chargeOperationVariablesOptimum'):
                 # Grabbing Storage Dataframe from results
                 if getattr(es.componentModelingDict[mtype], 'chargeOperationVariablesOptimum') is not None:
@@ -384,11 +392,13 @@ class FINEResultier(base.Resultier):
                             else:
                                 index_list.append(str(index_double))
                         model_series_results.index = index_list
-                        time_series_results = time_series_results.append(
-                            model_series_results)
+                        model_results.append(model_series_results)
+
+        time_series_results = pd.concat(model_results) if model_results else pd.DataFrame()
 
         # when there are components which have no true design variable the processed timeseries has to be the result
         # df = pd.DataFrame()
+        processed_results = list()
         for cmp in cmp_input:
             if cmp not in time_series_results.index:
                 if cmp not in es.componentModelingDict['TransmissionModel'].componentsDict:
@@ -401,8 +411,7 @@ class FINEResultier(base.Resultier):
                             # reconstruct non multiindex data frame
                             df = pd.DataFrame(df.values.tolist(), index=(
                                 cmp,), columns=time_series_results.columns)
-                            time_series_results = time_series_results.append(
-                                df)
+                            processed_results.append(df)
                     if hasattr(cmp_input[cmp], 'processedOperationRateMax'):
                         if cmp_input[cmp].processedOperationRateMax is not None:
                             cap = cmp_input[cmp].capacityMax
@@ -413,21 +422,28 @@ class FINEResultier(base.Resultier):
                             # reconstruct non multiindex data frame
                             df = pd.DataFrame(df.values.tolist(), index=(
                                 cmp,), columns=time_series_results.columns)
-                            time_series_results = time_series_results.append(
-                                df)
+                            processed_results.append(df)
+
+        if processed_results:
+            time_series_results = pd.concat([time_series_results] + processed_results)
 
         # Adding Zero Lines for Components that are not calculated in the ESM but taking place
+        zero_lines = list()
         for cmp in cmp_input:
             if cmp not in time_series_results.index:
                 if hasattr(es.componentModelingDict, 'StorageModel'):
                     if cmp in es.componentModelingDict['StorageModel'].componentsDict:
                         if cmp + ' Charge' not in time_series_results.index:
-                            time_series_results.loc[cmp + ' Charge'] = 0
+                            zero_lines.append(cmp + ' Charge')
                         if cmp + ' Discharge' not in time_series_results.index:
-                            time_series_results.loc[cmp + ' Discharge'] = 0
+                            zero_lines.append(cmp + ' Discharge')
                 else:
                     if cmp not in es.componentModelingDict['TransmissionModel'].componentsDict:
-                        time_series_results.loc[cmp] = 0
+                        zero_lines.append(cmp)
+
+        if zero_lines:
+            time_series_results = pd.concat([time_series_results, pd.DataFrame(
+                0, index=zero_lines, columns=time_series_results.columns)])
 
         # fine simulating 0 values sometime to negative very small float, which have to be set as 0
         time_series_results[time_series_results < 0] = 0
@@ -437,9 +453,9 @@ class FINEResultier(base.Resultier):
         # Adding the given ESM timeseries as index to work with
         time_series_results.index = es.timesteps
 
-        for node in time_series_results.columns:
-            if '.input' in node or '.output' in node:
-                time_series_results.drop(node, axis='columns', inplace=True)
+        time_series_results = time_series_results.loc[:, [
+            '.input' not in node and '.output' not in node
+            for node in time_series_results.columns]]
 
         return time_series_results
 
@@ -737,12 +753,17 @@ class LoadResultier(FINEResultier, base.LoadResultier):
     def _map_loads(self, optimized_es):
         """ Map loads to node labels"""
         time_series_results = self._ts_results(optimized_es)
+        # Column lookups by exact name, instead of scanning all columns
+        column_counts = Counter(time_series_results.columns)
         es = self._re_indexing(optimized_es)
         cmp_input = self._cmp_input(es)
 
         # Use defaultdict of empty DataFrame as loads container:
         _loads = defaultdict(lambda: pd.DataFrame())
         for node in self.nodes:
+            if not self._selects(node):
+                continue
+
             inflows = pd.DataFrame()
             outflows = pd.DataFrame()
             for ntype in self.nodes:
@@ -782,20 +803,17 @@ class LoadResultier(FINEResultier, base.LoadResultier):
                         # Adding Source and Sinks as loads of the Grid
                         # Source is inflow
                         if load_com == target_com and load_dim == '1dim' and load_sign == 1:
-                            col_name = [col for col in time_series_results.columns
-                                        if load in col and len(col) == len(load)]
+                            col_name = [load] * column_counts[load]
                             inflows = pd.concat(
                                 [inflows, time_series_results[col_name].multiply(-1)], axis='columns')
                         # Sink is outflow
                         if load_com == target_com and load_dim == '1dim' and load_sign == -1:
-                            col_name = [col for col in time_series_results.columns
-                                        if load in col and len(col) == len(load)]
+                            col_name = [load] * column_counts[load]
                             outflows = pd.concat(
                                 [outflows, time_series_results[col_name]], axis='columns')
                         # Conversion is tricky: Results represent the outflow -> recalculate the inflow from that
                         if load_com == 'none':
-                            col_name = [col for col in time_series_results.columns
-                                        if load in col and len(col) == len(load)]
+                            col_name = [load] * column_counts[load]
                             # Feed stands for the results feed from the Conversion-ModelingDict
                             conv_feed = pd.DataFrame(
                                 time_series_results[col_name])
@@ -858,15 +876,13 @@ class LoadResultier(FINEResultier, base.LoadResultier):
                         # Adding Storage for both ways in and out grid
                         if target_com == load_com and target_sign == 0 and load_sign == 0:
                             # Charge from Grid to Sto -> Outflow
-                            col_name = [col for col in time_series_results.columns
-                                        if str(load + ' Charge') in col and len(col) == len(load + ' Charge')]
+                            col_name = [load + ' Charge'] * column_counts[load + ' Charge']
                             outflows = pd.concat(
                                 [outflows, time_series_results[col_name]], axis='columns')
                             outflows.rename(
                                 columns={load + ' Charge': load}, inplace=True)
                             # Discharge from Sto to Grid -> Inflow
-                            col_name = [col for col in time_series_results.columns
-                                        if str(load + ' Discharge') in col and len(col) == len(load + ' Discharge')]
+                            col_name = [load + ' Discharge'] * column_counts[load + ' Discharge']
                             inflows = pd.concat(
                                 [inflows, time_series_results[col_name].multiply(-1)], axis='columns')
                             inflows.rename(
@@ -892,16 +908,14 @@ class LoadResultier(FINEResultier, base.LoadResultier):
                         # Target to which the load flows
                         # Adding Sources and its loads -> inflows
                         if load_com == target_com and load_sign == 1 and target_dim == '2dim':
-                            col_name = [col for col in time_series_results.columns
-                                        if load in col and len(col) == len(load)]
+                            col_name = [load] * column_counts[load]
                             outflows = pd.concat(
                                 [outflows, time_series_results[col_name]], axis='columns')
                             outflows.rename(
                                 columns={load: target}, inplace=True)
                         # Adding Sinks and its loads -> outflow
                         if load_com == target_com and load_sign == -1 and target_dim == '2dim':
-                            col_name = [col for col in time_series_results.columns
-                                        if load in col and len(col) == len(load)]
+                            col_name = [load] * column_counts[load]
                             inflows = pd.concat(
                                 [inflows, time_series_results[col_name]], axis='columns').multiply(-1)
                             inflows.rename(
@@ -910,15 +924,13 @@ class LoadResultier(FINEResultier, base.LoadResultier):
                         # Adding Storages and its loads
                         if load_com == target_com and load_sign == 0 and target_dim == '2dim':
                             # Charge from Grid to Sto -> Outflow
-                            col_name = [col for col in time_series_results.columns
-                                        if str(load + ' Discharge') in col and len(col) == len(load + ' Discharge')]
+                            col_name = [load + ' Discharge'] * column_counts[load + ' Discharge']
                             outflows = pd.concat(
                                 [outflows, time_series_results[col_name]], axis='columns')
                             outflows.rename(
                                 columns={load + ' Discharge': target}, inplace=True)
                             # Discharge from Sto to Grid -> Inflow
-                            col_name = [col for col in time_series_results.columns
-                                        if str(load + ' Charge') in col and len(col) == len(load + ' Charge')]
+                            col_name = [load + ' Charge'] * column_counts[load + ' Charge']
                             inflows = pd.concat(
                                 [inflows, time_series_results[col_name].multiply(-1)], axis='columns')
                             inflows.rename(
@@ -943,8 +955,7 @@ class LoadResultier(FINEResultier, base.LoadResultier):
                         load_dim, load_com, load_sign = type_dim, type_com, type_sign
                         if load_dim == '2dim':
                             # Finding inflow of Transformer representing the outflow from the grid
-                            col_name = [col for col in time_series_results.columns
-                                        if target in col and len(col) == len(target)]
+                            col_name = [target] * column_counts[target]
                             inflows = pd.concat(
                                 [inflows, time_series_results[col_name]], axis='columns')
                             # Finding outflow of Transformer and the correct grid commodity
@@ -1043,11 +1054,12 @@ class LoadResultier(FINEResultier, base.LoadResultier):
                 outflows.rename(columns={connector_rev: grid}, inplace=True)
 
                 temp_df = pd.concat([inflows, outflows], axis='columns')
-                _loads.pop(connector)
+                _loads.pop(connector, None)
                 # _loads.pop(connector_rev)
                 _loads[str(connector)] = temp_df
 
-        return dict(_loads)
+        return {node: self._sliced(load)
+                for node, load in self._selected(dict(_loads)).items()}
 
 
 class CapacityResultier(base.CapacityResultier, LoadResultier):
@@ -1238,6 +1250,8 @@ class CapacityResultier(base.CapacityResultier, LoadResultier):
                 _installed_capacities.pop(connector_reverse)
                 _installed_capacities[connector] = temp_df
 
+        _installed_capacities = self._selected(_installed_capacities)
+
         # Check if the processed capacity is zero and an initial capacity is
         # given- set initital as installed
         for node in _installed_capacities:
@@ -1330,7 +1344,7 @@ class CapacityResultier(base.CapacityResultier, LoadResultier):
             if node not in _installed_capacities:
                 _installed_capacities[node] = esn_defaults['installed_capacity']
 
-        return dict(_installed_capacities)
+        return self._selected(dict(_installed_capacities))
 
     def _map_expansion_costs(self, optimized_es):
         es = self._re_indexing(optimized_es)
@@ -1349,7 +1363,7 @@ class CapacityResultier(base.CapacityResultier, LoadResultier):
                     costs = esn_defaults['expansion_costs']
                 expansion_costs[node] = costs
 
-        return expansion_costs
+        return self._selected(expansion_costs)
 
     @log.timings
     def _map_characteristic_values(self, optimized_es):
@@ -1359,6 +1373,9 @@ class CapacityResultier(base.CapacityResultier, LoadResultier):
 
         _characteristic_values = defaultdict(float)
         for node in es.uid_dict:
+            if not self._selects(node):
+                continue
+
             node_dim = getattr(cmp_input[node], 'dimension')
             if node_dim == '2dim':  # Indicator for Grid which is always variable
                 _characteristic_values[node] = esn_defaults['characteristic_value']
@@ -1396,7 +1413,9 @@ class CapacityResultier(base.CapacityResultier, LoadResultier):
                     if node in es.componentModelingDict['StorageModel'].componentsDict:
                         if node_installed_capacities != 0:
                             char_mean = abs(StorageResultier(
-                                es).node_soc[node].mean(axis='index'))
+                                es, nodes=self._node_selection,
+                                timeslice=self._timeslice,
+                            ).node_soc[node].mean(axis='index'))
                             _characteristic_values[node] = round(
                                 char_mean / node_installed_capacities, 2)
                         else:
@@ -1512,7 +1531,8 @@ class StorageResultier(FINEResultier, base.StorageResultier):
 
         for k, v in _socs.items():
             _socs[k] = round(v, 4)
-        return dict(_socs)
+        return {node: self._sliced(soc)
+                for node, soc in self._selected(_socs).items()}
 
 
 class NodeCategorizer(FINEResultier, base.NodeCategorizer):
@@ -1999,6 +2019,7 @@ class AllResultier(CapacityResultier, FlowResultier, StorageResultier,
     **Not** meant to be used with **large energy systems**.
     """
 
+    @log.profiled
     def __init__(self, optimized_es, **kwargs):
         super().__init__(optimized_es=optimized_es, **kwargs)
 
@@ -2319,22 +2340,10 @@ class MplLegendFormatier(base.MplLegendFormatier, CapacityResultier):
 
         """
 
+    node_formatier_class = NodeFormatier
+
     def __init__(self, optimized_es, cgrp='all',
                  markers='formatier', **kwargs):
-        # needed transformers
-
-        # mpl legend formatier is the only class needing an extra formatier
-        # instead of just inheriting it. This allows bundeling as done in the
-        # AllFormatier with its specific color group (cgrp) and still be able
-        # to map the legends for all colors
-
-        # a different plausible approach would be to only map the bundled
-        # color, and implement some if clauses to only map the legend
-        # requested. This also implies chaning the bahaviour of
-        # MplLegendFormatier.node_legend
-        self._nformats = NodeFormatier(
-            optimized_es, drawutil='nx', cgrp='all')
-
         super().__init__(optimized_es=optimized_es, cgrp='all',
                          markers=markers, **kwargs)
 
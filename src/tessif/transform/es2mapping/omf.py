@@ -442,9 +442,12 @@ class LoadResultier(OmfResultier, base.LoadResultier):
         _loads = defaultdict(lambda: pd.DataFrame())
 
         for node in optimized_es.nodes:
-            time_series_results = solph.views.node(
+            if not self._selects(node.label):
+                continue
+
+            time_series_results = self._sliced(solph.views.node(
                 optimized_es.results['main'], node).get(
-                    'sequences', pd.DataFrame())
+                    'sequences', pd.DataFrame()))
 
             # only keep columns with 'flow' results
             time_series_results = time_series_results[
@@ -640,6 +643,8 @@ class CapacityResultier(base.CapacityResultier, LoadResultier):
         _installed_capacities = defaultdict(float)
 
         for node in optimized_es.nodes:
+            if not self._selects(node.label):
+                continue
 
             node_inst_cap_dict = dict()
             # map inflow characterized nodes:
@@ -783,6 +788,8 @@ class CapacityResultier(base.CapacityResultier, LoadResultier):
         _installed_capacities = defaultdict(float)
 
         for node in optimized_es.nodes:
+            if not self._selects(node.label):
+                continue
 
             node_inst_cap_dict = dict()
             # map inflow characterized nodes:
@@ -881,6 +888,8 @@ class CapacityResultier(base.CapacityResultier, LoadResultier):
 
         # Map the respective expansion costs:
         for node in optimized_es.nodes:
+            if not self._selects(node.label):
+                continue
 
             node_expansion_costs_dict = dict()
             # map inflow characterized nodes:
@@ -960,6 +969,8 @@ class CapacityResultier(base.CapacityResultier, LoadResultier):
 
         # Map the respective capacity factors:
         for node in optimized_es.nodes:
+            if not self._selects(node.label):
+                continue
 
             characteristic_mean = pd.Series()
 
@@ -980,8 +991,9 @@ class CapacityResultier(base.CapacityResultier, LoadResultier):
 
                     elif isinstance(node, solph.components.GenericStorage):
                         characteristic_mean = StorageResultier(
-                            optimized_es).node_soc[str(node.label)].mean(
-                                axis='index')
+                            optimized_es, nodes=self._node_selection,
+                            timeslice=self._timeslice,
+                        ).node_soc[str(node.label)].mean(axis='index')
 
                     # map all other nodes
                     else:
@@ -1081,11 +1093,14 @@ class StorageResultier(OmfResultier, base.StorageResultier):
 
         _socs = defaultdict(lambda: pd.Series())
         for node in optimized_es.nodes:
+            if not self._selects(node.label):
+                continue
+
             if isinstance(node,
                           solph.components.GenericStorage):
-                soc = solph.views.node(
+                soc = self._sliced(solph.views.node(
                     optimized_es.results['main'], node).get(
-                        'sequences')[((node, None), 'storage_content')]
+                        'sequences')[((node, None), 'storage_content')])
                 soc.name = str(node.label)
 
                 _socs[str(node.label)] = soc
@@ -1526,6 +1541,7 @@ class AllResultier(CapacityResultier, FlowResultier, StorageResultier,
     **Not** meant to be used with **large energy systems**.
     """
 
+    @log.profiled
     def __init__(self, optimized_es, **kwargs):
         super().__init__(optimized_es=optimized_es, **kwargs)
 
@@ -1852,23 +1868,10 @@ class MplLegendFormatier(base.MplLegendFormatier, CapacityResultier):
 
     """
 
+    node_formatier_class = NodeFormatier
+
     def __init__(self, optimized_es, cgrp='all',
                  markers='formatier', **kwargs):
-
-        # needed transformers
-
-        # mpl legend formatier is the only class needing an extra formatier
-        # instead of just inheriting it. This allows bundling as done in the
-        # AllFormatier with its specific color group (cgrp) and still be able
-        # to map the legends for all colors
-
-        # a different plausible approach would be to only map the bundled
-        # color, and implement some if clauses to only map the legend
-        # requested. This also implies chaining the behaviour of
-        # MplLegendFormatier.node_legend
-        self._nformats = NodeFormatier(
-            optimized_es, drawutil='nx', cgrp='all')
-
         super().__init__(optimized_es=optimized_es, cgrp='all',
                          markers=markers, **kwargs)
 
@@ -922,20 +922,23 @@ class LoadResultier(PypsaResultier, base.LoadResultier):
             # name the index column
             _loads[name].columns.name = name
 
-        # clean "ignore" artifacts
+        # clean "ignore" artifacts and unselected nodes
         for node in _loads.copy():
-            if node not in self.nodes:
+            if node not in self.nodes or not self._selects(node):
                 _loads.pop(node)
 
         # rename the excess sink columns
         for node in es.excess_sinks:
+            if not self._selects(node):
+                continue
+
             bus_name = "-".join([node, "Bus"])
             link_name = "-".join([node, "Link"])
             origin_bus_name = es.links.loc[link_name]["bus0"]
             _loads[node] = _loads[node].rename(
                 columns={bus_name: origin_bus_name})
 
-        return dict(_loads)
+        return {node: self._sliced(load) for node, load in _loads.items()}
 
 
 class CapacityResultier(base.CapacityResultier, LoadResultier):
@@ -1093,6 +1096,8 @@ class CapacityResultier(base.CapacityResultier, LoadResultier):
 
         for ntype in PypsaResultier.component_type_mapping:
             for name in getattr(optimized_es, ntype).index:
+                if not self._selects(name):
+                    continue
 
                 if ntype in ['generators', 'links', 'storage_units']:
                     capacity = getattr(optimized_es, ntype)['p_nom_opt'][name]
@@ -1258,6 +1263,8 @@ class CapacityResultier(base.CapacityResultier, LoadResultier):
 
         for ntype in PypsaResultier.component_type_mapping:
             for name in getattr(optimized_es, ntype).index:
+                if not self._selects(name):
+                    continue
 
                 if ntype in ['generators', 'links', 'storage_units']:
                     capacity = getattr(optimized_es, ntype)['p_nom'][name]
@@ -1370,6 +1377,8 @@ class CapacityResultier(base.CapacityResultier, LoadResultier):
 
         for ntype in PypsaResultier.component_type_mapping:
             for name in getattr(optimized_es, ntype).index:
+                if not self._selects(name):
+                    continue
 
                 if hasattr(getattr(optimized_es, ntype), 'capital_cost'):
 
@@ -1431,6 +1440,8 @@ class CapacityResultier(base.CapacityResultier, LoadResultier):
         # Map the respective capacity factors:
         for ntype in PypsaResultier.component_type_mapping:
             for name in getattr(optimized_es, ntype).index:
+                if not self._selects(name):
+                    continue
 
                 if not any([itype == getattr(
                             optimized_es, ntype).loc[name]["type"]
@@ -1469,8 +1480,10 @@ class CapacityResultier(base.CapacityResultier, LoadResultier):
                             _characteristic_values[name] = 0
                         else:
                             _characteristic_values[name] = (
-                                StorageResultier(optimized_es).node_soc[
-                                    name].mean(axis='index') /
+                                StorageResultier(
+                                    optimized_es, nodes=self._node_selection,
+                                    timeslice=self._timeslice,
+                                ).node_soc[name].mean(axis='index') /
                                 self.node_installed_capacity[name]
                             )
 
@@ -1520,8 +1533,11 @@ class StorageResultier(PypsaResultier, base.StorageResultier):
 
         _socs = dict()
         for name in getattr(optimized_es, 'storage_units').index:
-            df = getattr(optimized_es, 'storage_units_t')[
-                'state_of_charge'][name]
+            if not self._selects(name):
+                continue
+
+            df = self._sliced(getattr(optimized_es, 'storage_units_t')[
+                'state_of_charge'][name])
 
             _socs[name] = df
 
@@ -2044,6 +2060,7 @@ class AllResultier(CapacityResultier, FlowResultier, StorageResultier,
 
     """
 
+    @log.profiled
     def __init__(self, optimized_es, **kwargs):
         super().__init__(optimized_es=optimized_es, **kwargs)
 
@@ -2384,21 +2401,10 @@ class MplLegendFormatier(base.MplLegendFormatier, CapacityResultier):
 
     """
 
+    node_formatier_class = NodeFormatier
+
     def __init__(self, optimized_es, cgrp='all',
                  markers='formatier', **kwargs):
-
-        # mpl legend formatier is the only class needing an extra formatier
-        # instead of just inheriting it. This allows bundeling as done in the
-        # AllFormatier with its specific color group (cgrp) and still be able
-        # to map the legends for all colors
-
-        # a different plausible approach would be to only map the bundled
-        # color, and implement some if clauses to only map the legend
-        # requested. This also implies chaning the bahaviour of
-        # MplLegendFormatier.node_legend
-        self._nformats = NodeFormatier(
-            optimized_es, cgrp='all', drawutil='nx')
-
         super().__init__(optimized_es=optimized_es, cgrp='all',
                          markers=markers, **kwargs)
 
@@ -149,7 +149,7 @@ def extract_parameters(energy_system):
     outputs = ['electricity']
     status_changing_costs = [0, 0]
     status_inertia = [1, 1]
-    timeseries = {'electricity': [array([12,  3,  7]), array([12,  3,  7])]}
+    timeseries = {'electricity': [array([12.,  3.,  7.]), array([12.,  3.,  7.])]}
     name = Solar Panel
     latitude = 42
     longitude = 42
@@ -276,6 +276,8 @@ def extract_parameters(energy_system):
                         es_dict[key][k][paramkey] = list(
                             es_dict[key][k][paramkey])
                     if isinstance(paramval, dict):
+                        # components' mappings are immutable
+                        paramval = es_dict[key][k][paramkey] = dict(paramval)
                         for k2, v2 in paramval.items():
                             if isinstance(v2, types_to_convert):
                                 es_dict[key][k][paramkey][k2] = list(
@@ -16,6 +16,166 @@ from tessif.model import components, energy_system
 import tessif.frused.namedtuples as nts
 
 
+def _active_rows(table):
+    """
+    Select the rows of :paramref:`~_active_rows.table` whose
+    :attr:`~tessif.frused.spellings.active` like switch is set.
+
+    Tables lacking an active switch are assumed to list only components meant
+    to be added, since the user most likely forgot adding one.
+    """
+    column = spellings.match_key_from(table, smth_like='active')
+
+    if column is None:
+        return table if esn['active'] else table.iloc[0:0]
+
+    return table[table[column].astype(bool)]
+
+
+def _prepare_records(table, parameters, unpacked=(), interfaces=None):
+    """
+    Prepare the keyword arguments of each active component listed in
+    :paramref:`~_prepare_records.table` as a batch of records.
+
+    Spellings are resolved once per column instead of once per parameter and
+    row. Parameters not present in the table are filled per column. Defaults
+    depending on the component's interfaces are created once for each
+    distinct set of interfaces and shared among the respective records.
+
+    Parameters
+    ----------
+    table: pandas.DataFrame
+        Table of components as found in the energy system mapping. Each row
+        representing one component.
+
+    parameters: ~collections.abc.Iterable
+        Iterable of ``(keyword, smth_like, default)`` tuples. With
+        ``keyword`` being the component's parameter name, ``smth_like`` the
+        :mod:`~tessif.frused.spellings` key used to find the respective column
+        and ``default`` the value used in case no such column exists.
+
+        Callable defaults are called with the return value of
+        :paramref:`~_prepare_records.interfaces`.
+
+    unpacked: ~collections.abc.Container, default=()
+        Keywords of which the values are unpacked into tuples.
+
+    interfaces: ~collections.abc.Callable, default=None
+        Callable returning a hashable representation of the interfaces a
+        record's callable defaults depend on. Called with each record after
+        all tabled parameters are filled in.
+
+    Return
+    ------
+    records: list
+        List of keyword argument dictionaries. One for each active component.
+    """
+    table = _active_rows(table)
+
+    columns, dependent_defaults = {}, {}
+    for keyword, smth_like, default in parameters:
+        column = spellings.match_key_from(table, smth_like=smth_like)
+
+        if column is not None:
+            values = table[column].tolist()
+        elif callable(default):
+            dependent_defaults[keyword] = default
+            continue
+        else:
+            values = [default] * len(table)
+
+        if keyword in unpacked:
+            values = [(*value,) for value in values]
+
+        columns[keyword] = values
+
+    records = [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+    if dependent_defaults:
+        defaults = {}
+        for record in records:
+            key = interfaces(record)
+            if key not in defaults:
+                defaults[key] = {
+                    keyword: default(key)
+                    for keyword, default in dependent_defaults.items()}
+            record.update(defaults[key])
+
+    return records
+
+
+def _uid_parameters():
+    """Parameters forming a component's uid."""
+    return [(key, key, esn[key]) for key in (
+        'name', 'latitude', 'longitude', 'region', 'sector', 'carrier',
+        'component', 'node_type')]
+
+
+def _flow_parameters(expandables=()):
+    """Flow parameters with defaults depending on the component's
+    interfaces. Expansion parameter defaults additionally cover the
+    :paramref:`~_flow_parameters.expandables` (i.e a storage's capacity).
+    """
+    return [
+        # linear problem parameters
+        ('flow_rates', 'flow_rates',
+         lambda interfaces: {k: nts.MinMax(
+             esn['minimum'], esn['maximum']) for k in interfaces}),
+        ('flow_costs', 'flow_costs',
+         lambda interfaces: {k: esn['flow_costs'] for k in interfaces}),
+        ('flow_emissions', 'flow_emissions',
+         lambda interfaces: {k: esn['emissions'] for k in interfaces}),
+        ('flow_gradients', 'flow_gradients',
+         lambda interfaces: {k: nts.PositiveNegative(
+             esn['positive_gradient'], esn['negative_gradient'])
+             for k in interfaces}),
+        ('gradient_costs', 'gradient_costs',
+         lambda interfaces: {k: nts.PositiveNegative(
+             esn['positive_gradient_costs'], esn['negative_gradient_costs'])
+             for k in interfaces}),
+        ('timeseries', 'timeseries', esn['timeseries']),
+
+        # expansion problem parameters
+        ('expandable', 'expandable',
+         lambda interfaces: {k: esn['expandable']
+                             for k in [*interfaces, *expandables]}),
+        ('expansion_costs', 'expansion_costs',
+         lambda interfaces: {k: esn['expansion_costs']
+                             for k in [*interfaces, *expandables]}),
+        ('expansion_limits', 'expansion_limits',
+         lambda interfaces: {k: nts.MinMax(
+             esn['minimum_expansion'], esn['maximum_expansion'])
+             for k in [*interfaces, *expandables]}),
+
+        # mixed integer linear problem
+        ('milp', 'milp',
+         lambda interfaces: {k: esn['milp'] for k in interfaces}),
+    ]
+
+
+def _status_parameters():
+    """Parameters describing a component's operational status."""
+    return [
+        ('initial_status', 'initial_status', esn['initial_status']),
+        ('status_inertia', 'status_inertia', nts.OnOff(
+            esn['minimum_uptime'], esn['minimum_downtime'])),
+        ('status_changing_costs', 'status_changing_costs', nts.OnOff(
+            esn['startup_costs'], esn['shutdown_costs'])),
+        ('number_of_status_changes', 'number_of_status_changes', nts.OnOff(
+            esn['maximum_shutdowns'], esn['maximum_startups'])),
+        ('costs_for_being_active', 'costs_for_being_active',
+         esn['costs_for_being_active']),
+    ]
+
+
+def _accumulated_amounts_parameter():
+    """Accumulated amounts parameter of sinks and sources."""
+    return ('accumulated_amounts', 'accumulated_amounts',
+            lambda interfaces: {k: nts.MinMax(
+                min=esn['minimum'], max=esn['maximum'])
+                for k in interfaces})
+
+
 @log.timings
 def _generate_busses(energy_system_dict):
     """
@@ -40,42 +200,15 @@ def _generate_busses(energy_system_dict):
     busses = spellings.get_from(energy_system_dict, smth_like='bus',
                                 dflt=pd.DataFrame())
 
-    for row, bus in busses.iterrows():
-        # check active switch, but assume user forgot adding one
-        # and meant to add all entries listed
-        if spellings.get_from(bus, smth_like='active', dflt=esn['active']):
-
-            yield components.Bus(
-                name=spellings.get_from(
-                    bus, smth_like='name',
-                    dflt=esn['name']),
-                latitude=spellings.get_from(
-                    bus, smth_like='latitude',
-                    dflt=esn['latitude']),
-                longitude=spellings.get_from(
-                    bus, smth_like='longitude',
-                    dflt=esn['longitude']),
-                region=spellings.get_from(
-                    bus, smth_like='region',
-                    dflt=esn['region']),
-                sector=spellings.get_from(
-                    bus, smth_like='sector',
-                    dflt=esn['sector']),
-                carrier=spellings.get_from(
-                    bus, smth_like='carrier',
-                    dflt=esn['carrier']),
-                component=spellings.get_from(
-                    bus, smth_like='component',
-                    dflt=esn['component']),
-                node_type=spellings.get_from(
-                    bus, smth_like='node_type',
-                    dflt=esn['node_type']),
-                inputs=spellings.get_from(
-                    bus, smth_like='input',
-                    dflt=esn['input']),
-                outputs=spellings.get_from(
-                    bus, smth_like='output',
-                    dflt=esn['output']),)
+    for record in _prepare_records(
+            busses,
+            parameters=[
+                *_uid_parameters(),
+                ('inputs', 'input', esn['input']),
+                ('outputs', 'output', esn['output']),
+            ]):
+
+        yield components.Bus(**record)
 
 
 @log.timings
@@ -129,8 +262,8 @@ def _generate_sinks(energy_system_dict):
     inputs: frozenset({'electricity'})
     interfaces: frozenset({'electricity'})
     milp: {'electricity': False}
-    number_of_status_changes: OnOff(on=2, off=1)
-    status_changing_costs: OnOff(on=2, off=1)
+    number_of_status_changes: OnOff(on=inf, off=8)
+    status_changing_costs: OnOff(on=0, off=0)
     status_inertia: OnOff(on=2, off=1)
     timeseries: None
     uid: Demand
@@ -138,125 +271,19 @@ def _generate_sinks(energy_system_dict):
     sinks = spellings.get_from(energy_system_dict, smth_like='sink',
                                dflt=pd.DataFrame())
 
-    for row, sink in sinks.iterrows():
-        # check active switch, but assume user forgot adding one
-        # and meant to add all entries listed
-        if spellings.get_from(sink, smth_like='active', dflt=esn['active']):
-
-            # parse inputs beforehand to set adequate defaults
-            inputs = *spellings.get_from(
-                sink, smth_like='inputs', dflt=esn['input']),
-
-            yield components.Sink(
-                name=spellings.get_from(
-                    sink, smth_like='name',
-                    dflt=esn['name']),
-                latitude=spellings.get_from(
-                    sink, smth_like='latitude',
-                    dflt=esn['latitude']),
-                longitude=spellings.get_from(
-                    sink, smth_like='longitude',
-                    dflt=esn['longitude']),
-                region=spellings.get_from(
-                    sink, smth_like='region',
-                    dflt=esn['region']),
-                sector=spellings.get_from(
-                    sink, smth_like='sector',
-                    dflt=esn['sector']),
-                carrier=spellings.get_from(
-                    sink, smth_like='carrier',
-                    dflt=esn['carrier']),
-                component=spellings.get_from(
-                    sink, smth_like='component',
-                    dflt=esn['component']),
-                node_type=spellings.get_from(
-                    sink, smth_like='node_type',
-                    dflt=esn['node_type']),
-                inputs=inputs,
-
-                # linear problem parameters
-                accumulated_amounts=spellings.get_from(
-                    sink, smth_like='accumulated_amounts',
-                    dflt={k: nts.MinMax(
-                        min=esn['minimum'], max=esn['maximum'])
-                        for k in inputs}),
-
-                flow_rates=spellings.get_from(
-                    sink, smth_like='flow_rates',
-                    dflt={k: nts.MinMax(
-                        esn['minimum'], esn['maximum']) for k in inputs}),
-
-                flow_costs=spellings.get_from(
-                    sink, smth_like='flow_costs',
-                    dflt={k: esn['flow_costs'] for k in inputs}),
-
-                flow_emissions=spellings.get_from(
-                    sink, smth_like='flow_emissions',
-                    dflt={k: esn['emissions'] for k in inputs}),
-
-                flow_gradients=spellings.get_from(
-                    sink, smth_like='flow_gradients',
-                    dflt={k: nts.PositiveNegative(
-                        esn['positive_gradient'], esn['negative_gradient'])
-                        for k in inputs}),
-
-                gradient_costs=spellings.get_from(
-                    sink, smth_like='gradient_costs',
-                    dflt={k: nts.PositiveNegative(
-                        esn['positive_gradient_costs'],
-                        esn['negative_gradient_costs'])
-                        for k in inputs}),
-
-                timeseries=spellings.get_from(
-                    sink, smth_like='timeseries',
-                    dflt=esn['timeseries']),
-
-                # expansion problem parameters
-                expandable=spellings.get_from(
-                    sink, smth_like='expandable',
-                    dflt={k: esn['expandable'] for k in inputs}),
-
-                expansion_costs=spellings.get_from(
-                    sink, smth_like='expansion_costs',
-                    dflt={k: esn['expansion_costs'] for k in inputs}),
-
-                expansion_limits=spellings.get_from(
-                    sink, smth_like='expansion_limits',
-                    dflt={k: nts.MinMax(
-                        esn['minimum_expansion'],
-                        esn['maximum_expansion']) for k in inputs}),
-
-                # mixed integer linear problem
-                milp=spellings.get_from(
-                    sink, smth_like='milp',
-                    dflt={k: esn['milp'] for k in inputs}),
-
-                initial_status=spellings.get_from(
-                    sink, smth_like='initial_status',
-                    dflt=esn['initial_status']),
-
-                status_inertia=spellings.get_from(
-                    sink, smth_like='status_inertia',
-                    dflt=nts.OnOff(
-                        esn['minimum_uptime'],
-                        esn['minimum_downtime'])),
-
-                status_changing_costs=spellings.get_from(
-                    sink, smth_like='status_inertia',
-                    dflt=nts.OnOff(
-                        esn['startup_costs'],
-                        esn['shutdown_costs'])),
-
-                number_of_status_changes=spellings.get_from(
-                    sink, smth_like='status_inertia',
-                    dflt=nts.OnOff(
-                        esn['maximum_shutdowns'],
-                        esn['maximum_startups'])),
-
-                costs_for_being_active=spellings.get_from(
-                    sink, smth_like='costs_for_being_active',
-                    dflt=esn['costs_for_being_active']),
-            )
+    for record in _prepare_records(
+            sinks,
+            parameters=[
+                *_uid_parameters(),
+                ('inputs', 'inputs', esn['input']),
+                _accumulated_amounts_parameter(),
+                *_flow_parameters(),
+                *_status_parameters(),
+            ],
+            unpacked=('inputs',),
+            interfaces=lambda record: record['inputs']):
+
+        yield components.Sink(**record)
 
 
 @log.timings
@@ -310,138 +337,29 @@ def _generate_sources(energy_system_dict):
     initial_status: True
     interfaces: frozenset({'fuel'})
     milp: {'fuel': False}
-    number_of_status_changes: OnOff(on=1, off=1)
+    number_of_status_changes: OnOff(on=inf, off=10)
     outputs: frozenset({'fuel'})
-    status_changing_costs: OnOff(on=1, off=1)
+    status_changing_costs: OnOff(on=0, off=0)
     status_inertia: OnOff(on=1, off=1)
-    timeseries: {'fuel': MinMax(min=0, max=array([10, 22, 22]))}
+    timeseries: {'fuel': MinMax(min=0, max=array([10., 22., 22.]))}
     uid: Gas Station
     """
     sources = spellings.get_from(energy_system_dict, smth_like='source',
                                  dflt=pd.DataFrame())
 
-    for row, source in sources.iterrows():
-        # check active switch, but assume user forgot adding one
-        # and meant to add all entries listed
-
-        if spellings.get_from(source, smth_like='active', dflt=esn['active']):
-
-            # parse outputs beforehand to set adequate defaults
-            outputs = *spellings.get_from(
-                source, smth_like='outputs', dflt=esn['output']),
-
-            tessif_source = components.Source(
-                name=spellings.get_from(
-                    source, smth_like='name',
-                    dflt=esn['name']),
-                latitude=spellings.get_from(
-                    source, smth_like='latitude',
-                    dflt=esn['latitude']),
-                longitude=spellings.get_from(
-                    source, smth_like='longitude',
-                    dflt=esn['longitude']),
-                region=spellings.get_from(
-                    source, smth_like='region',
-                    dflt=esn['region']),
-                sector=spellings.get_from(
-                    source, smth_like='sector',
-                    dflt=esn['sector']),
-                carrier=spellings.get_from(
-                    source, smth_like='carrier',
-                    dflt=esn['carrier']),
-                component=spellings.get_from(
-                    source, smth_like='component',
-                    dflt=esn['component']),
-                node_type=spellings.get_from(
-                    source, smth_like='node_type',
-                    dflt=esn['node_type']),
-                outputs=outputs,
-
-                # linear problem parameters
-                accumulated_amounts=spellings.get_from(
-                    source, smth_like='accumulated_amounts',
-                    dflt={k: nts.MinMax(
-                        min=esn['minimum'], max=esn['maximum'])
-                        for k in outputs}),
-
-                flow_rates=spellings.get_from(
-                    source, smth_like='flow_rates',
-                    dflt={k: nts.MinMax(
-                        esn['minimum'], esn['maximum']) for k in outputs}),
-
-                flow_costs=spellings.get_from(
-                    source, smth_like='flow_costs',
-                    dflt={k: esn['flow_costs'] for k in outputs}),
-
-                flow_emissions=spellings.get_from(
-                    source, smth_like='flow_emissions',
-                    dflt={k: esn['emissions'] for k in outputs}),
-
-                flow_gradients=spellings.get_from(
-                    source, smth_like='flow_gradients',
-                    dflt={k: nts.PositiveNegative(
-                        esn['positive_gradient'], esn['negative_gradient'])
-                        for k in outputs}),
-
-                gradient_costs=spellings.get_from(
-                    source, smth_like='gradient_costs',
-                    dflt={k: nts.PositiveNegative(
-                        esn['positive_gradient_costs'],
-                        esn['negative_gradient_costs'])
-                        for k in outputs}),
-
-                timeseries=spellings.get_from(
-                    source, smth_like='timeseries',
-                    dflt=esn['timeseries']),
-
-                # expansion problem parameters
-                expandable=spellings.get_from(
-                    source, smth_like='expandable',
-                    dflt={k: esn['expandable'] for k in outputs}),
-
-                expansion_costs=spellings.get_from(
-                    source, smth_like='expansion_costs',
-                    dflt={k: esn['expansion_costs'] for k in outputs}),
-
-                expansion_limits=spellings.get_from(
-                    source, smth_like='expansion_limits',
-                    dflt={k: nts.MinMax(
-                        esn['minimum_expansion'],
-                        esn['maximum_expansion']) for k in outputs}),
-
-                # mixed integer linear problem
-                milp=spellings.get_from(
-                    source, smth_like='milp',
-                    dflt={k: esn['milp'] for k in outputs}),
-
-                initial_status=spellings.get_from(
-                    source, smth_like='initial_status',
-                    dflt=esn['initial_status']),
-
-                status_inertia=spellings.get_from(
-                    source, smth_like='status_inertia',
-                    dflt=nts.OnOff(
-                        esn['minimum_uptime'],
-                        esn['minimum_downtime'])),
-
-                status_changing_costs=spellings.get_from(
-                    source, smth_like='status_inertia',
-                    dflt=nts.OnOff(
-                        esn['startup_costs'],
-                        esn['shutdown_costs'])),
-
-                number_of_status_changes=spellings.get_from(
-                    source, smth_like='status_inertia',
-                    dflt=nts.OnOff(
-                        esn['maximum_shutdowns'],
-                        esn['maximum_startups'])),
-
-                costs_for_being_active=spellings.get_from(
-                    source, smth_like='costs_for_being_active',
-                    dflt=esn['costs_for_being_active']),
-            )
-
-            yield tessif_source
+    for record in _prepare_records(
+            sources,
+            parameters=[
+                *_uid_parameters(),
+                ('outputs', 'outputs', esn['output']),
+                _accumulated_amounts_parameter(),
+                *_flow_parameters(),
+                *_status_parameters(),
+            ],
+            unpacked=('outputs',),
+            interfaces=lambda record: record['outputs']):
+
+        yield components.Source(**record)
 
 
 @log.timings
@@ -498,145 +416,31 @@ def _generate_transformers(energy_system_dict):
     inputs: ['fuel']
     interfaces: ['electricity', 'fuel']
     milp: {'electricity': True, 'fuel': False}
-    number_of_status_changes: OnOff(on=0, off=2)
+    number_of_status_changes: OnOff(on=inf, off=9)
     outputs: ['electricity']
-    status_changing_costs: OnOff(on=0, off=2)
+    status_changing_costs: OnOff(on=0, off=0)
     status_inertia: OnOff(on=0, off=2)
-    timeseries: {'electricity': MinMax(min=0, max=array([10, 22, 22]))}
+    timeseries: {'electricity': MinMax(min=0, max=array([10., 22., 22.]))}
     uid: Generator
     """
     transformers = spellings.get_from(
         energy_system_dict, smth_like='transformer',
         dflt=pd.DataFrame())
 
-    for row, transformer in transformers.iterrows():
-        # check active switch, but assume user forgot adding one
-        # and meant to add all entries listed
-
-        if spellings.get_from(
-                transformer, smth_like='active', dflt=esn['active']):
-
-            # parse inputs beforehand to set adequate defaults
-            inputs = *spellings.get_from(
-                transformer, smth_like='inputs', dflt=esn['input']),
-
-            # parse outputs beforehand to set adequate defaults
-            outputs = *spellings.get_from(
-                transformer, smth_like='outputs', dflt=esn['output']),
-
-            yield components.Transformer(
-                name=spellings.get_from(
-                    transformer, smth_like='name',
-                    dflt=esn['name']),
-                latitude=spellings.get_from(
-                    transformer, smth_like='latitude',
-                    dflt=esn['latitude']),
-                longitude=spellings.get_from(
-                    transformer, smth_like='longitude',
-                    dflt=esn['longitude']),
-                region=spellings.get_from(
-                    transformer, smth_like='region',
-                    dflt=esn['region']),
-                sector=spellings.get_from(
-                    transformer, smth_like='sector',
-                    dflt=esn['sector']),
-                carrier=spellings.get_from(
-                    transformer, smth_like='carrier',
-                    dflt=esn['carrier']),
-                component=spellings.get_from(
-                    transformer, smth_like='component',
-                    dflt=esn['component']),
-                node_type=spellings.get_from(
-                    transformer, smth_like='node_type',
-                    dflt=esn['node_type']),
-
-                inputs=inputs,
-                outputs=outputs,
-                conversions=spellings.get_from(
-                    transformer, smth_like='efficiency',
-                    dflt=esn['efficiency']),
-
-                # linear problem parameters
-                flow_rates=spellings.get_from(
-                    transformer, smth_like='flow_rates',
-                    dflt={k: nts.MinMax(
-                        esn['minimum'], esn['maximum'])
-                        for k in [*inputs, *outputs]}),
-
-                flow_costs=spellings.get_from(
-                    transformer, smth_like='flow_costs',
-                    dflt={k: esn['flow_costs'] for k in [*inputs, *outputs]}),
-
-                flow_emissions=spellings.get_from(
-                    transformer, smth_like='flow_emissions',
-                    dflt={k: esn['emissions'] for k in [*inputs, *outputs]}),
-
-                flow_gradients=spellings.get_from(
-                    transformer, smth_like='flow_gradients',
-                    dflt={k: nts.PositiveNegative(
-                        esn['positive_gradient'], esn['negative_gradient'])
-                        for k in [*inputs, *outputs]}),
-
-                gradient_costs=spellings.get_from(
-                    transformer, smth_like='gradient_costs',
-                    dflt={k: nts.PositiveNegative(
-                        esn['positive_gradient_costs'],
-                        esn['negative_gradient_costs'])
-                        for k in [*inputs, *outputs]}),
-
-                timeseries=spellings.get_from(
-                    transformer, smth_like='timeseries',
-                    dflt=esn['timeseries']),
-
-                # expansion problem parameters
-                expandable=spellings.get_from(
-                    transformer, smth_like='expandable',
-                    dflt={k: esn['expandable'] for k in [*inputs, *outputs]}),
-
-                expansion_costs=spellings.get_from(
-                    transformer, smth_like='expansion_costs',
-                    dflt={k: esn['expansion_costs']
-                          for k in [*inputs, *outputs]}),
-
-                expansion_limits=spellings.get_from(
-                    transformer, smth_like='expansion_limits',
-                    dflt={k: nts.MinMax(
-                        esn['minimum_expansion'],
-                        esn['maximum_expansion'])
-                        for k in [*inputs, *outputs]}),
-
-                # mixed integer linear problem
-                milp=spellings.get_from(
-                    transformer, smth_like='milp',
-                    dflt={k: esn['milp']
-                          for k in [*inputs, *outputs]}),
-
-                initial_status=spellings.get_from(
-                    transformer, smth_like='initial_status',
-                    dflt=esn['initial_status']),
-
-                status_inertia=spellings.get_from(
-                    transformer, smth_like='status_inertia',
-                    dflt=nts.OnOff(
-                        esn['minimum_uptime'],
-                        esn['minimum_downtime'])),
-
-                status_changing_costs=spellings.get_from(
-                    transformer, smth_like='status_inertia',
-                    dflt=nts.OnOff(
-                        esn['startup_costs'],
-                        esn['shutdown_costs'])),
-
-                number_of_status_changes=spellings.get_from(
-                    transformer, smth_like='status_inertia',
-                    dflt=nts.OnOff(
-                        esn['maximum_shutdowns'],
-                        esn['maximum_startups'])),
-
-                costs_for_being_active=spellings.get_from(
-                    transformer, smth_like='costs_for_being_active',
-                    dflt=esn['costs_for_being_active']),
-            )
+    for record in _prepare_records(
+            transformers,
+            parameters=[
+                *_uid_parameters(),
+                ('inputs', 'inputs', esn['input']),
+                ('outputs', 'outputs', esn['output']),
+                ('conversions', 'efficiency', esn['efficiency']),
+                *_flow_parameters(),
+                *_status_parameters(),
+            ],
+            unpacked=('inputs', 'outputs'),
+            interfaces=lambda record: (*record['inputs'], *record['outputs'])):
+
+        yield components.Transformer(**record)
 
 
 @log.timings
@@ -708,11 +512,11 @@ def _generate_chps(energy_system_dict):
     interfaces: ['electricity', 'gas', 'heat']
     milp: {'electricity': False, 'gas': False, 'heat': False}
     min_condenser_load: nan
-    number_of_status_changes: OnOff(on=0, off=0)
+    number_of_status_changes: OnOff(on=inf, off=inf)
     outputs: ['electricity', 'heat']
     power_loss_index: nan
     power_wo_dist_heat: MinMax(min=nan, max=nan)
-    status_changing_costs: OnOff(on=0, off=0)
+    status_changing_costs: OnOff(on=0.0, off=0.0)
     status_inertia: OnOff(on=0, off=0)
     timeseries: None
     uid: CHP1
@@ -735,11 +539,11 @@ def _generate_chps(energy_system_dict):
     interfaces: ['electricity', 'gas', 'heat']
     milp: {'electricity': False, 'gas': False, 'heat': False}
     min_condenser_load: [3, 3, 3, 3]
-    number_of_status_changes: OnOff(on=0, off=0)
+    number_of_status_changes: OnOff(on=inf, off=inf)
     outputs: ['electricity', 'heat']
     power_loss_index: [0.19, 0.19, 0.19, 0.19]
     power_wo_dist_heat: MinMax(min=[8, 8, 8, 8], max=[20, 20, 20, 20])
-    status_changing_costs: OnOff(on=0, off=0)
+    status_changing_costs: OnOff(on=0.0, off=0.0)
     status_inertia: OnOff(on=0, off=0)
     timeseries: None
     uid: CHP2
@@ -748,161 +552,33 @@ def _generate_chps(energy_system_dict):
         energy_system_dict, smth_like='combined_heat_power',
         dflt=pd.DataFrame())
 
-    for row, chp in chps.iterrows():
-        # check active switch, but assume user forgot adding one
-        # and meant to add all entries listed
-
-        if spellings.get_from(
-                chp, smth_like='active', dflt=esn['active']):
-            # parse inputs beforehand to set adequate defaults
-            inputs = *spellings.get_from(
-                chp, smth_like='inputs', dflt=esn['input']),
-
-            # parse outputs beforehand to set adequate defaults
-            outputs = *spellings.get_from(
-                chp, smth_like='outputs', dflt=esn['output']),
-
-            yield components.CHP(
-                name=spellings.get_from(
-                    chp, smth_like='name',
-                    dflt=esn['name']),
-                latitude=spellings.get_from(
-                    chp, smth_like='latitude',
-                    dflt=esn['latitude']),
-                longitude=spellings.get_from(
-                    chp, smth_like='longitude',
-                    dflt=esn['longitude']),
-                region=spellings.get_from(
-                    chp, smth_like='region',
-                    dflt=esn['region']),
-                sector=spellings.get_from(
-                    chp, smth_like='sector',
-                    dflt=esn['sector']),
-                carrier=spellings.get_from(
-                    chp, smth_like='carrier',
-                    dflt=esn['carrier']),
-                component=spellings.get_from(
-                    chp, smth_like='component',
-                    dflt=esn['component']),
-                node_type=spellings.get_from(
-                    chp, smth_like='node_type',
-                    dflt=esn['node_type']),
-
-                inputs=inputs,
-                outputs=outputs,
-                back_pressure=spellings.get_from(
-                    chp, smth_like='back_pressure',
-                    dflt=esn['chp_back_pressure']),
-
-                conversion_factor_full_condensation=spellings.get_from(
-                    chp, smth_like='conversion_factor_full_condensation',
-                    dflt=esn['chp_efficiency']),
-
-                el_efficiency_wo_dist_heat=spellings.get_from(
-                    chp, smth_like='el_efficiency_wo_dist_heat',
-                    dflt=esn['el_efficiency_wo_dist_heat']),
-
-                enthalpy_loss=spellings.get_from(
-                    chp, smth_like='enthalpy_loss',
-                    dflt=esn['enthalpy_loss']),
-
-                min_condenser_load=spellings.get_from(
-                    chp, smth_like='min_condenser_load',
-                    dflt=esn['min_condenser_load']),
-
-                power_loss_index=spellings.get_from(
-                    chp, smth_like='power_loss_index',
-                    dflt=esn['power_loss_index']),
-
-                power_wo_dist_heat=spellings.get_from(
-                    chp, smth_like='power_wo_dist_heat',
-                    dflt=esn['power_wo_dist_heat']),
-
-                conversions=spellings.get_from(
-                    chp, smth_like='efficiency',
-                    dflt=esn['chp_efficiency']),
-
-                # linear problem parameters
-                flow_rates=spellings.get_from(
-                    chp, smth_like='flow_rates',
-                    dflt={k: nts.MinMax(
-                        esn['minimum'], esn['maximum'])
-                        for k in [*inputs, *outputs]}),
-
-                flow_costs=spellings.get_from(
-                    chp, smth_like='flow_costs',
-                    dflt={k: esn['flow_costs'] for k in [*inputs, *outputs]}),
-
-                flow_emissions=spellings.get_from(
-                    chp, smth_like='flow_emissions',
-                    dflt={k: esn['emissions'] for k in [*inputs, *outputs]}),
-
-                flow_gradients=spellings.get_from(
-                    chp, smth_like='flow_gradients',
-                    dflt={k: nts.PositiveNegative(
-                        esn['positive_gradient'], esn['negative_gradient'])
-                        for k in [*inputs, *outputs]}),
-
-                gradient_costs=spellings.get_from(
-                    chp, smth_like='gradient_costs',
-                    dflt={k: nts.PositiveNegative(
-                        esn['positive_gradient_costs'],
-                        esn['negative_gradient_costs'])
-                        for k in [*inputs, *outputs]}),
-
-                timeseries=spellings.get_from(
-                    chp, smth_like='timeseries',
-                    dflt=esn['timeseries']),
-
-                # expansion problem parameters
-                expandable=spellings.get_from(
-                    chp, smth_like='expandable',
-                    dflt={k: esn['expandable'] for k in [*inputs, *outputs]}),
-
-                expansion_costs=spellings.get_from(
-                    chp, smth_like='expansion_costs',
-                    dflt={k: esn['expansion_costs']
-                          for k in [*inputs, *outputs]}),
-
-                expansion_limits=spellings.get_from(
-                    chp, smth_like='expansion_limits',
-                    dflt={k: nts.MinMax(
-                        esn['minimum_expansion'],
-                        esn['maximum_expansion'])
-                        for k in [*inputs, *outputs]}),
-
-                # mixed integer linear problem
-                milp=spellings.get_from(
-                    chp, smth_like='milp',
-                    dflt={k: esn['milp']
-                          for k in [*inputs, *outputs]}),
-
-                initial_status=spellings.get_from(
-                    chp, smth_like='initial_status',
-                    dflt=esn['initial_status']),
-
-                status_inertia=spellings.get_from(
-                    chp, smth_like='status_inertia',
-                    dflt=nts.OnOff(
-                        esn['minimum_uptime'],
-                        esn['minimum_downtime'])),
-
-                status_changing_costs=spellings.get_from(
-                    chp, smth_like='status_inertia',
-                    dflt=nts.OnOff(
-                        esn['startup_costs'],
-                        esn['shutdown_costs'])),
-
-                number_of_status_changes=spellings.get_from(
-                    chp, smth_like='status_inertia',
-                    dflt=nts.OnOff(
-                        esn['maximum_shutdowns'],
-                        esn['maximum_startups'])),
-
-                costs_for_being_active=spellings.get_from(
-                    chp, smth_like='costs_for_being_active',
-                    dflt=esn['costs_for_being_active']),
-            )
+    for record in _prepare_records(
+            chps,
+            parameters=[
+                *_uid_parameters(),
+                ('inputs', 'inputs', esn['input']),
+                ('outputs', 'outputs', esn['output']),
+                ('back_pressure', 'back_pressure', esn['chp_back_pressure']),
+                ('conversion_factor_full_condensation',
+                 'conversion_factor_full_condensation',
+                 esn['chp_efficiency']),
+                ('el_efficiency_wo_dist_heat', 'el_efficiency_wo_dist_heat',
+                 esn['el_efficiency_wo_dist_heat']),
+                ('enthalpy_loss', 'enthalpy_loss', esn['enthalpy_loss']),
+                ('min_condenser_load', 'min_condenser_load',
+                 esn['min_condenser_load']),
+                ('power_loss_index', 'power_loss_index',
+                 esn['power_loss_index']),
+                ('power_wo_dist_heat', 'power_wo_dist_heat',
+                 esn['power_wo_dist_heat']),
+                ('conversions', 'efficiency', esn['chp_efficiency']),
+                *_flow_parameters(),
+                *_status_parameters(),
+            ],
+            unpacked=('inputs', 'outputs'),
+            interfaces=lambda record: (*record['inputs'], *record['outputs'])):
+
+        yield components.CHP(**record)
 
 
 @log.timings
@@ -970,9 +646,9 @@ def _generate_storages(energy_system_dict):
     input: electricity
     interfaces: ['electricity']
     milp: {'electricity': False}
-    number_of_status_changes: OnOff(on=0, off=2)
+    number_of_status_changes: OnOff(on=inf, off=42)
     output: electricity
-    status_changing_costs: OnOff(on=0, off=2)
+    status_changing_costs: OnOff(on=0, off=0)
     status_inertia: OnOff(on=0, off=2)
     timeseries: None
     uid: Battery
@@ -981,158 +657,29 @@ def _generate_storages(energy_system_dict):
         energy_system_dict, smth_like='generic_storage',
         dflt=pd.DataFrame())
 
-    for row, storage in storages.iterrows():
-        # check active switch, but assume user forgot adding one
-        # and meant to add all entries listed
-
-        if spellings.get_from(
-                storage, smth_like='active', dflt=esn['active']):
-
-            # parse inputs beforehand to set adequate defaults
-            input = spellings.get_from(
-                storage, smth_like='input', dflt=esn['input'])
-
-            # parse outputs beforehand to set adequate defaults
-            output = spellings.get_from(
-                storage, smth_like='output', dflt=esn['output'])
-
-            storage = components.Storage(
-                name=spellings.get_from(
-                    storage, smth_like='name',
-                    dflt=esn['name']),
-                latitude=spellings.get_from(
-                    storage, smth_like='latitude',
-                    dflt=esn['latitude']),
-                longitude=spellings.get_from(
-                    storage, smth_like='longitude',
-                    dflt=esn['longitude']),
-                region=spellings.get_from(
-                    storage, smth_like='region',
-                    dflt=esn['region']),
-                sector=spellings.get_from(
-                    storage, smth_like='sector',
-                    dflt=esn['sector']),
-                carrier=spellings.get_from(
-                    storage, smth_like='carrier',
-                    dflt=esn['carrier']),
-                component=spellings.get_from(
-                    storage, smth_like='component',
-                    dflt=esn['component']),
-                node_type=spellings.get_from(
-                    storage, smth_like='node_type',
-                    dflt=esn['node_type']),
-
-                input=input,
-                output=output,
-
-                capacity=spellings.get_from(
-                    storage, smth_like='storage_capacity',
-                    dflt=esn['storage_capacity']),
-
-                initial_soc=spellings.get_from(
-                    storage, smth_like='initial_soc',
-                    dflt=esn['initial_soc']),
-
-                idle_changes=spellings.get_from(
-                    storage, smth_like='idle_changes',
-                    dflt=nts.PositiveNegative(
-                        esn['gain_rate'], esn['loss_rate'])),
-
-                flow_rates=spellings.get_from(
-                    storage, smth_like='flow_rates',
-                    dflt={k: nts.MinMax(
-                        esn['minimum'], esn['maximum'])
-                        for k in [input, output]}),
-
-                flow_costs=spellings.get_from(
-                    storage, smth_like='flow_costs',
-                    dflt={k: esn['flow_costs'] for k in [input, output]}),
-
-                flow_efficiencies=spellings.get_from(
-                    storage, smth_like='flow_efficiencies',
-                    dflt={k: nts.InOut(
-                        inflow=esn['efficiency'], outflow=esn['efficiency'])
-                        for k in [input, output]},
-                ),
-
-                flow_emissions=spellings.get_from(
-                    storage, smth_like='flow_emissions',
-                    dflt={k: esn['emissions'] for k in [input, output]}),
-
-                flow_gradients=spellings.get_from(
-                    storage, smth_like='flow_gradients',
-                    dflt={k: nts.PositiveNegative(
-                        esn['positive_gradient'], esn['negative_gradient'])
-                        for k in [input, output]}),
-
-                gradient_costs=spellings.get_from(
-                    storage, smth_like='gradient_costs',
-                    dflt={k: nts.PositiveNegative(
-                        esn['positive_gradient_costs'],
-                        esn['negative_gradient_costs'])
-                        for k in [input, output]}),
-
-                timeseries=spellings.get_from(
-                    storage, smth_like='timeseries',
-                    dflt=esn['timeseries']),
-
-                # expansion problem parameters
-                expandable=spellings.get_from(
-                    storage, smth_like='expandable',
-                    dflt={k: esn['expandable']
-                          for k in [input, output, 'capacity']}),
-
-                fixed_expansion_ratios=spellings.get_from(
-                    storage, smth_like='fixed_expansion_ratios',
-                    dflt={k: esn['fixed_expansion_ratios']
-                          for k in [input, output]}),
-
-                expansion_costs=spellings.get_from(
-                    storage, smth_like='expansion_costs',
-                    dflt={k: esn['expansion_costs']
-                          for k in [input, output, 'capacity']}),
-
-                expansion_limits=spellings.get_from(
-                    storage, smth_like='expansion_limits',
-                    dflt={k: nts.MinMax(
-                        esn['minimum_expansion'],
-                        esn['maximum_expansion'])
-                        for k in [input, output, 'capacity']}),
-
-                # mixed integer linear problem
-                milp=spellings.get_from(
-                    storage, smth_like='milp',
-                    dflt={k: esn['milp']
-                          for k in [input, output]}),
-
-                initial_status=spellings.get_from(
-                    storage, smth_like='initial_status',
-                    dflt=esn['initial_status']),
-
-                status_inertia=spellings.get_from(
-                    storage, smth_like='status_inertia',
-                    dflt=nts.OnOff(
-                        esn['minimum_uptime'],
-                        esn['minimum_downtime'])),
-
-                status_changing_costs=spellings.get_from(
-                    storage, smth_like='status_inertia',
-                    dflt=nts.OnOff(
-                        esn['startup_costs'],
-                        esn['shutdown_costs'])),
-
-                number_of_status_changes=spellings.get_from(
-                    storage, smth_like='status_inertia',
-                    dflt=nts.OnOff(
-                        esn['maximum_shutdowns'],
-                        esn['maximum_startups'])),
-
-                costs_for_being_active=spellings.get_from(
-                    storage, smth_like='costs_for_being_active',
-                    dflt=esn['costs_for_being_active']),
-            )
-
-            yield storage
+    for record in _prepare_records(
+            storages,
+            parameters=[
+                *_uid_parameters(),
+                ('input', 'input', esn['input']),
+                ('output', 'output', esn['output']),
+                ('capacity', 'storage_capacity', esn['storage_capacity']),
+                ('initial_soc', 'initial_soc', esn['initial_soc']),
+                ('idle_changes', 'idle_changes', nts.PositiveNegative(
+                    esn['gain_rate'], esn['loss_rate'])),
+                ('flow_efficiencies', 'flow_efficiencies',
+                 lambda interfaces: {k: nts.InOut(
+                     inflow=esn['efficiency'], outflow=esn['efficiency'])
+                     for k in interfaces}),
+                ('fixed_expansion_ratios', 'fixed_expansion_ratios',
+                 lambda interfaces: {k: esn['fixed_expansion_ratios']
+                                     for k in interfaces}),
+                *_flow_parameters(expandables=['capacity']),
+                *_status_parameters(),
+            ],
+            interfaces=lambda record: (record['input'], record['output'])):
+
+        yield components.Storage(**record)
 
 
 @log.timings
@@ -1187,68 +734,18 @@ def _generate_connectors(energy_system_dict):
         energy_system_dict, smth_like='connector',
         dflt=pd.DataFrame())
 
-    for row, connector in connectors.iterrows():
-        # check active switch, but assume user forgot adding one
-        # and meant to add all entries listed
-
-        if spellings.get_from(
-                connector, smth_like='active', dflt=esn['active']):
-
-            # parse interface beforehand to set adequate defaults
-            # a connectors interface is both it's inputs as well it's outputs
-            interfaces = *spellings.get_from(
-                connector, smth_like='interfaces', dflt=esn['interfaces']),
-
-            yield components.Connector(
-                name=spellings.get_from(
-                    connector, smth_like='name',
-                    dflt=esn['name']),
-                latitude=spellings.get_from(
-                    connector, smth_like='latitude',
-                    dflt=esn['latitude']),
-                longitude=spellings.get_from(
-                    connector, smth_like='longitude',
-                    dflt=esn['longitude']),
-                region=spellings.get_from(
-                    connector, smth_like='region',
-                    dflt=esn['region']),
-                sector=spellings.get_from(
-                    connector, smth_like='sector',
-                    dflt=esn['sector']),
-                carrier=spellings.get_from(
-                    connector, smth_like='carrier',
-                    dflt=esn['carrier']),
-                component=spellings.get_from(
-                    connector, smth_like='component',
-                    dflt=esn['component']),
-                node_type=spellings.get_from(
-                    connector, smth_like='node_type',
-                    dflt=esn['node_type']),
-
-                interfaces=interfaces,
-
-                conversions=spellings.get_from(
-                    connector, smth_like='efficiency',
-                    dflt=esn['efficiency']),
-
-                # # expansion problem parameters
-                # expandable=spellings.get_from(
-                #     connector, smth_like='expandable',
-                #     dflt={k: esn['expandable'] for k in [*inputs, *outputs]}),
-
-                # expansion_costs=spellings.get_from(
-                #     connector, smth_like='expansion_costs',
-                #     dflt={k: esn['expansion_costs']
-                #           for k in [*inputs, *outputs]}),
-
-                # expansion_limits=spellings.get_from(
-                #     connector, smth_like='expansion_limits',
-                #     dflt={k: nts.MinMax(
-                #         esn['minimum_expansion'],
-                #         esn['maximum_expansion'])
-                #         for k in [*inputs, *outputs]}),
-
-            )
+    for record in _prepare_records(
+            connectors,
+            parameters=[
+                *_uid_parameters(),
+                # a connectors interface is both it's inputs as well it's
+                # outputs
+                ('interfaces', 'interfaces', esn['interfaces']),
+                ('conversions', 'efficiency', esn['efficiency']),
+            ],
+            unpacked=('interfaces',)):
+
+        yield components.Connector(**record)
 
 
 @log.timings
@@ -1421,11 +918,11 @@ def transform(energy_system_mapping, **kwargs):
     initial_status = True
     interfaces = ['fuel']
     milp = {'fuel': False}
-    number_of_status_changes = OnOff(on=1, off=1)
+    number_of_status_changes = OnOff(on=inf, off=10)
     outputs = ['fuel']
-    status_changing_costs = OnOff(on=1, off=1)
+    status_changing_costs = OnOff(on=0, off=0)
     status_inertia = OnOff(on=1, off=1)
-    timeseries = {'fuel': MinMax(min=0, max=array([10, 22, 22]))}
+    timeseries = {'fuel': MinMax(min=0, max=array([10., 22., 22.]))}
     uid = Gas Station
     --------------------------------------------------
     <BLANKLINE>
@@ -1443,8 +940,8 @@ def transform(energy_system_mapping, **kwargs):
     inputs = ['electricity']
     interfaces = ['electricity']
     milp = {'electricity': False}
-    number_of_status_changes = OnOff(on=2, off=1)
-    status_changing_costs = OnOff(on=2, off=1)
+    number_of_status_changes = OnOff(on=inf, off=8)
+    status_changing_costs = OnOff(on=0, off=0)
     status_inertia = OnOff(on=2, off=1)
     timeseries = None
     uid = Demand
@@ -1464,11 +961,11 @@ def transform(energy_system_mapping, **kwargs):
     inputs = ['fuel']
     interfaces = ['electricity', 'fuel']
     milp = {'electricity': True, 'fuel': False}
-    number_of_status_changes = OnOff(on=0, off=2)
+    number_of_status_changes = OnOff(on=inf, off=9)
     outputs = ['electricity']
-    status_changing_costs = OnOff(on=0, off=2)
+    status_changing_costs = OnOff(on=0, off=0)
     status_inertia = OnOff(on=0, off=2)
-    timeseries = {'electricity': MinMax(min=0, max=array([10, 22, 22]))}
+    timeseries = {'electricity': MinMax(min=0, max=array([10., 22., 22.]))}
     uid = Generator
     --------------------------------------------------
     <BLANKLINE>
@@ -1491,9 +988,9 @@ def transform(energy_system_mapping, **kwargs):
     input = electricity
     interfaces = ['electricity']
     milp = {'electricity': False}
-    number_of_status_changes = OnOff(on=0, off=2)
+    number_of_status_changes = OnOff(on=inf, off=42)
     output = electricity
-    status_changing_costs = OnOff(on=0, off=2)
+    status_changing_costs = OnOff(on=0, off=0)
     status_inertia = OnOff(on=0, off=2)
     timeseries = None
     uid = Battery
@@ -1,10 +1,15 @@
 # tessif/write/log.py
 import logging
-from tessif.frused.configurations import logging_file_paths as lfps
+import collections
+import cProfile
+from datetime import datetime
 import inspect
+import pstats
 from timeit import default_timer as stopwatch
 import functools
 import os
+from tessif.frused import configurations
+from tessif.frused.configurations import logging_file_paths as lfps
 
 
 def timings_logged(logger=None, uexp=3):
@@ -72,6 +77,230 @@ def timings_logged(logger=None, uexp=3):
 timings = timings_logged()
 
 
+def profiling_logged(directory=None, label=None):
+    r"""Decorator to profile the decorated callable using :mod:`cProfile`.
+
+    Profiling is opt-in. Calls are only profiled if a profiling directory is
+    specified, either by :paramref:`~profiling_logged.directory` or by
+    :attr:`tessif.frused.configurations.profiling_directory`. Each profiled
+    call is dumped using :func:`dump_profile`.
+
+    Calls nested inside an already profiled call are not profiled again,
+    since they are part of the outer profile.
+
+    Parameters
+    ----------
+    directory : str, None, default=None
+        Directory the profiles are dumped to. If None provided,
+        :attr:`tessif.frused.configurations.profiling_directory` is used at
+        call time.
+    label : str, None, default=None
+        Label the profile files are named after. If None provided, the
+        decorated callable's qualified name is used. (As in
+        ``'tessif.transform.es2es.omf.transform'``)
+    """
+
+    def decorated(func):
+        nonlocal label
+        if not label:
+            label = '{}.{}'.format(func.__module__, func.__qualname__)
+
+        @functools.wraps(func)
+        def with_profiling(*args, **kwargs):
+            folder = directory
+            if folder is None:
+                folder = configurations.profiling_directory
+
+            # no profiling requested or already part of an outer profile
+            if folder is None or _active_profilers:
+                return func(*args, **kwargs)
+
+            result, _ = run_profiled(
+                func, *args, directory=folder, label=label, **kwargs)
+
+            return result
+        return with_profiling
+    return decorated
+
+
+#: Default :func:`profiling_logged` decorator
+profiled = profiling_logged()
+
+_active_profilers = list()
+"""
+Profilers of the :func:`run_profiled` calls currently running, the innermost
+one last.
+"""
+
+
+def run_profiled(func, *args, directory=None, label=None, **kwargs):
+    """
+    Call ``func(*args, **kwargs)`` using a :class:`cProfile.Profile`.
+
+    Parameters
+    ----------
+    func : ~collections.abc.Callable
+        Callable to be profiled.
+    directory : str, None, default=None
+        Directory the profile is dumped to using :func:`dump_profile`. Profile
+        is not dumped if None provided.
+    label : str, None, default=None
+        Label the profile files are named after. If None provided, the
+        callable's qualified name is used.
+
+    Return
+    ------
+    tuple
+        Tuple of the ``func`` call's result and the :class:`pstats.Stats`
+        of its profile.
+
+    Note
+    ----
+    Only one profiler can be active at a time. Profiles started inside an
+    already running profile pause the outer one, which does not account for
+    the time spent inside the inner profile.
+    """
+    if not label:
+        label = '{}.{}'.format(func.__module__, func.__qualname__)
+
+    profiler = cProfile.Profile()
+    if _active_profilers:
+        _active_profilers[-1].disable()
+
+    _active_profilers.append(profiler)
+    try:
+        result = profiler.runcall(func, *args, **kwargs)
+        # collecting the stats disables whichever profiler is active, so
+        # collect them before resuming the outer one
+        stats = pstats.Stats(profiler)
+    finally:
+        _active_profilers.pop()
+        if _active_profilers:
+            _active_profilers[-1].enable()
+
+    if directory is not None:
+        dump_profile(stats, directory=directory, label=label)
+
+    return result, stats
+
+
+def dump_profile(stats, directory, label):
+    """
+    Dump a profile as pstats and as collapsed stack file.
+
+    Both files are named after the :paramref:`~dump_profile.label` and the
+    time of dumping, so consecutive runs do not overwrite each other:
+
+        - ``{label}_{time}.pstats`` can be inspected using :mod:`pstats` or
+          tools like `snakeviz <https://jiffyclub.github.io/snakeviz/>`_.
+        - ``{label}_{time}.collapsed`` holds one ``caller;...;callee µs``
+          line per call stack, as consumed by flamegraph tools (like
+          ``flamegraph.pl`` or `speedscope <https://www.speedscope.app/>`_).
+
+    Parameters
+    ----------
+    stats : pstats.Stats
+        Profile statistics to dump.
+    directory : str
+        Directory the profile files are written to. Created if not existent.
+    label : str
+        Label the profile files are named after.
+
+    Return
+    ------
+    str
+        Path of the dumped files without their file extension.
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, '{}_{}'.format(
+        label, datetime.now().strftime('%Y%m%d-%H%M%S-%f')))
+
+    stats.dump_stats(path + '.pstats')
+    with open(path + '.collapsed', 'w') as collapsed:
+        for stack, microseconds in collapse_profile(stats).items():
+            collapsed.write('{} {}\n'.format(stack, microseconds))
+
+    return path
+
+
+def collapse_profile(stats, threshold=1):
+    """
+    Collapse profile statistics into flamegraph call stacks.
+
+    :mod:`cProfile` only records caller-callee pairs, not entire call stacks.
+    So the stacks are reconstructed by walking the call graph from its roots
+    while distributing each callee's time proportionally to the time it was
+    called by the respective caller.
+
+    Parameters
+    ----------
+    stats : pstats.Stats
+        Profile statistics to collapse.
+    threshold : int, default=1
+        Stacks accounting for less microseconds are omitted.
+
+    Return
+    ------
+    dict
+        Dictionary of microseconds spent keyed by ``;`` seperated stack
+        strings.
+    """
+    callees = collections.defaultdict(dict)
+    roots = list()
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        if not callers:
+            roots.append(func)
+        for caller, caller_stats in callers.items():
+            callees[caller][func] = caller_stats
+
+    names = dict()
+
+    def name(func):
+        if func not in names:
+            filename, line, funcname = func
+            if filename == '~':  # builtins
+                names[func] = funcname
+            else:
+                names[func] = '{}:{}:{}'.format(
+                    os.path.basename(filename), line, funcname)
+        return names[func]
+
+    # callees and the share of their time spent for each caller, computed
+    # once per caller instead of on each visit of the caller
+    children = dict()
+
+    def shares(func):
+        if func not in children:
+            children[func] = [
+                (callee, callee_cumtime / stats.stats[callee][3],
+                 stats.stats[callee][3])
+                for callee, (_, _, _, callee_cumtime)
+                in callees[func].items() if stats.stats[callee][3]]
+        return children[func]
+
+    stacks = collections.defaultdict(float)
+
+    def walk(func, stack, on_stack, share):
+        tottime = stats.stats[func][2]
+        stack = stack + (name(func),)
+        stacks[';'.join(stack)] += tottime * share * 1e6
+
+        for callee, ratio, total in shares(func):
+            # skip recursions and negligible sub stacks
+            if callee in on_stack:
+                continue
+            callee_share = share * ratio
+            if callee_share * total * 1e6 < threshold:
+                continue
+            walk(callee, stack, on_stack | {callee}, callee_share)
+
+    for root in roots:
+        walk(root, tuple(), {root}, 1.0)
+
+    return {stack: round(us) for stack, us in stacks.items()
+            if us >= threshold}
+
+
 def add_logging_level_timings():
     """
     Logging level to report computational timings.
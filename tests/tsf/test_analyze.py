@@ -0,0 +1,34 @@
+import os
+import types
+
+from tessif import analyze
+from tessif.frused.paths import root_dir
+
+
+def _statistic(size, *modules):
+    """Fake traceback statistic of frames ordered from oldest to newest."""
+    return types.SimpleNamespace(size=size, traceback=[
+        types.SimpleNamespace(filename=module if os.path.isabs(module)
+                              else os.path.join(root_dir, module))
+        for module in modules])
+
+
+def test_allocations_are_attributed_to_innermost_tessif_module():
+    """Test allocations to name the tessif module closest to them."""
+    numpy_file = os.path.join(os.path.dirname(root_dir), 'numpy', 'core.py')
+    snapshot = types.SimpleNamespace(statistics=lambda key_type: [
+        _statistic(
+            64, __file__, 'simulate.py', os.path.join('write', 'log.py'),
+            os.path.join('transform', 'mapping2es', 'tsf.py'), numpy_file),
+        _statistic(32, __file__, 'simulate.py',
+                   os.path.join('write', 'log.py')),
+        _statistic(16, __file__, numpy_file),
+    ])
+
+    allocations = analyze._attribute_allocations(snapshot)
+
+    assert allocations.to_dict() == {
+        'tessif.transform.mapping2es.tsf': 64,
+        'tessif.simulate': 32,
+        'other': 16,
+    }
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+from tessif import identify
+
+
+def _software_results():
+    rng = np.random.default_rng(7)
+    base = rng.uniform(0, 10, size=(24, 4))
+    return [
+        pd.DataFrame(
+            base + rng.normal(0, 1 + i, size=base.shape),
+            columns=["A", "B", "C", "D"],
+        )
+        for i in range(3)
+    ]
+
+
+def test_stacked_evs_match_dataframe_evs():
+    """Test array level error values to match calc_evs."""
+    dataframes = _software_results()
+    stacked = identify.stack_flow_data(dataframes)
+
+    for error in ["nmae", "nmbe", "nrmse"]:
+        for normalization in ["mean", "spread", "std"]:
+            for reference in [None, 1]:
+                expected = identify.calc_evs(
+                    dataframes, reference=reference, error=error,
+                    normalization=normalization)
+                calculated = identify.calc_stacked_evs(
+                    stacked, reference=reference, error=error,
+                    normalization=normalization)
+                assert np.allclose(expected.to_numpy(), calculated)
+
+
+def test_stacked_corrs_match_dataframe_corrs():
+    """Test array level correlations to match calc_corrs."""
+    dataframes = _software_results()
+    # constant flow results correlate to NaN
+    for dtf in dataframes:
+        dtf["D"] = 0
+    stacked = identify.stack_flow_data(dataframes)
+
+    for method in ["pearson", "spearman"]:
+        for reference in [None, 0]:
+            expected = identify.calc_corrs(
+                dataframes, method=method, reference=reference, fillna=0)
+            calculated = identify.calc_stacked_corrs(
+                stacked, method=method, reference=reference, fillna=0)
+            assert np.allclose(expected.to_numpy(), calculated)
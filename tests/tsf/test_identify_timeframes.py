@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+
+from tessif import identify
+
+
+def test_significant_difference_ranges_match_dataframe_results():
+    """Test batched ranges to match the per flow dataframe results."""
+    rng = np.random.default_rng(42)
+    data = rng.integers(8, 13, size=(3, 4, 50)).astype(float)
+    softwares = ["software1", "software2", "software3"]
+
+    ranges = identify.significant_difference_ranges(
+        data, threshold=0.1, neighs=True)
+
+    for flow in range(data.shape[1]):
+        dtf = pd.DataFrame(data[:, flow, :].transpose(), columns=softwares)
+        expected = [
+            (min(df.index), max(df.index) + 1)
+            for df in identify.significant_differences(
+                dtf, threshold=0.1, neighs=True)
+        ]
+        flow_ranges = ranges[ranges["flow"] == flow]
+        assert list(zip(flow_ranges["start"], flow_ranges["stop"])) == expected
+
+
+def test_significant_difference_ranges_on_stacked_dataframes():
+    """Test stacking dataframes keeps flow labels and reference model."""
+    df1 = pd.DataFrame(
+        data=[[10, 5], [10, 5], [10, 5]], columns=["A to B", "B to C"])
+    df2 = pd.DataFrame(
+        data=[[10, 5], [20, 5], [10, 5]], columns=["A to B", "B to C"])
+
+    stacked = identify.stack_flow_data([df1, df2])
+    ranges = identify.significant_difference_ranges(
+        stacked, reference=0, neighs=False, flows=list(df1.columns))
+
+    assert list(ranges.itertuples(index=False, name=None)) == [
+        ("A to B", 1, 2)]
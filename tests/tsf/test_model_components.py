@@ -0,0 +1,86 @@
+import pickle
+
+import numpy as np
+import pytest
+
+import tessif.frused.namedtuples as nts
+from tessif.model import components
+
+
+def test_default_mappings_are_shared_among_components():
+    """Test equal parameter mappings to be interned across components."""
+    source_1 = components.Source(name='source 1', outputs=('fuel',))
+    source_2 = components.Source(name='source 2', outputs=('fuel',))
+    source_3 = components.Source(
+        name='source 3', outputs=('fuel',), flow_costs={'fuel': 1})
+
+    assert source_1.flow_rates is source_2.flow_rates
+    assert source_1.expansion_limits is source_2.expansion_limits
+    assert source_1.flow_costs is not source_3.flow_costs
+    assert source_3.flow_costs == {'fuel': 1}
+
+    # equal but differently typed values are not merged
+    source_4 = components.Source(
+        name='source 4', outputs=('fuel',), flow_costs={'fuel': 1.0})
+    assert isinstance(source_4.flow_costs['fuel'], float)
+
+
+def test_components_are_immutable():
+    """Test components and their mappings to refuse modification."""
+    sink = components.Sink(name='sink', inputs=('electricity',))
+
+    assert not hasattr(sink, '__dict__')
+
+    with pytest.raises(AttributeError):
+        sink.flow_costs = {'electricity': 1}
+
+    with pytest.raises(TypeError):
+        sink.flow_costs['electricity'] = 1
+
+    modified = components.Sink.from_attributes(
+        {**sink.attributes, 'name': 'sink', 'flow_costs': {'electricity': 1}})
+    assert modified.flow_costs == {'electricity': 1}
+
+
+def test_abstract_component_is_not_instantiable():
+    """Test components to require their parameters and defaults."""
+    with pytest.raises(TypeError):
+        components.AbstractEsComponent(name='component')
+
+
+def test_components_survive_pickling():
+    """Test slotted components to be restored with identical attributes."""
+    storage = components.Storage(
+        name='storage', input='electricity', output='electricity',
+        capacity=10, flow_rates={'electricity': (0, 5)})
+
+    restored = pickle.loads(pickle.dumps(storage))
+
+    assert repr(restored) == repr(storage)
+    with pytest.raises(TypeError):
+        restored.flow_rates['electricity'] = (0, 10)
+
+
+def test_equal_timeseries_are_shared_read_only_arrays():
+    """Test timeseries to be deduplicated float arrays, shared on duplicate."""
+    source_1 = components.Source(
+        name='source 1', outputs=('electricity',),
+        timeseries={'electricity': (0, [10, 22, 22])})
+    source_2 = components.Source(
+        name='source 2', outputs=('electricity',),
+        timeseries={'electricity': nts.MinMax(0, np.array([10., 22., 22.]))})
+
+    profile = source_1.timeseries['electricity'].max
+    assert profile.dtype == np.float64
+    assert not profile.flags.writeable
+    assert source_2.timeseries['electricity'].max is profile
+    assert source_1.timeseries['electricity'].min == 0
+
+    with pytest.raises(ValueError):
+        profile[0] = 5
+
+    duplicate = source_1.duplicate()
+    assert duplicate.timeseries is source_1.timeseries
+
+    restored = pickle.loads(pickle.dumps(source_1))
+    assert restored.timeseries['electricity'].max is profile
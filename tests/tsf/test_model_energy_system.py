@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+import tessif.examples.data.tsf.py_hard as tsf_examples
+from tessif.model import energy_system
+from tessif.model.energy_system import AbstractEnergySystem
+
+
+def test_shared_memory_energy_systems_view_the_shared_block():
+    """Test rehydrated timeseries to be read only views on shared memory."""
+    es = tsf_examples.create_fpwe()
+    block, shared = es.to_shared_memory()
+
+    try:
+        shared_es = AbstractEnergySystem.from_shared_memory(shared)
+        assert [node.uid for node in shared_es.nodes] == [
+            node.uid for node in es.nodes]
+        assert shared_es.timeframe.equals(es.timeframe)
+
+        solar_panel, = [
+            node for node in shared_es.sources
+            if node.uid.name == 'Solar Panel']
+        profile = solar_panel.timeseries['electricity'].max
+        np.testing.assert_array_equal(profile, [12, 3, 7])
+
+        with pytest.raises(ValueError):
+            profile[0] = 5
+
+        # changing the block is visible to the rehydrated energy system
+        offset, dtype, shape = next(
+            descriptor for descriptor in shared.arrays
+            if descriptor[1] == profile.dtype.str
+            and descriptor[2] == profile.shape)
+        np.ndarray(shape, dtype=dtype, buffer=block.buf,
+                   offset=offset)[0] = 5
+        assert profile[0] == 5
+
+        del shared_es, solar_panel, profile
+    finally:
+        block.close()
+        block.unlink()
+
+
+def test_shared_memory_blocks_are_detached_once_closed():
+    """Test closing shared memory to detach only once it is unused."""
+    es = tsf_examples.create_fpwe()
+    block, shared = es.to_shared_memory()
+
+    try:
+        shared_es = AbstractEnergySystem.from_shared_memory(shared)
+        assert shared.name in energy_system._attached_shared_memory
+
+        # rehydrated energy systems still view the block
+        with pytest.raises(BufferError):
+            AbstractEnergySystem.close_shared_memory(shared)
+        assert shared.name in energy_system._attached_shared_memory
+
+        del shared_es
+        AbstractEnergySystem.close_shared_memory(shared)
+        assert shared.name not in energy_system._attached_shared_memory
+
+        # closing again does nothing
+        AbstractEnergySystem.close_shared_memory(shared)
+    finally:
+        block.close()
+        block.unlink()
@@ -1,10 +1,19 @@
 import unittest
+from unittest import mock
+import importlib.util
 import os
+import sys
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
 from tessif.frused.paths import example_dir
 from tessif import parse
 import collections
 import tessif.frused.configurations as configurations
 from tessif.examples.data.tsf.py_mapping import fpwe as fpwe
+import tessif.examples.data.tsf.py_hard as tsf_examples
+from tessif.model.energy_system import AbstractEnergySystem
 
 
 class TestTessifsParsing(unittest.TestCase):
@@ -32,6 +41,60 @@ class TestTessifsParsing(unittest.TestCase):
             list(parse.reorder_esm(esm).keys()),
             ['bus', 'sink', 'source', 'storage', 'transformer', 'timeframe'])
 
+    def test_flat_config_cache(self):
+        configurations.spellings_logging_level = 'debug'
+        with tempfile.TemporaryDirectory() as tempdir:
+            folder = os.path.join(tempdir, 'basic')
+            shutil.copytree(
+                os.path.join(example_dir, 'data', 'tsf', 'cfg', 'flat',
+                             'basic'), folder)
+            uncached = parse.flat_config_folder(folder, cache=False)
+
+            with mock.patch.object(
+                    parse, '_parse_config_file',
+                    wraps=parse._parse_config_file) as parser:
+                parse.flat_config_folder(folder, sidecar=True)
+                first_calls = parser.call_count
+
+                # unchanged files are taken from the cache
+                parse.flat_config_folder(folder, sidecar=True)
+                self.assertEqual(parser.call_count, first_calls)
+
+                # modified ones are parsed again
+                sinks = os.path.join(folder, 'sinks.cfg')
+                status = os.stat(sinks)
+                os.utime(sinks, ns=(status.st_atime_ns,
+                                    status.st_mtime_ns + 10**9))
+                cached = parse.flat_config_folder(folder, sidecar=True)
+                self.assertEqual(parser.call_count, first_calls + 1)
+
+                # the sidecar outlives the in memory cache
+                parse._flat_config_cache.clear()
+                persisted = parse.flat_config_folder(folder, sidecar=True)
+                self.assertEqual(parser.call_count, first_calls + 1)
+
+            self.assertTrue(
+                os.path.isfile(os.path.join(folder, '.parse_cache.npz')))
+            self.assertEqual(repr(persisted), repr(cached))
+            self.assertEqual(list(cached.keys()), list(uncached.keys()))
+            for key in uncached:
+                self.assertEqual(repr(dict(cached[key])),
+                                 repr(dict(uncached[key])))
+
+    def test_flat_config_cache_is_bounded(self):
+        folder = os.path.join(example_dir, 'data', 'tsf', 'cfg', 'flat',
+                              'basic')
+        with mock.patch.object(parse, '_flat_config_cache_size', 2):
+            parse._flat_config_cache.clear()
+            parse.flat_config_folder(folder)
+            self.assertEqual(len(parse._flat_config_cache), 2)
+
+    def test_parquet_requires_pyarrow(self):
+        with mock.patch.dict(
+                sys.modules, {'pyarrow': None, 'pyarrow.parquet': None}):
+            with self.assertRaisesRegex(ImportError, r'tessif-phd\[parquet\]'):
+                parse.parquet(example_dir)
+
     def test_xllike(self):
         omf_esm = parse.xl_like(
             io=os.path.join(example_dir, 'data', 'omf', 'xlsx',
@@ -124,6 +187,108 @@ class TestTessifsParsing(unittest.TestCase):
             list(parse.reorder_esm(esm).keys()),
             ['bus', 'sink', 'source', 'storage', 'transformer', 'timeframe'])
 
+    def test_xml_binary_timeseries(self):
+        configurations.spellings_logging_level = 'debug'
+        es = tsf_examples.create_fpwe()
+
+        for timeseries in ('base64', 'npy'):
+            with tempfile.TemporaryDirectory() as folder:
+                es.to_xml(folder, 'fpwe.xml', timeseries=timeseries)
+                esm = parse.xml(os.path.join(folder, 'fpwe.xml'))
+
+                # timeseries are parsed from their binary representation
+                sources = esm['source'].set_index('name')
+                minimum, maximum = sources.loc[
+                    'Solar Panel', 'timeseries']['electricity']
+                np.testing.assert_array_equal(maximum, [12, 3, 7])
+
+                parsed_es = AbstractEnergySystem.from_external(
+                    path=os.path.join(folder, 'fpwe.xml'), parser=parse.xml)
+                self.assertTrue(parsed_es.timeframe.equals(es.timeframe))
+                self.assertEqual(
+                    [node.uid for node in parsed_es.nodes],
+                    [node.uid for node in es.nodes])
+                for parameter in ('status_inertia', 'status_changing_costs',
+                                  'number_of_status_changes'):
+                    self.assertEqual(
+                        [getattr(node, parameter, None)
+                         for node in parsed_es.nodes],
+                        [getattr(node, parameter, None) for node in es.nodes])
+
+                parsed_panel, = [
+                    source for source in parsed_es.sources
+                    if source.uid.name == 'Solar Panel']
+                np.testing.assert_array_equal(
+                    parsed_panel.timeseries['electricity'].max, [12, 3, 7])
+
+                # rows of npy files are copied instead of kept mapped
+                self.assertNotIsInstance(maximum, np.memmap)
+
+    def test_xml_timeframe_without_freq(self):
+        configurations.spellings_logging_level = 'debug'
+        es = tsf_examples.create_fpwe()
+        es = AbstractEnergySystem(
+            uid=es.uid, busses=es.busses, sinks=es.sinks, sources=es.sources,
+            transformers=es.transformers, storages=es.storages,
+            timeframe=pd.DatetimeIndex(list(es.timeframe)),
+            global_constraints=es.global_constraints)
+        self.assertIsNone(es.timeframe.freq)
+
+        with tempfile.TemporaryDirectory() as folder:
+            es.to_xml(folder, 'fpwe.xml')
+            parsed_es = AbstractEnergySystem.from_external(
+                path=os.path.join(folder, 'fpwe.xml'), parser=parse.xml)
+        self.assertTrue(parsed_es.timeframe.equals(es.timeframe))
+
+    def test_xml_missing_timeseries_bound(self):
+        configurations.spellings_logging_level = 'debug'
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'source.xml')
+            with open(path, 'w') as xml_file:
+                xml_file.write(
+                    '<energy_system><source>'
+                    '<source_0 name="&apos;Panel&apos;"'
+                    ' outputs="(&apos;power&apos;,)">'
+                    '<timeseries interface="power">'
+                    '<max value="[1.0, 2.0]"/>'
+                    '</timeseries></source_0></source></energy_system>')
+            esm = parse.xml(path)
+
+        sources = esm['source'].set_index('name')
+        minimum, maximum = sources.loc['Panel', 'timeseries']['power']
+        self.assertEqual(minimum, 0)
+        self.assertEqual(maximum, [1.0, 2.0])
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'),
+                         'requires pyarrow')
+    def test_parquet_projection(self):
+        configurations.spellings_logging_level = 'debug'
+        es = tsf_examples.create_fpwe()
+
+        with tempfile.TemporaryDirectory() as folder:
+            es.to_parquet(folder)
+
+            parsed_es = AbstractEnergySystem.from_external(
+                path=folder, parser=parse.parquet)
+            self.assertTrue(parsed_es.timeframe.equals(es.timeframe))
+            self.assertEqual(parsed_es.global_constraints,
+                             es.global_constraints)
+            self.assertEqual(
+                [node.uid for node in parsed_es.nodes],
+                [node.uid for node in es.nodes])
+
+            # read in only the sources' timeseries
+            esm = parse.parquet(
+                folder, components=['source'], parameters=['timeseries'])
+            self.assertEqual(
+                list(esm.keys()),
+                ['source', 'timeframe', 'global_constraints'])
+            self.assertEqual(
+                list(esm['source'].columns), ['name', 'timeseries'])
+            minimum, maximum = esm['source'].loc[
+                'Solar Panel', 'timeseries']['electricity']
+            np.testing.assert_array_equal(maximum, [12, 3, 7])
+
 
 if __name__ == '__main__':
     unittest.main()
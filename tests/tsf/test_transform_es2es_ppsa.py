@@ -0,0 +1,27 @@
+import pandas as pd
+
+import tessif.examples.data.tsf.py_hard as tsf_examples
+from tessif.transform.es2es import ppsa
+
+
+def test_unneeded_supply_chains_of_self_similar_units():
+    """Test each generator to only remove its own supply chain."""
+    es = tsf_examples.create_self_similar_energy_system(
+        N=3, timeframe=pd.date_range('2019-01-01', periods=2, freq='H'),
+        unit='minimal', seed=1)
+    generators = ppsa.infer_pypsa_transformer_types(
+        es.transformers)['generators']
+
+    chains = ppsa.compute_unneeded_supply_chains(es, generators)
+
+    assert chains['Bus'] == ['Fuel Line 0', 'Fuel Line 1', 'Fuel Line 2']
+    assert chains['Generator'] == [
+        'Non Renewable Source 0', 'Non Renewable Source 1',
+        'Non Renewable Source 2']
+    assert {
+        str(generator): [str(comp.uid) for comp in chain]
+        for generator, chain in chains['supply_chains'].items()
+    } == {
+        f'Power Generator {n}': [f'Fuel Line {n}', f'Non Renewable Source {n}']
+        for n in range(3)
+    }
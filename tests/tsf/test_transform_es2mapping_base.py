@@ -0,0 +1,445 @@
+import ast
+import gc
+import sys
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import tessif.frused.namedtuples as nts
+from tessif.transform import es2mapping
+from tessif.transform.es2mapping import base
+
+
+class OptimizedEnergySystem:
+    """Minimal stand in for a model specific, optimized energy system."""
+
+    def __init__(self):
+        self.calls = []
+
+
+class CountingStorageResultier(base.StorageResultier):
+    """Storage resultier recording each mapping it actually computes."""
+
+    def _map_nodes(self, optimized_es):
+        optimized_es.calls.append('nodes')
+        return ['Storage']
+
+    def _map_node_uids(self, optimized_es):
+        optimized_es.calls.append('uids')
+        return {'Storage': nts.Uid('Storage')}
+
+    def _map_edges(self, optimized_es):
+        optimized_es.calls.append('edges')
+        return []
+
+    def _map_states_of_charge(self, optimized_es):
+        optimized_es.calls.append('socs')
+        return {'Storage': pd.Series([1.0, 2.0])}
+
+
+def test_resultiers_share_mapped_results_per_energy_system():
+    """Test each mapping to run once per optimized energy system."""
+    optimized_es = OptimizedEnergySystem()
+
+    first = CountingStorageResultier(optimized_es)
+    second = CountingStorageResultier(optimized_es)
+
+    assert optimized_es.calls == ['nodes', 'uids', 'edges', 'socs']
+    assert second.node_soc is first.node_soc
+
+    # other energy systems get their own results
+    other_es = OptimizedEnergySystem()
+    CountingStorageResultier(other_es)
+    assert other_es.calls == ['nodes', 'uids', 'edges', 'socs']
+
+    # dropping the context maps the results again
+    base.drop_result_context(optimized_es)
+    CountingStorageResultier(optimized_es)
+    assert len(optimized_es.calls) == 8
+
+    # contexts don't outlive their energy systems
+    contexts = len(base._result_contexts)
+    del optimized_es, first, second
+    gc.collect()
+    assert len(base._result_contexts) == contexts - 1
+
+
+class LazyXmplResultier(base.XmplResultier):
+    """Exemplary resultier counting the evaluations of its attributes."""
+
+    evaluations = []
+
+    @property
+    def node_expensive(self):
+        self.evaluations.append('node_expensive')
+        return 42
+
+    @property
+    def edge_expensive(self):
+        self.evaluations.append('edge_expensive')
+        return {}
+
+    @property
+    def unrelated(self):
+        self.evaluations.append('unrelated')
+
+
+def test_node_and_edge_data_compute_requested_attributes_once():
+    """Test registered attributes to be computed lazily and only once."""
+    assert LazyXmplResultier._node_attribute_names == (
+        'node_attr_xmpl', 'node_expensive')
+    assert LazyXmplResultier._edge_attribute_names == (
+        'edge_attr_xmpl', 'edge_expensive')
+
+    resultier = LazyXmplResultier()
+
+    assert resultier.node_data(['node_attr_xmpl']) == {
+        'node_attr_xmpl': 'red'}
+    assert resultier.evaluations == []
+
+    assert resultier.node_data() == {
+        'node_attr_xmpl': 'red', 'node_expensive': 42}
+    assert resultier.node_data()['node_expensive'] == 42
+    assert resultier.evaluations == ['node_expensive']
+
+    edge_data = resultier.edge_data()
+    assert resultier.edge_data()['edge_expensive'] is edge_data[
+        'edge_expensive']
+    assert resultier.evaluations == ['node_expensive', 'edge_expensive']
+
+
+class WindowedLoadResultier(base.LoadResultier):
+    """Load resultier of a source feeding a sink over a power line."""
+
+    def _map_nodes(self, optimized_es):
+        return ['Source', 'Power Line', 'Sink']
+
+    def _map_node_uids(self, optimized_es):
+        return {
+            'Source': nts.Uid('Source', component='source'),
+            'Power Line': nts.Uid('Power Line', component='bus'),
+            'Sink': nts.Uid('Sink', component='sink'),
+        }
+
+    def _map_edges(self, optimized_es):
+        return [nts.Edge('Source', 'Power Line'),
+                nts.Edge('Power Line', 'Sink')]
+
+    def _map_loads(self, optimized_es):
+        timeframe = pd.date_range('2022-01-01', periods=4, freq='H')
+        flows = {
+            'Source': {'Power Line': [1.0, 2.0, 3.0, 4.0]},
+            'Power Line': {'Source': [-1.0, -2.0, -3.0, -4.0],
+                           'Sink': [1.0, 2.0, 3.0, 4.0]},
+            'Sink': {'Power Line': [-1.0, -2.0, -3.0, -4.0]},
+        }
+
+        loads = dict()
+        for node, columns in flows.items():
+            if not self._selects(node):
+                continue
+
+            optimized_es.calls.append(node)
+            loads[node] = self._sliced(
+                pd.DataFrame(columns, index=timeframe))
+
+        return loads
+
+
+def test_resultiers_map_selected_nodes_and_time_window_only():
+    """Test node and time window selections to restrict the mapped loads."""
+    optimized_es = OptimizedEnergySystem()
+
+    resultier = WindowedLoadResultier(
+        optimized_es, nodes=['Sink'],
+        timeslice=('2022-01-01 01:00', '2022-01-01 02:00'))
+
+    assert optimized_es.calls == ['Sink']
+    assert list(resultier.node_load) == ['Sink']
+    assert list(resultier.node_summed_loads['Sink']) == [2.0, 3.0]
+    assert resultier.nodes == ['Source', 'Power Line', 'Sink']
+
+    # selections don't leak into resultiers mapping everything
+    complete = WindowedLoadResultier(optimized_es)
+    assert list(complete.node_load) == ['Source', 'Power Line', 'Sink']
+    assert len(complete.node_summed_loads['Sink']) == 4
+    assert optimized_es.calls == ['Sink', 'Source', 'Power Line', 'Sink']
+
+
+def test_compact_load_storage_preserves_signed_zeros():
+    """Test float32 and sparse load storage to keep in- and outflow signs."""
+    optimized_es = OptimizedEnergySystem()
+    resultier = WindowedLoadResultier(
+        optimized_es, dtype='float32', sparse=True)
+
+    load = pd.DataFrame({
+        'Idle Source': [-0.0, -0.0, -0.0, -1.0],
+        'Busy Source': [-1.0, -2.0, -0.0, -1.0],
+        'Idle Sink': [0.0, 0.0, 0.0, 0.0],
+    })
+    stored = resultier._stored(load)
+
+    assert list(stored.dtypes) == [
+        pd.SparseDtype('float32', -0.0), 'float32',
+        pd.SparseDtype('float32', 0.0)]
+    for column in load.columns:
+        assert list(np.signbit(stored[column].to_numpy())) == list(
+            np.signbit(load[column].to_numpy()))
+
+    # mapped loads are stored alike and compare equal to the dense ones
+    dense = WindowedLoadResultier(optimized_es)
+    for node, load in resultier.node_load.items():
+        assert set(load.dtypes) == {np.dtype('float32')}
+        assert load.astype('float64').equals(dense.node_load[node])
+
+
+class CapacityResultier(base.CapacityResultier, WindowedLoadResultier):
+    """Capacity resultier of the source feeding a sink over a power line."""
+
+    def _map_installed_capacities(self, optimized_es):
+        return {'Source': 10.0, 'Power Line': None, 'Sink': 4.0}
+
+    def _map_original_capacities(self, optimized_es):
+        return self._map_installed_capacities(optimized_es)
+
+    def _map_expansion_costs(self, optimized_es):
+        return {'Source': 0, 'Power Line': None, 'Sink': 0}
+
+    def _map_characteristic_values(self, optimized_es):
+        return {'Source': .25, 'Power Line': None, 'Sink': .625}
+
+
+class FlowResultier(base.FlowResultier, WindowedLoadResultier):
+    """Flow resultier of the source feeding a sink over a power line."""
+
+    def _map_specific_flow_costs(self, optimized_es):
+        return {edge: 1.0 for edge in self.edges}
+
+    def _map_specific_emissions(self, optimized_es):
+        return {edge: .5 for edge in self.edges}
+
+
+class AllResultier(CapacityResultier, FlowResultier):
+    """Resultier mapping the capacity and flow results."""
+
+
+class NodeFormatier(base.NodeFormatier, CapacityResultier):
+    """Node formatier of the source feeding a sink over a power line."""
+
+
+class EdgeFormatier(base.EdgeFormatier, FlowResultier):
+    """Edge formatier of the source feeding a sink over a power line."""
+
+
+def test_formatiers_attach_to_existing_resultiers():
+    """Test attached formatiers to format without mapping results again."""
+    optimized_es = OptimizedEnergySystem()
+    resultier = AllResultier(optimized_es)
+    base.drop_result_context(optimized_es)
+    optimized_es.calls.clear()
+
+    formatier = NodeFormatier.from_resultier(resultier, drawutil='dc')
+    assert optimized_es.calls == []
+
+    created = NodeFormatier(optimized_es, drawutil='dc')
+    assert formatier.node_shape == created.node_shape
+    assert formatier.node_fill_size == created.node_fill_size
+
+    # re-styling reuses the formatted results
+    restyled = NodeFormatier.from_resultier(formatier, cgrp='carrier')
+    formatted = len(resultier._formatting_cache)
+    assert NodeFormatier.from_resultier(
+        restyled, drawutil='dc').node_size == formatier.node_size
+    assert len(resultier._formatting_cache) == formatted
+    assert set(restyled.node_color) == {'Source', 'Power Line', 'Sink'}
+
+    # each formatier changes its own copy of the shared results
+    before = NodeFormatier.from_resultier(resultier, drawutil='dc')
+    formatier.node_size['Sink'] *= 2
+    after = NodeFormatier.from_resultier(resultier, drawutil='dc')
+    assert before.node_size == after.node_size == created.node_size
+    assert formatier.node_size != created.node_size
+
+    with pytest.raises(TypeError, match='cgrpp'):
+        NodeFormatier.from_resultier(resultier, cgrpp='carrier')
+
+    edge_formatier = EdgeFormatier.from_resultier(resultier)
+    assert edge_formatier.edge_width == EdgeFormatier(
+        optimized_es).edge_width
+
+    with pytest.raises(TypeError):
+        EdgeFormatier.from_resultier(formatier)
+
+
+class StorageFreeAllResultier(AllResultier, base.StorageResultier):
+    """All resultier of an energy system without storages."""
+
+    def _map_states_of_charge(self, optimized_es):
+        return {}
+
+
+def test_flow_results_of_selected_sources_are_mapped_from_outflows():
+    """Test selecting only a source to map the edges leaving it."""
+    resultier = FlowResultier(OptimizedEnergySystem(), nodes=['Source'])
+
+    edge = nts.Edge('Source', 'Power Line')
+    assert resultier.edge_net_energy_flow == {edge: 10.0}
+    assert resultier.edge_total_costs_incurred == {edge: 10.0}
+    assert resultier.edge_total_emissions_caused == {edge: 5.0}
+    assert resultier.edge_reference_net_energy_flow == 10.0
+
+    # selecting nothing maps no flows at all
+    resultier = FlowResultier(OptimizedEnergySystem(), nodes=[])
+    assert resultier.edge_net_energy_flow == {}
+    assert resultier.edge_reference_net_energy_flow == 0
+
+
+def test_result_data_representations_are_compiled_in_batch(
+        monkeypatch, tmp_path):
+    """Test batch compiled representations to match the single ones."""
+    pq = pytest.importorskip('pyarrow.parquet')
+    module = types.ModuleType('tessif.transform.es2mapping.xmpl')
+    module.AllResultier = StorageFreeAllResultier
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    optimized_es = OptimizedEnergySystem()
+
+    representations = es2mapping.compile_result_data_representations(
+        {'xmpl': optimized_es}, nodes=['Sink', 'Source', 'Unknown'],
+        directory=tmp_path)
+
+    assert list(representations['Node'].unique()) == ['Sink', 'Source']
+    for node, representation in representations.groupby('Node'):
+        single = es2mapping.compile_result_data_representation(
+            optimized_es, 'xmpl', node)
+        assert list(representation['Label']) == list(single.index)
+        assert list(representation['Value']) == list(single['Value'])
+
+    loads = pq.read_table(
+        tmp_path / 'result_data_representations.parquet',
+        filters=[('Label', '=', 'load'), ('Node', '=', 'Source')])
+    assert [ast.literal_eval(value) for value in loads['Value'].to_pylist()
+            ] == [{'Power Line': (1.0, 2.0, 3.0, 4.0)}]
+
+
+class ReoptimizedResultier(AllResultier):
+    """All resultier of an energy system whose demand is scaled."""
+
+    def _map_nodes(self, optimized_es):
+        return super()._map_nodes(optimized_es) + getattr(
+            optimized_es, 'added_nodes', [])
+
+    def _map_loads(self, optimized_es):
+        loads = super()._map_loads(optimized_es)
+        loads['Sink'] = loads['Sink'] * getattr(optimized_es, 'scale', 1)
+        return loads
+
+
+def test_resultiers_update_changed_loads_only():
+    """Test updated resultiers to remap only the loads that changed."""
+    resultier = ReoptimizedResultier(OptimizedEnergySystem(), dtype='float32')
+    source_load = resultier.node_load['Source']
+    source_inflows = resultier.node_inflows['Source']
+
+    reoptimized_es = OptimizedEnergySystem()
+    reoptimized_es.scale = 2
+    assert resultier.update(reoptimized_es) == {'Sink'}
+
+    assert resultier.node_load['Source'].equals(source_load)
+    assert resultier.node_inflows['Source'] is source_inflows
+    assert list(resultier.node_summed_loads['Sink']) == [2.0, 4.0, 6.0, 8.0]
+
+    # updated results equal the ones mapped from scratch
+    created = ReoptimizedResultier(reoptimized_es, dtype='float32')
+    for node in created.nodes:
+        assert created.node_load[node].equals(resultier.node_load[node])
+    assert created.edge_net_energy_flow == resultier.edge_net_energy_flow
+    assert (created.node_characteristic_value ==
+            resultier.node_characteristic_value)
+
+    # changes within the tolerances are ignored
+    similar_es = OptimizedEnergySystem()
+    similar_es.scale = 2.000001
+    assert resultier.update(similar_es, rtol=1e-3) == set()
+
+    extended_es = OptimizedEnergySystem()
+    extended_es.added_nodes = ['Battery']
+    with pytest.raises(ValueError):
+        resultier.update(extended_es)
+
+
+def test_chunked_results_aggregate_like_the_whole_timeframe():
+    """Test window wise mapped loads to aggregate to the complete ones."""
+    optimized_es = OptimizedEnergySystem()
+    timeframe = pd.date_range('2022-01-01', periods=4, freq='H')
+
+    aggregator = base.LoadAggregator()
+    windows = list()
+    for resultier in AllResultier.chunked(optimized_es, timeframe, periods=3):
+        windows.append(len(resultier.node_load['Sink']))
+        aggregator.add(resultier)
+
+    assert windows == [3, 1]
+    # window results don't pile up in the result context
+    assert len(base.result_context(optimized_es)) == 3
+
+    complete = AllResultier(optimized_es)
+    for node, load in complete.node_load.items():
+        assert aggregator.sums[node].equals(load.sum())
+        assert aggregator.maxima[node].equals(load.max())
+        assert aggregator.means[node].equals(load.mean())
+    assert aggregator.characteristic_values(
+        complete.node_installed_capacity) == (
+            complete.node_characteristic_value)
+
+
+def test_chunked_results_map_the_model_loads_once():
+    """Test windows to be cut out of loads mapped once, however many."""
+    timeframe = pd.date_range('2022-01-01', periods=4, freq='H')
+
+    for periods in (4, 2, 1):
+        optimized_es = OptimizedEnergySystem()
+        loads = [resultier.node_load['Sink'] for resultier in
+                 WindowedLoadResultier.chunked(
+                     optimized_es, timeframe, periods=periods)]
+
+        assert optimized_es.calls == ['Source', 'Power Line', 'Sink']
+        assert len(loads) == 4 // periods
+        assert pd.concat(loads).equals(
+            WindowedLoadResultier(optimized_es).node_load['Sink'])
+
+
+def test_aggregated_loads_match_duplicate_labels_by_order():
+    """Test aggregates of duplicate and changing columns to stay apart."""
+    aggregator = base.LoadAggregator()
+    for load in (
+            pd.DataFrame([[-1.0, 2.0]], columns=['Power Line', 'Power Line']),
+            pd.DataFrame([[-3.0, 4.0, 5.0]],
+                         columns=['Power Line', 'Power Line', 'Heat']),
+            pd.DataFrame([[-2.0]], columns=['Power Line'])):
+        aggregator.add(types.SimpleNamespace(
+            node_load={'Storage': load}, node_summed_loads={}))
+
+    assert list(aggregator.sums['Storage'].index) == [
+        'Power Line', 'Power Line', 'Heat']
+    assert list(aggregator.sums['Storage']) == [-6.0, 6.0, 5.0]
+    assert list(aggregator.maxima['Storage']) == [-1.0, 4.0, 5.0]
+    assert list(aggregator.minima['Storage']) == [-3.0, 2.0, 5.0]
+    assert list(aggregator.means['Storage']) == [-2.0, 2.0, 5 / 3]
+
+
+def test_loads_of_duplicate_labels_are_compiled_per_column():
+    """Test loads with duplicate column labels to keep all their columns."""
+    load = pd.DataFrame(
+        [[-0.703, 0.0, 0.5], [0.0, 0.2, 0.0]],
+        columns=['Powerline', 'Powerline', 'Demand'])
+    resultier = types.SimpleNamespace(node_load={'Storage': load})
+
+    compiled = es2mapping._compile_node_from_res(
+        resultier, 'node_load', 'Storage')
+
+    assert compiled == {
+        'Powerline': [[-0.703, 0.0], [0.0, 0.2]],
+        'Demand': [0.5, 0.0],
+    }
@@ -0,0 +1,28 @@
+import numpy as np
+
+from tessif.transform.es2mapping import cllp
+
+
+def test_transmission_rows_of_calliope_connections():
+    """Test transmission results to be found by producer and consumer."""
+    loc_tech_carriers = np.array([
+        'Gas Station location::Gas Station::fuel',
+        'Pipeline::transmission:Gas Station location::fuel',
+        'Power Line::transmission:Pipeline::electricity',
+        'Connector reverse::transmission:Power Line::electricity',
+        'Power Line::transmission:Connector reverse::electricity',
+        'Power Line::transmission:Pipeline::heat',
+    ], dtype=object)
+
+    rows = cllp.LoadResultier._map_transmission_rows(loc_tech_carriers)
+
+    assert rows == {
+        # location and reverse suffixes are mapped with and without them
+        ('Gas Station location', 'Pipeline'): [1],
+        ('Gas Station', 'Pipeline'): [1],
+        ('Pipeline', 'Power Line'): [2, 5],
+        ('Power Line', 'Connector reverse'): [3],
+        ('Power Line', 'Connector'): [3],
+        ('Connector reverse', 'Power Line'): [4],
+        ('Connector', 'Power Line'): [4],
+    }
@@ -0,0 +1,45 @@
+import pandas as pd
+import pytest
+
+from tessif.frused import configurations
+import tessif.transform.mapping2es.tsf as ttsf
+
+
+@pytest.fixture(autouse=True)
+def debug_spellings_logging(monkeypatch):
+    """Log spelling lookups on debug level for the duration of each test."""
+    monkeypatch.setattr(configurations, 'spellings_logging_level', 'debug')
+
+
+def test_generate_sinks_respects_active_switch_and_spellings():
+    """Test columnar parsing to resolve spellings and skip inactive rows."""
+    sinks = pd.DataFrame({
+        'label': ['Demand 1', 'Demand 2', 'Demand 3'],
+        'inputs': [('electricity',), ('heat',), ('electricity',)],
+        'flow_costs': [{'electricity': 1}, {'heat': 2}, {'electricity': 3}],
+        'active': [1, 0, True],
+    })
+
+    generated = list(ttsf._generate_sinks({'sinks': sinks}))
+
+    assert [sink.uid.name for sink in generated] == ['Demand 1', 'Demand 3']
+    assert [sink.flow_costs for sink in generated] == [
+        {'electricity': 1}, {'electricity': 3}]
+
+
+def test_generate_transformers_fills_interface_dependent_defaults():
+    """Test per column defaults to match each component's interfaces."""
+    transformers = pd.DataFrame({
+        'name': ['Generator', 'Boiler'],
+        'inputs': [('fuel',), ('gas',)],
+        'outputs': [('electricity',), ('heat',)],
+        'conversions': [
+            {('fuel', 'electricity'): 0.42}, {('gas', 'heat'): 0.9}],
+    })
+
+    generator, boiler = ttsf._generate_transformers(
+        {'transformers': transformers})
+
+    assert set(generator.flow_rates) == {'fuel', 'electricity'}
+    assert set(boiler.expansion_limits) == {'gas', 'heat'}
+    assert generator.conversions == {('fuel', 'electricity'): 0.42}
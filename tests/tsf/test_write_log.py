@@ -0,0 +1,41 @@
+from tessif.write import log
+
+
+def _called_after_inner_profile():
+    return sum(range(10))
+
+
+def _profiled_names(stats):
+    return {funcname for _, _, funcname in stats.stats}
+
+
+def test_nested_profiles_keep_profiling_the_outer_call(tmp_path):
+    """Test inner profiles to neither end the outer one nor start more."""
+    @log.profiling_logged(directory=tmp_path)
+    def decorated():
+        return 42
+
+    def outer():
+        _, inner_stats = log.run_profiled(sum, range(10))
+        assert log._active_profilers
+        assert decorated() == 42
+        return _called_after_inner_profile()
+
+    result, stats = log.run_profiled(outer)
+
+    assert result == 45
+    assert not log._active_profilers
+    assert '_called_after_inner_profile' in _profiled_names(stats)
+    # the decorated call is part of the outer profile
+    assert not list(tmp_path.iterdir())
+
+
+def test_reentrant_calls_are_profiled_once(tmp_path):
+    """Test recursive calls of profiled callables to dump a single profile."""
+    @log.profiling_logged(directory=tmp_path, label='factorial')
+    def factorial(n):
+        return 1 if n <= 1 else n * factorial(n - 1)
+
+    assert factorial(5) == 120
+    assert not log._active_profilers
+    assert len(list(tmp_path.glob('factorial*.pstats'))) == 1